@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Compare per-line code paragraphs with the bulk code-block mode.
+
+Reports paragraph count, document.xml size, docx size and build time for
+both modes.
+
+Usage: python benchmarks/bench_code_blocks.py [repeats]
+"""
+
+import io
+import os
+import statistics
+import sys
+import time
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate_cka_doc  # noqa: E402
+
+
+def measure(bulk_code, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        builder = generate_cka_doc.build(generate_cka_doc.DocumentBuilder(bulk_code=bulk_code))
+        stream = io.BytesIO()
+        builder.save(stream)
+        timings.append(time.perf_counter() - start)
+    with zipfile.ZipFile(stream) as zf:
+        document_xml = zf.getinfo('word/document.xml').file_size
+    return {
+        'paragraphs': len(builder.doc.paragraphs),
+        'document.xml': document_xml,
+        'docx': stream.tell(),
+        'build': statistics.median(timings),
+    }
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    before = measure(False, repeats)
+    after = measure(True, repeats)
+    print(f'{"":16}{"per-line":>12}{"bulk":>12}{"change":>10}')
+    for key, fmt in (('paragraphs', '{:>12,}'), ('document.xml', '{:>12,}'),
+                     ('docx', '{:>12,}'), ('build', '{:>11.3f}s')):
+        change = (after[key] - before[key]) / before[key] * 100
+        print(f'{key:16}' + fmt.format(before[key]) + fmt.format(after[key]) + f'{change:>+9.1f}%')
+
+
+if __name__ == '__main__':
+    main()
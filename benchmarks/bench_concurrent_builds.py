@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare N sequential script runs with N concurrent in-process builds.
+
+Both render every section from scratch. Diagram print variants, which
+``--no-cache`` still reuses, are made once up front in a temporary cache,
+so the working tree's cache is left alone.
+
+Usage: python benchmarks/bench_concurrent_builds.py [N]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'generate_cka_doc.py')
+sys.path.insert(0, ROOT)
+
+import generate_cka_doc  # noqa: E402
+
+
+def run_script(out, cache_dir):
+    subprocess.run([sys.executable, SCRIPT, out, '--no-cache', '--cache-dir', cache_dir],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def sequential_runs(n, tmp, cache_dir):
+    start = time.perf_counter()
+    for i in range(n):
+        run_script(os.path.join(tmp, f'sheet-{i}.docx'), cache_dir)
+    return time.perf_counter() - start
+
+
+def _build_one(_):
+    stream = io.BytesIO()
+    generate_cka_doc.build().save(stream)
+    return stream.tell()
+
+
+def concurrent_builds(n):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        sizes = list(pool.map(_build_one, range(n)))
+    elapsed = time.perf_counter() - start
+    # Every build owns its document, so all outputs must be identical in size.
+    assert len(set(sizes)) == 1, sizes
+    return elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'cache')
+        run_script(os.path.join(tmp, 'prime.docx'), cache_dir)
+        generate_cka_doc.DocumentBuilder.prepare_diagrams(generate_cka_doc.sections_for(), cache_dir)
+        seq = sequential_runs(n, tmp, cache_dir)
+    conc = concurrent_builds(n)
+    print(f'{n} sequential script runs : {seq:6.2f}s  ({seq / n:.2f}s per sheet)')
+    print(f'{n} concurrent builds      : {conc:6.2f}s  ({conc / n:.2f}s per sheet)')
+    print(f'speed-up                  : {seq / conc:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
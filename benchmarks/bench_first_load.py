@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Compare the first load of ``index.html`` whole and split into section fragments.
+
+Prepares the page as ``--site`` does (highlighted code, pre-rendered
+blocks) and reports, for the whole page and for the shell that loads
+sections on demand: bytes raw and gzipped, and parse time with Python's
+HTML parser as a stand-in for the browser's. The fragment sizes show
+what opening one section costs afterwards.
+
+Usage: python benchmarks/bench_first_load.py [repeats]
+"""
+
+import gzip
+import os
+import statistics
+import sys
+import time
+from html.parser import HTMLParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cka_blocks import prewrap_page, split_blocks  # noqa: E402
+from cka_highlight import highlight_page  # noqa: E402
+
+
+def parse_ms(page, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parser = HTMLParser()
+        parser.feed(page)
+        parser.close()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with open(os.path.join(ROOT, 'index.html'), encoding='utf-8') as f:
+        full = prewrap_page(highlight_page(f.read()))
+    shell, fragments = split_blocks(full)
+
+    print(f'{"":18}{"raw":>10}{"gzip":>10}{"parse":>10}')
+    for label, page in (('whole page', full), ('shell', shell)):
+        data = page.encode('utf-8')
+        print(f'{label:18}{len(data) / 1e3:>8.0f}KB{len(gzip.compress(data, 9)) / 1e3:>8.1f}KB'
+              f'{parse_ms(page, repeats):>8.1f}ms')
+    share = len(shell.encode('utf-8')) / len(full.encode('utf-8')) * 100
+    sizes = sorted(len(fragment.encode('utf-8')) for fragment in fragments.values())
+    print(f'shell is {share:.0f}% of the page; {len(fragments)} fragments, '
+          f'median {statistics.median(sizes) / 1e3:.0f} KB, largest {sizes[-1] / 1e3:.0f} KB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Measure build-time code highlighting of ``index.html``.
+
+Reports the number of code blocks, the build cost of highlighting them
+with an empty and with a warm snippet cache, and what the pre-rendered
+markup adds to the page (raw and gzipped). When ``node`` is on the PATH it
+also times the regex chain ``script.js`` ran on every block at load, which
+pre-rendered blocks now skip (DOM work comes on top of that in a browser).
+
+Usage: python benchmarks/bench_highlight.py [repeats]
+"""
+
+import gzip
+import html
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cka_highlight  # noqa: E402
+
+# The highlighting loop of script.js before build-time highlighting.
+_CLIENT = r"""
+const snippets = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const repeats = +process.argv[1];
+const kws = 'apiVersion|kind|metadata|spec|status|selector|containers|volumes|template|matchLabels|strategy|replicas|serviceAccountName|nodeSelector|tolerations|resources|requests|limits|livenessProbe|readinessProbe|securityContext|capabilities|env|envFrom|volumeMounts|image|name|kubectl|k'.split('|');
+const times = [];
+for (let r = 0; r < repeats; r++) {
+  const start = process.hrtime.bigint();
+  for (const text of snippets) {
+    let html = text;
+    html = html.replace(/(".*?")/g, '<span class="cs-str">$1</span>');
+    html = html.replace(/(^|\s)(#.*$)/gm, '$1<span class="cs-comment">$2</span>');
+    html = html.replace(/^(\s*)([\w\-\.\/]+):/gm, '$1<span class="cs-key">$2</span>:');
+    const kwRegex = new RegExp('\\b(' + kws.join('|') + ')\\b', 'g');
+    html = html.replace(kwRegex, '<span class="cs-kw">$1</span>');
+    html = html.replace(/(\s)(--[\w\-]+)/g, '$1<span class="cs-flag">$2</span>');
+    html = html.replace(/(^# ===.*===)/gm, '<span class="cs-section">$1</span>');
+  }
+  times.push(Number(process.hrtime.bigint() - start) / 1e6);
+}
+times.sort((a, b) => a - b);
+console.log(times[Math.floor(times.length / 2)]);
+"""
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with open(os.path.join(ROOT, 'index.html'), encoding='utf-8') as f:
+        page = f.read()
+    snippets = [html.unescape(match.group(3)) for match in cka_highlight._PRE.finditer(page)]
+
+    cold, warm = [], []
+    for _ in range(repeats):
+        cka_highlight._cache.clear()
+        start = time.perf_counter()
+        highlighted = cka_highlight.highlight_page(page)
+        cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        cka_highlight.highlight_page(page)
+        warm.append(time.perf_counter() - start)
+
+    before, after = page.encode('utf-8'), highlighted.encode('utf-8')
+    print(f'{len(snippets)} code blocks')
+    print(f'build: {statistics.median(cold) * 1000:.1f} ms cold, {statistics.median(warm) * 1000:.1f} ms cached')
+    print(f'page: {len(before) / 1e3:.0f} KB -> {len(after) / 1e3:.0f} KB raw, '
+          f'{len(gzip.compress(before)) / 1e3:.0f} KB -> {len(gzip.compress(after)) / 1e3:.0f} KB gzip')
+    if shutil.which('node'):
+        result = subprocess.run(['node', '-e', _CLIENT, str(repeats)], input=json.dumps(snippets),
+                                capture_output=True, text=True, check=True)
+        print(f'client regex chain skipped at load: {float(result.stdout):.1f} ms (node, before DOM work)')
+
+
+if __name__ == '__main__':
+    main()
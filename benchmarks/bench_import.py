@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Measure the cost of importing generate_cka_doc versus a full build.
+
+Each measurement runs in a fresh interpreter so module caches don't hide
+the real start-up cost.
+
+Usage: python benchmarks/bench_import.py [repeats]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_ONLY = '''
+import json, sys, time
+start = time.perf_counter()
+import generate_cka_doc
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'docx_loaded': 'docx' in sys.modules}))
+'''
+
+FULL_BUILD = '''
+import io, json, time
+start = time.perf_counter()
+import generate_cka_doc
+generate_cka_doc.build().save(io.BytesIO())
+print(json.dumps({'seconds': time.perf_counter() - start}))
+'''
+
+
+def run(code):
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    imports = [run(IMPORT_ONLY) for _ in range(repeats)]
+    builds = [run(FULL_BUILD)['seconds'] for _ in range(repeats)]
+    import_ms = statistics.median(r['seconds'] for r in imports) * 1000
+    build_ms = statistics.median(builds) * 1000
+    print(f'import generate_cka_doc : {import_ms:8.1f} ms')
+    print(f'python-docx loaded      : {any(r["docx_loaded"] for r in imports)}')
+    print(f'import + full build     : {build_ms:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Time full, cached and single-section-edit rebuilds with the fragment cache.
+
+The edit case changes one YAML line in section 20 (NetworkPolicy), so only
+that section should be re-rendered.
+
+Usage: python benchmarks/bench_incremental.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cka_sections  # noqa: E402
+import generate_cka_doc  # noqa: E402
+from cka_cache import FragmentCache  # noqa: E402
+from cka_model import Section, Yaml  # noqa: E402
+
+
+def edited_sections():
+    """Return the full sheet with one YAML line in section 20 changed."""
+    old = cka_sections.load(20)
+    children = list(old.children)
+    for i, child in enumerate(children):
+        if isinstance(child, Yaml):
+            children[i] = Yaml(child.text.replace('name: ', 'name: edited-', 1))
+            break
+    new = Section(old.title, children, old.page_break)
+    return [new if node is old else node for node in generate_cka_doc.sections_for()]
+
+
+def timed_build(cache, sections):
+    start = time.perf_counter()
+    generate_cka_doc.build(cache=cache, sections=sections).save(io.BytesIO())
+    return time.perf_counter() - start, cache.misses if cache else len(sections)
+
+
+def main():
+    sections = generate_cka_doc.sections_for()
+    generate_cka_doc.DocumentBuilder()  # load python-docx outside the timings
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [
+            ('no cache', lambda: timed_build(None, sections)),
+            ('cold cache', lambda: timed_build(FragmentCache(tmp), sections)),
+            ('warm cache', lambda: timed_build(FragmentCache(tmp), sections)),
+            ('edit section 20', lambda: timed_build(FragmentCache(tmp), edited_sections())),
+        ]
+        for label, run in runs:
+            elapsed, rendered = run()
+            print(f'{label:16}: {elapsed * 1000:7.1f} ms  ({rendered} section(s) rendered)')
+
+
+if __name__ == '__main__':
+    main()
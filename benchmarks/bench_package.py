@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Compare python-docx's save() with the cka_package writer.
+
+Packages the full sheet, and the sheet with every PNG in assets/ attached,
+with python-docx's own writer and with ``DocumentBuilder.save()`` at one
+compression thread and at one per CPU. Reports save time and file size.
+
+Usage: python benchmarks/bench_package.py [rounds]
+"""
+
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate_cka_doc  # noqa: E402
+from cka_package import package_parts, write_package  # noqa: E402
+
+
+def timed(save, rounds):
+    best = None
+    for _ in range(rounds):
+        out = io.BytesIO()
+        start = time.perf_counter()
+        save(out)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(out.getvalue())
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    plain = generate_cka_doc.build()
+    with_media = generate_cka_doc.build()
+    for path in sorted(glob.glob(os.path.join(ROOT, 'assets', '*.png'))):
+        with_media.doc.add_picture(path)
+
+    print(f'CPUs available: {os.cpu_count()}')
+    for label, builder in (('sheet', plain), ('sheet + assets/*.png', with_media)):
+        package = builder.doc.part.package
+        cases = {
+            'python-docx save()': builder.doc.save,
+            'cka_package, 1 thread': lambda out: write_package(out, package_parts(package), workers=1),
+            'cka_package, per CPU': builder.save,
+        }
+        print(label)
+        for name, save in cases.items():
+            elapsed, size = timed(save, rounds)
+            print(f'  {name:22}: {elapsed * 1000:8.1f} ms  {size / 1024:9.1f} KB')
+
+
+if __name__ == '__main__':
+    main()
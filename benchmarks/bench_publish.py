@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Measure the publish stage of ``--site``: fingerprinting and precompression.
+
+Builds the site into a temporary directory twice, timing
+``fingerprint()`` and ``precompress()`` on the first build and on the
+rebuild where nothing changed, and reports the raw and gzipped size of
+the text files.
+
+Usage: python benchmarks/bench_publish.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cka_publish  # noqa: E402
+from cka_site import build_site  # noqa: E402
+
+timings = {}
+
+
+def timed(function):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        timings[function.__name__] = time.perf_counter() - start
+        return result
+
+    return wrapper
+
+
+def main():
+    # build_site() imports these when it runs, so the wrappers are picked up.
+    cka_publish.fingerprint = timed(cka_publish.fingerprint)
+    cka_publish.precompress = timed(cka_publish.precompress)
+    with tempfile.TemporaryDirectory() as tmp:
+        dist, cache_dir = os.path.join(tmp, 'site'), os.path.join(tmp, 'cache')
+        print(f'{"":10}{"fingerprint":>14}{"precompress":>14}')
+        for label in ('cold', 'unchanged'):
+            stats = build_site(dist, cache_dir=cache_dir)
+            print(f'{label:10}{timings["fingerprint"] * 1000:>12.0f}ms{timings["precompress"] * 1000:>12.0f}ms'
+                  f'   {stats["fingerprinted_new"]}/{stats["fingerprinted"]} new names, '
+                  f'{stats["compressed"]} files compressed')
+
+        raw = gz = 0
+        for root, _, files in os.walk(dist):
+            for name in files:
+                if name.endswith(cka_publish.TEXT_TYPES):
+                    path = os.path.join(root, name)
+                    raw += os.path.getsize(path)
+                    gz += os.path.getsize(path + '.gz')
+        print(f'text files: {raw / 1e3:.0f} KB raw, {gz / 1e3:.0f} KB gzip ({gz / raw * 100:.0f}%)')
+
+
+if __name__ == '__main__':
+    main()
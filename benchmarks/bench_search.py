@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare the prebuilt search index with the linear scan it replaces.
+
+Builds the index of ``index.html`` and times, per query, a Python model of
+the old ``doSearch()`` (lowercase every entry, ``in`` test) against
+``cka_search.search()``. The page is then repeated to grow the content,
+to show how each lookup scales. Also reports the index's size on the wire.
+
+Usage: python benchmarks/bench_search.py [repeats]
+"""
+
+import gzip
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cka_search  # noqa: E402
+
+QUERIES = ('etcd snapshot', 'kube-proxy', 'taint', 'rolebinding', 'pv', 'ingress')
+
+
+def linear_entries(manifest):
+    sections = manifest['sections']
+    return [(title or sections[section][1], text) for _, section, title, text, _ in manifest['entries']]
+
+
+def linear_search(entries, query):
+    ql = query.lower()
+    return [e for e in entries if ql in e[0].lower() or ql in e[1].lower()][:cka_search.MAX_RESULTS]
+
+
+def per_query(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for q in QUERIES:
+            fn(q)
+        times.append((time.perf_counter() - start) / len(QUERIES))
+    return statistics.median(times) * 1e6
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open(os.path.join(ROOT, 'index.html'), encoding='utf-8') as f:
+        page = f.read()
+
+    manifest, shards = cka_search.build_index(page)
+    data = cka_search.dump(manifest)
+    shard_sizes = [len(cka_search.dump(shard)) for shard in shards.values()]
+    print(f'{len(manifest["entries"])} entries; manifest {len(data) / 1e3:.0f} KB '
+          f'({len(gzip.compress(data)) / 1e3:.0f} KB gzip); {len(shards)} shards, '
+          f'largest {max(shard_sizes) / 1e3:.1f} KB')
+
+    print(f'{"content":>8}{"entries":>9}{"linear":>12}{"index":>12}')
+    for copies in (1, 4, 16):
+        manifest, shards = cka_search.build_index(page * copies)
+        entries = linear_entries(manifest)
+        linear = per_query(lambda q: linear_search(entries, q), repeats)
+        indexed = per_query(lambda q: cka_search.search(manifest, shards, q), repeats)
+        print(f'{copies:>7}x{len(entries):>9}{linear:>10.0f}us{indexed:>10.0f}us')
+
+
+if __name__ == '__main__':
+    main()
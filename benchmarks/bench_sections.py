@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Show that subset builds scale with the number of selected sections.
+
+Each selection is built in a fresh interpreter without the fragment cache,
+so import and render costs of unselected sections would show up if they
+were paid.
+
+Usage: python benchmarks/bench_sections.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SELECTIONS = ['20', '16,17,20', '1-12', '1-36']
+
+BUILD = '''
+import io, json, sys, time
+start = time.perf_counter()
+import cka_sections, generate_cka_doc
+numbers = cka_sections.parse_selection(sys.argv[1])
+generate_cka_doc.build(sections=generate_cka_doc.sections_for(numbers)).save(io.BytesIO())
+loaded = sum(name.startswith('cka_sections.') for name in sys.modules)
+print(json.dumps({'seconds': time.perf_counter() - start, 'loaded': loaded}))
+'''
+
+
+def main():
+    for selection in SELECTIONS:
+        out = subprocess.run([sys.executable, '-c', BUILD, selection], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        result = json.loads(out)
+        print(f'--sections {selection:9}: {result["seconds"] * 1000:7.1f} ms, '
+              f'{result["loaded"]:2} section module(s) imported')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Compare separate per-domain builds with the parallel split build.
+
+Reports the slowest single-domain build (the floor for the split build),
+building every domain document plus the master one after another, and the
+split build, which renders each section once in a process pool. Neither
+uses the fragment cache.
+
+Usage: python benchmarks/bench_split.py [workers]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cka_sections  # noqa: E402
+import generate_cka_doc  # noqa: E402
+from cka_split import build_split  # noqa: E402
+
+
+def build_one(numbers):
+    start = time.perf_counter()
+    generate_cka_doc.build(sections=generate_cka_doc.sections_for(numbers)).save(io.BytesIO())
+    return time.perf_counter() - start
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    build_one([1])  # warm up python-docx and the template
+    domains = {key: build_one(numbers) for key, (_, numbers) in cka_sections.DOMAINS.items()}
+    master = build_one(None)
+    slowest = max(domains, key=domains.get)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        build_split(os.path.join(tmp, 'master.docx'), tmp, workers=workers)
+        split = time.perf_counter() - start
+
+    print(f'CPUs available             : {os.cpu_count()}')
+    print(f'slowest domain ({slowest:12}): {domains[slowest] * 1000:7.1f} ms')
+    print(f'domains + master, serially : {(sum(domains.values()) + master) * 1000:7.1f} ms')
+    print(f'split build                : {split * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Time rendering the docx, HTML and Markdown targets one by one and together.
+
+Both runs share one content tree and write to a temporary directory
+without the fragment cache.
+
+Usage: python benchmarks/bench_targets.py [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate_cka_doc  # noqa: E402
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    targets = list(generate_cka_doc.TARGETS)
+    sections = generate_cka_doc.sections_for()
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'sheet.docx')
+        generate_cka_doc.build_targets(output, targets, sections)  # warm up imports
+
+        times = {}
+        for target in targets:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                generate_cka_doc.build_targets(output, [target], sections)
+            times[target] = (time.perf_counter() - start) / rounds
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            generate_cka_doc.build_targets(output, targets, sections)
+        together = (time.perf_counter() - start) / rounds
+
+    for target in targets:
+        print(f'{target:5} alone            : {times[target] * 1000:7.1f} ms')
+    print(f'one after another      : {sum(times.values()) * 1000:7.1f} ms')
+    print(f'all targets, concurrent: {together * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Per-document fixed cost: restyling from scratch vs the prebuilt template.
+
+Usage: python benchmarks/bench_template.py [repeats]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_cka_doc import BaseTemplate  # noqa: E402
+
+
+def per_call(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    template = BaseTemplate.generate()
+    with tempfile.TemporaryDirectory() as tmp:
+        BaseTemplate.load(tmp)
+        results = [
+            ('default template + restyle', per_call(BaseTemplate.generate, repeats)),
+            ('load cached template file', per_call(lambda: BaseTemplate.load(tmp), repeats)),
+            ('parse template bytes', per_call(lambda: BaseTemplate(template.data), repeats)),
+            ('clone in memory', per_call(template.new_document, repeats)),
+        ]
+    for label, ms in results:
+        print(f'{label:28}: {ms:6.2f} ms per document')
+    # Sanity check: a clone is independent of its prototype.
+    clone = template.new_document()
+    clone.add_paragraph('x')
+    assert len(template.new_document().paragraphs) == 0
+    assert io.BytesIO(template.data).read(2) == b'PK'
+
+
+if __name__ == '__main__':
+    main()
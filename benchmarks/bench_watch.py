@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Time save-to-refreshed-preview latency of ``--watch`` for a one-section edit.
+
+Copies the repository to a temporary directory and starts that copy's
+watcher with a free preview port, then repeatedly edits the copy of
+section 16 (alternately appending a title change and restoring the
+original file). Each sample is the time from the write until the
+preview's event stream announces the new page and the page has been
+fetched again. The working tree is never modified.
+
+Usage: python benchmarks/bench_watch.py [edits]
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SECTION = os.path.join('cka_sections', 's16_rbac.py')
+EDIT = b"\nSECTION = SECTION.replace(title=SECTION.title + ' (edited)')\n"
+TARGET_MS = 300
+
+
+def next_event(events):
+    """Return the data of the next server-sent event, skipping keepalives."""
+    for line in events:
+        if line.startswith(b'data: '):
+            return line[6:].strip().decode('ascii')
+    raise RuntimeError('the event stream closed')
+
+
+def main():
+    edits = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = os.path.join(tmp, 'tree')
+        shutil.copytree(ROOT, tree, ignore=shutil.ignore_patterns('.git', '.cka_cache', '__pycache__', 'dist',
+                                                                  '*.docx'))
+        section = os.path.join(tree, SECTION)
+        with open(section, 'rb') as f:
+            original = f.read()
+        proc = subprocess.Popen([sys.executable, os.path.join(tree, 'generate_cka_doc.py'),
+                                 os.path.join(tmp, 'sheet.docx'), '--watch', '--no-cache',
+                                 '--cache-dir', os.path.join(tmp, 'cache'), '--preview-port', '0',
+                                 '--targets', 'docx,html'],
+                                stdout=subprocess.PIPE, text=True)
+        try:
+            for line in proc.stdout:
+                if line.startswith('Preview on '):
+                    url = line.split()[2]
+                    break
+            else:
+                raise RuntimeError('the watcher did not start')
+            events = urllib.request.urlopen(url + '__events')
+            version = next_event(events)
+
+            samples = []
+            for i in range(edits):
+                time.sleep(0.2)  # let the watcher settle between edits
+                start = time.perf_counter()
+                with open(section, 'wb') as f:
+                    f.write(original if i % 2 else original + EDIT)
+                current = next_event(events)
+                with urllib.request.urlopen(url) as response:
+                    page = response.read()
+                samples.append((time.perf_counter() - start) * 1000)
+                if current == version or current.encode('ascii') not in page:
+                    raise RuntimeError('the preview did not change')
+                version = current
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    samples.sort()
+    print(f'{edits} edits: median {statistics.median(samples):.0f} ms, '
+          f'max {samples[-1]:.0f} ms (target < {TARGET_MS} ms)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Check that streamed and saved .docx builds are byte-identical.
+
+``--stream`` must not change the output, or switching it on or off would
+rewrite an unchanged document. Builds the full sheet and a few sections
+with ``DocumentBuilder.save()`` (with one and with four compression
+threads) and with ``cka_stream.write_streaming()`` (without and with a
+warm fragment cache), at several compression levels, and exits non-zero
+if any two differ.
+
+Usage: python benchmarks/check_stream_identical.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate_cka_doc  # noqa: E402
+from cka_cache import FragmentCache  # noqa: E402
+from cka_package import package_parts, write_package  # noqa: E402
+from cka_stream import write_streaming  # noqa: E402
+
+LEVELS = (0, 1, 6, 9)
+SELECTIONS = {'all sections': None, 'sections 1-5': [1, 2, 3, 4, 5]}
+
+
+def saved(nodes, level, workers):
+    builder = generate_cka_doc.build(generate_cka_doc.DocumentBuilder(compress_level=level), sections=nodes)
+    out = io.BytesIO()
+    write_package(out, package_parts(builder.doc.part.package), level, workers)
+    return out.getvalue()
+
+
+def streamed(nodes, level, cache=None):
+    out = io.BytesIO()
+    write_streaming(out, nodes, generate_cka_doc.DocumentBuilder(compress_level=level), cache)
+    return out.getvalue()
+
+
+def main():
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, numbers in SELECTIONS.items():
+            nodes = generate_cka_doc.sections_for(numbers)
+            for level in LEVELS:
+                streamed(nodes, level, FragmentCache(tmp))  # warm the cache
+                outputs = {
+                    'save': saved(nodes, level, 1),
+                    'save, 4 threads': saved(nodes, level, 4),
+                    'stream': streamed(nodes, level),
+                    'stream, cached': streamed(nodes, level, FragmentCache(tmp)),
+                }
+                reference = outputs['save']
+                different = [name for name, data in outputs.items() if data != reference]
+                failures += bool(different)
+                print(f'{label}, level {level}: {len(reference) // 1024} KB, '
+                      + (f'differs: {", ".join(different)}' if different else 'identical'))
+    if failures:
+        sys.exit(f'{failures} builds differ between save() and streaming')
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Check that streaming keeps peak memory flat as the document grows.
+
+Builds the full sheet and a synthetic document with every section repeated
+COPIES times, both with ``DocumentBuilder.save()`` and with
+``cka_stream.write_streaming()``. Each build runs in a fresh process so its
+peak RSS can be read from ``getrusage``; each is run RUNS times and the
+lowest peak is kept, since RSS varies a little from run to run. Exits
+non-zero if the streamed document's peak memory grows by more than
+MAX_RATIO of what ``save()``'s grows plus TOLERANCE_MB, or if ``save()``
+grows by less than MIN_SAVE_GROWTH_MB, in which case the document is
+too small to tell the two apart.
+
+Usage: python benchmarks/check_stream_memory.py
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COPIES = 40
+RUNS = 3
+MAX_RATIO = 0.1
+TOLERANCE_MB = 2
+MIN_SAVE_GROWTH_MB = 25
+
+
+def child(mode, copies):
+    import generate_cka_doc
+    from cka_stream import write_streaming
+
+    nodes = generate_cka_doc.sections_for()
+    nodes = nodes[:2] + nodes[2:] * copies
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sheet.docx')
+        if mode == 'stream':
+            write_streaming(path, nodes)
+        else:
+            generate_cka_doc.build(sections=nodes).save(path)
+        size = os.path.getsize(path)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f'{peak:.1f} {size}')
+
+
+def measure(mode, copies):
+    """Return the lowest peak RSS in MB of RUNS builds, and the docx size."""
+    peaks = []
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, __file__, mode, str(copies)],
+                             check=True, capture_output=True, text=True).stdout.split()
+        peaks.append(float(out[0]))
+    return min(peaks), int(out[1])
+
+
+def main():
+    if len(sys.argv) == 3:
+        child(sys.argv[1], int(sys.argv[2]))
+        return
+    growth = {}
+    for mode in ('save', 'stream'):
+        small, small_size = measure(mode, 1)
+        large, large_size = measure(mode, COPIES)
+        growth[mode] = large - small
+        print(f'{mode:6}  1x: {small:6.1f} MB ({small_size // 1024:5} KB docx)   '
+              f'{COPIES}x: {large:6.1f} MB ({large_size // 1024:5} KB docx)   '
+              f'growth: {growth[mode]:+6.1f} MB')
+    if growth['save'] < MIN_SAVE_GROWTH_MB:
+        sys.exit(f'save() peak memory only grew by {growth["save"]:.1f} MB (need {MIN_SAVE_GROWTH_MB} MB '
+                 'to tell streaming apart); raise COPIES')
+    limit = MAX_RATIO * growth['save'] + TOLERANCE_MB
+    if growth['stream'] > limit:
+        sys.exit(f'streaming peak memory grew by {growth["stream"]:.1f} MB, more than {limit:.1f} MB '
+                 f'({MAX_RATIO:.0%} of save()\'s {growth["save"]:.1f} MB plus {TOLERANCE_MB} MB)')
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
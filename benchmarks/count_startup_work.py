@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Statically count the DOM work ``script.js`` has left to do at startup.
+
+This is not a layout measurement: there is no browser here. It parses a
+page and counts what the startup code paths of ``script.js`` would still
+have to build, because the markup does not already contain it:
+
+- DOM writes: nodes created, moved or given new content or ids by the
+  block wrapping, the navigation submenus, the code highlighter and the
+  section action bars.
+- Layout reads after writes: the highlighter calls ``getComputedStyle()``
+  on each block it has not highlighted, after writing to the previous one,
+  which forces a style/layout flush per block.
+
+It compares ``index.html`` from the repository with the page written by
+``--site`` (pre-rendered code blocks and section structure) and exits
+non-zero if the built page still leaves any of that work to the script,
+e.g. because the pre-rendering stopped producing some of its markup.
+
+Usage: python benchmarks/count_startup_work.py
+"""
+
+import os
+import re
+import sys
+from html.parser import HTMLParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cka_blocks import prewrap_page  # noqa: E402
+from cka_highlight import highlight_page  # noqa: E402
+
+_VOID = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source',
+                   'track', 'wbr'))
+
+
+class Element:
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+        self.classes = attrs.get('class', '').split()
+
+
+class Page(HTMLParser):
+    """Just enough of a DOM to find what the startup code would touch."""
+
+    def __init__(self, page):
+        super().__init__()
+        self.elements = []
+        self._open = [Element(None, {}, None)]
+        self.feed(page)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        element = Element(tag, {name: value or '' for name, value in attrs}, self._open[-1])
+        self._open[-1].children.append(element)
+        self.elements.append(element)
+        if tag not in _VOID:
+            self._open.append(element)
+
+    def handle_endtag(self, tag):
+        if any(element.tag == tag for element in self._open[1:]):
+            while self._open.pop().tag != tag:
+                pass
+
+    def find(self, element_id):
+        return next((e for e in self.elements if e.attrs.get('id') == element_id), None)
+
+    def sections(self):
+        """Yield ``(h2, [h2 and its following siblings])`` like ``wrapContentBlocks()``."""
+        for h2 in self.elements:
+            if h2.tag != 'h2' or not h2.attrs.get('id', '').startswith('section-'):
+                continue
+            siblings = h2.parent.children
+            block = [h2]
+            for sibling in siblings[siblings.index(h2) + 1:]:
+                if sibling.tag == 'h2':
+                    break
+                block.append(sibling)
+            yield h2, block
+
+
+def descendants(element):
+    yield element
+    for child in element.children:
+        yield from descendants(child)
+
+
+def count(html):
+    page = Page(html)
+    writes = {}
+
+    # wrapContentBlocks()
+    writes['blocks'] = 0 if page.find('block-intro') else 2
+    for h2, block in page.sections():
+        if not page.find('block-' + h2.attrs['id']):
+            writes['blocks'] += 1 + len(block)  # create + insert the div, move each node
+
+    # Navigation: h3 ids, .nav-item wrappers and submenus.
+    writes['nav'] = 0
+    if not any('nav-item' in e.classes for e in page.elements):
+        for _, block in page.sections():
+            headings = [e for element in block for e in descendants(element) if e.tag == 'h3']
+            writes['nav'] += sum(1 for h3 in headings if not h3.attrs.get('id'))
+            writes['nav'] += 2 + (1 + len(headings) if headings else 0)
+
+    # highlightCodeBlocks()
+    pres = [e for e in page.elements if e.tag == 'pre' and 'data-highlighted' not in e.attrs]
+    writes['code'] = 2 * len(pres)  # insert the button, replace the code's HTML
+
+    # injectSectionBars() and updateSectionBar()
+    if not any('section-action-bar' in e.classes for e in page.elements):
+        writes['bars'] = 2 * sum(1 for _ in page.sections())  # insert the bar, rewrite its label
+    else:
+        writes['bars'] = 0
+    return writes, len(pres)
+
+
+def main():
+    with open(os.path.join(ROOT, 'index.html'), encoding='utf-8') as f:
+        page = f.read()
+    if re.search(r'class="content-block\b', page):
+        sys.exit('index.html is already pre-rendered; nothing to compare')
+    before, before_reads = count(page)
+    after, after_reads = count(prewrap_page(highlight_page(page)))
+    print(f'{"startup DOM writes":24}{"source":>8}{"built":>8}')
+    for key in before:
+        print(f'  {key:22}{before[key]:>8}{after[key]:>8}')
+    print(f'  {"total":22}{sum(before.values()):>8}{sum(after.values()):>8}')
+    print(f'{"layout reads after writes":24}{before_reads:>8}{after_reads:>8}')
+    if sum(after.values()) or after_reads:
+        sys.exit('the built page leaves startup DOM work to script.js')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Load-test the generation server and report p50/p99 latency.
+
+Without ``--url`` a server is started in a separate process on a free
+port (warm, in-memory cache only) and stopped afterwards. Each client
+thread sends its requests back to back, cycling through a mix of whole
+sheets, section subsets and the HTML page, so some requests are identical
+and in flight together.
+
+Usage: python benchmarks/load_test.py [--url URL] [--clients N] [--requests N] [--workers N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'generate_cka_doc.py')
+
+MIX = (
+    '/cheatsheet.docx',
+    '/cheatsheet.docx?sections=16,17,20',
+    '/cheatsheet.docx?sections=1-5',
+    '/cheatsheet.docx',
+    '/cheatsheet.html',
+    '/cheatsheet.docx?sections=29,35',
+)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of sorted ``values``."""
+    return values[max(0, min(len(values) - 1, round(fraction * len(values)) - 1))]
+
+
+def start_server(workers):
+    proc = subprocess.Popen([sys.executable, SCRIPT, '--serve', '127.0.0.1:0', '--no-cache',
+                             '--workers', str(workers)],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    line = proc.stdout.readline()
+    if not line.startswith('Serving on '):
+        proc.kill()
+        raise RuntimeError('the server did not start')
+    return proc, line.split()[2].rsplit('/', 1)[0]
+
+
+def fetch(url):
+    start = time.perf_counter()
+    with urllib.request.urlopen(url) as response:
+        size = len(response.read())
+    return time.perf_counter() - start, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='server to test, e.g. http://127.0.0.1:8000 (default: start one)')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent clients (default: %(default)s)')
+    parser.add_argument('--requests', type=int, default=200, help='total requests (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=2,
+                        help='build workers for a server started here (default: %(default)s)')
+    args = parser.parse_args()
+
+    proc = None
+    base = args.url
+    if base is None:
+        proc, base = start_server(args.workers)
+    try:
+        urls = [base.rstrip('/') + MIX[i % len(MIX)] for i in range(args.requests)]
+        fetch(urls[0])  # first connection
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            results = list(pool.map(fetch, urls))
+        elapsed = time.perf_counter() - start
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    latencies = sorted(seconds * 1000 for seconds, _ in results)
+    print(f'{len(results)} requests, {args.clients} clients, {sum(size for _, size in results) / 1e6:.1f} MB '
+          f'in {elapsed:.2f} s ({len(results) / elapsed:.1f} req/s)')
+    print(f'p50 {percentile(latencies, 0.50):.1f} ms   p90 {percentile(latencies, 0.90):.1f} ms   '
+          f'p99 {percentile(latencies, 0.99):.1f} ms   max {latencies[-1]:.1f} ms   '
+          f'mean {statistics.fmean(latencies):.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
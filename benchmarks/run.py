@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the generator, with a JSON history of past runs.
+
+Micro benchmarks time the ``DocumentBuilder`` helpers, every section's
+render and ``save()`` in this process. End-to-end benchmarks run the whole
+script in fresh processes and record wall time and peak RSS. Each run is
+appended to the history file and compared with the previous one, so a
+regression shows up as a percentage change.
+
+Usage: python benchmarks/run.py [--quick] [--only PATTERN] [--history PATH] [--no-save]
+"""
+
+import argparse
+import datetime
+import fnmatch
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cka_sections  # noqa: E402
+import generate_cka_doc  # noqa: E402
+from cka_cache import write_atomic  # noqa: E402
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.json')
+SCRIPT = os.path.join(ROOT, 'generate_cka_doc.py')
+REGRESSION = 0.10  # flag changes slower than this
+
+# Runs the generator and reports its own peak RSS. VmHWM belongs to the new
+# process image, whereas getrusage()'s ru_maxrss also counts the pages the
+# child inherited from this (much larger) benchmark process before exec.
+_CHILD = """
+import runpy, sys
+sys.argv = sys.argv[1:]
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+finally:
+    with open('/proc/self/status') as f:
+        peak = next(line.split()[1] for line in f if line.startswith('VmHWM:'))
+    sys.stderr.write(f'VmHWM {peak}\\n')
+"""
+
+
+def timed(fn, number, repeat, setup=None):
+    """Return the per-call time of ``fn`` for each of ``repeat`` runs.
+
+    ``setup()`` (untimed) runs before every repeat and its result is
+    passed to each of the ``number`` calls.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(state)
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def summary(times, **extra):
+    return {'median_ms': statistics.median(times) * 1000, 'min_ms': min(times) * 1000, **extra}
+
+
+def code_text(lines):
+    return '\n'.join(f'kubectl get pods -n team-{i % 50} -l app=web-{i} -o wide' for i in range(lines))
+
+
+# ── Micro benchmarks ──
+def bench_add_code(repeat, wanted):
+    for lines in (10, 100, 10_000):
+        if not wanted(f'add_code[{lines}]'):
+            continue
+        text = code_text(lines)
+        number = max(1, 1000 // lines)
+        times = timed(lambda b: b.add_code(text), number, repeat, generate_cka_doc.DocumentBuilder)
+        yield f'add_code[{lines}]', summary(times)
+
+
+def bench_notes(repeat, wanted):
+    for helper in ('add_tip', 'add_exam_note', 'add_bullet'):
+        if not wanted(helper):
+            continue
+        text = 'Always add -n <namespace> for namespace-scoped resources.'
+        times = timed(lambda b: getattr(b, helper)(text), 1000, repeat, generate_cka_doc.DocumentBuilder)
+        yield helper, summary(times, ops_per_s=round(1 / statistics.median(times)))
+
+
+def bench_sections(repeat, wanted):
+    for number in cka_sections.REGISTRY:
+        if not wanted(f'render_section[{number:02d}]'):
+            continue
+        section = cka_sections.load(number)
+        times = timed(lambda b: b.render(section), 1, repeat, generate_cka_doc.DocumentBuilder)
+        yield f'render_section[{number:02d}]', summary(times)
+
+
+def bench_save(repeat, wanted):
+    if not wanted('save'):
+        return
+    builder = generate_cka_doc.build()
+    times = timed(lambda _: builder.save(io.BytesIO()), 1, repeat)
+    yield 'save', summary(times)
+
+
+# ── End-to-end benchmarks ──
+def run_script(args):
+    """Run the generator in a fresh process; return (wall seconds, peak RSS MB)."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', _CHILD, SCRIPT, *args],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(f'generate_cka_doc.py {" ".join(args)} failed:\n{proc.stderr}')
+    peak = next(line.split()[1] for line in proc.stderr.splitlines() if line.startswith('VmHWM '))
+    return elapsed, int(peak) / 1024  # kB
+
+
+def bench_end_to_end(repeat, wanted):
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'sheet.docx')
+        cache_dir = os.path.join(tmp, 'cache')
+        # --no-cache renders every section but still reuses the resized
+        # diagrams, which are keyed by content and primed once below.
+        cases = {
+            'build_cold': [output, '--no-cache', '--cache-dir', cache_dir],
+            'build_warm': [output, '--cache-dir', cache_dir],
+            'build_stream': [output, '--no-cache', '--cache-dir', cache_dir, '--stream'],
+            'build_all_targets': [output, '--no-cache', '--cache-dir', cache_dir, '--targets', 'docx,html,md'],
+        }
+        cases = {name: args for name, args in cases.items() if wanted(name)}
+        if cases:
+            run_script([output, '--cache-dir', cache_dir])  # prime the fragment and diagram caches
+        for name, args in cases.items():
+            runs = [run_script(args) for _ in range(repeat)]
+            yield name, summary([wall for wall, _ in runs], peak_rss_mb=round(max(rss for _, rss in runs), 1))
+
+
+SUITE = (bench_add_code, bench_notes, bench_sections, bench_save, bench_end_to_end)
+
+
+# ── History ──
+def load_history(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def latest_results(history):
+    """Return each benchmark's most recent result, whichever run it was in."""
+    latest = {}
+    for run in history:
+        latest.update(run['results'])
+    return latest
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def report(results, previous):
+    # Changes are judged on the best run, which is far less noisy than the
+    # median on a busy machine.
+    print(f'{"benchmark":26}{"median ms":>12}{"min ms":>12}{"vs last":>10}  extra')
+    for name, result in results.items():
+        change = ''
+        before = previous.get(name)
+        if before:
+            delta = result['min_ms'] / before['min_ms'] - 1
+            change = f'{delta:+.1%}' + (' !' if delta > REGRESSION else '  ')
+        extra = ', '.join(f'{key}={value}' for key, value in result.items() if not key.endswith('_ms'))
+        print(f'{name:26}{result["median_ms"]:12.3f}{result["min_ms"]:12.3f}{change:>10}  {extra}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='fewer repeats, for a fast sanity check')
+    parser.add_argument('--only', metavar='PATTERN', help="run benchmarks matching a glob, e.g. 'add_*'")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON history file (default: %(default)s)')
+    parser.add_argument('--no-save', action='store_true', help='do not append this run to the history')
+    args = parser.parse_args()
+    repeat = 3 if args.quick else 7
+
+    generate_cka_doc.build()  # warm up python-docx, the template and the section modules
+
+    def wanted(name):
+        return args.only is None or fnmatch.fnmatch(name, args.only)
+
+    results = {}
+    for bench in SUITE:
+        for name, result in bench(repeat, wanted):
+            results[name] = result
+
+    history = load_history(args.history)
+    report(results, latest_results(history))
+    if args.no_save:
+        return
+    history.append({
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+        'repeat': repeat,
+        'results': results,
+    })
+    write_atomic(args.history, json.dumps(history, indent=1).encode('utf-8'))
+    print(f'History: {args.history} ({len(history)} runs)')
+
+
+if __name__ == '__main__':
+    main()
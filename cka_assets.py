@@ -0,0 +1,279 @@
+"""Responsive variants of the diagrams in ``assets/`` for the static site.
+
+Every PNG is resized to each of ``WIDTHS`` narrower than the original,
+and also kept at its original width. Each size is written as a 256-colour
+palette PNG and as a WebP. ``<img>`` tags that point at ``assets/*.png``
+are then rewritten into ``<picture>`` elements with ``srcset``/``sizes``,
+so browsers fetch the smallest file that fills the layout. The fallback
+``src`` stays full size, which is what the diagram zoom opens.
+
+The docx embeds a single "print" variant of each diagram it uses:
+``PRINT_WIDTH`` pixels wide (6 inches at 200 dpi), as a palette PNG.
+
+Processing an image is keyed by a hash of its bytes and of the settings
+below, so unchanged images are never decoded again. Images are processed
+in a process pool. Pillow is an optional dependency, needed only when an
+image is not already in the cache. Its version is therefore not part of
+the key. The site variants' manifest records it instead, and they are
+made again when a different Pillow is installed.
+"""
+
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import shutil
+import threading
+
+WIDTHS = (480, 800, 1200)
+PRINT_WIDTH = 1200
+WEBP_QUALITY = 80
+PALETTE_COLOURS = 256
+
+# Sections are full width on phones and tablets; beside the navigation on
+# larger screens.
+DEFAULT_SIZES = '(max-width: 992px) 100vw, calc(100vw - 320px)'
+
+_IMG = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+_ATTR = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+
+
+_print_variants = {}
+_print_lock = threading.Lock()
+
+
+def settings_key(settings=(WIDTHS, WEBP_QUALITY, PALETTE_COLOURS)):
+    """Digest of the settings that, besides the image bytes, shape the variants."""
+    return hashlib.sha256(repr(settings).encode()).hexdigest()
+
+
+def _pillow_version():
+    try:
+        import PIL
+    except ImportError:
+        return None
+    return PIL.__version__
+
+
+def _variant_widths(width):
+    return [w for w in WIDTHS if w < width] + [width]
+
+
+def _open(data):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as original:
+        return original.convert('RGBA' if 'A' in original.getbands() else 'RGB')
+
+
+def _resize(image, width):
+    from PIL import Image
+
+    if width >= image.width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def _palette_png(image):
+    from PIL import Image
+
+    out = io.BytesIO()
+    image.quantize(PALETTE_COLOURS, method=Image.Quantize.FASTOCTREE).save(out, 'PNG', optimize=True)
+    return out.getvalue()
+
+
+def _require_pillow():
+    import importlib.util
+
+    if importlib.util.find_spec('PIL') is None:
+        raise RuntimeError('optimising images needs Pillow (pip install Pillow)')
+
+
+def process_image(source, cache_dir, settings):
+    """Return the manifest of ``source``'s variants, making them on a cache miss.
+
+    The manifest is ``{'width', 'height', 'variants': [[file, width], ...],
+    'pillow'}``; files are relative to the image's cache directory, which is
+    returned alongside it. A cached manifest made by another Pillow version
+    than the installed one is made again; without Pillow it is used as is.
+    """
+    with open(source, 'rb') as f:
+        data = f.read()
+    key = hashlib.sha256(data + settings.encode()).hexdigest()
+    directory = os.path.join(cache_dir, key[:2], key)
+    manifest_path = os.path.join(directory, 'manifest.json')
+    version = _pillow_version()
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        pass
+    else:
+        if version is None or manifest.get('pillow') == version:
+            return directory, manifest, True
+
+    _require_pillow()
+    from cka_cache import write_atomic
+
+    stem = os.path.splitext(os.path.basename(source))[0]
+    image = _open(data)
+    variants = []
+    for width in _variant_widths(image.width):
+        resized = _resize(image, width)
+        write_atomic(os.path.join(directory, f'{stem}-{width}.png'), _palette_png(resized))
+        out = io.BytesIO()
+        resized.save(out, 'WEBP', quality=WEBP_QUALITY, method=4)
+        write_atomic(os.path.join(directory, f'{stem}-{width}.webp'), out.getvalue())
+        variants += [[f'{stem}-{width}.png', width], [f'{stem}-{width}.webp', width]]
+    manifest = {'width': image.width, 'height': image.height, 'variants': variants, 'pillow': version}
+    write_atomic(manifest_path, json.dumps(manifest).encode('utf-8'))
+    return directory, manifest, False
+
+
+def optimise_assets(source_dir, cache_dir, workers=None):
+    """Make the variants of every PNG in ``source_dir``, in parallel.
+
+    Returns ``(images, cached)``: ``{file name: (directory, manifest)}``
+    and how many images came from the cache in ``cache_dir``.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from cka_pool import InlineExecutor
+
+    names = sorted(name for name in os.listdir(source_dir) if name.lower().endswith('.png'))
+    if workers is None:
+        workers = min(len(names), os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else InlineExecutor()
+    settings = settings_key()
+    with pool:
+        jobs = [pool.submit(process_image, os.path.join(source_dir, name), cache_dir, settings)
+                for name in names]
+        results = {name: job.result() for name, job in zip(names, jobs)}
+    cached = sum(1 for _, _, hit in results.values() if hit)
+    return {name: (directory, manifest) for name, (directory, manifest, _) in results.items()}, cached
+
+
+def copy_variants(images, target_dir):
+    """Copy every variant into ``target_dir``; returns how many files changed."""
+    from cka_cache import write_if_changed
+
+    changed = 0
+    for directory, manifest in images.values():
+        for name, _ in manifest['variants']:
+            source = os.path.join(directory, name)
+            with open(source, 'rb') as src:
+                changed += write_if_changed(os.path.join(target_dir, name),
+                                            lambda f: shutil.copyfileobj(src, f))
+    return changed
+
+
+def _srcset(prefix, manifest, extension):
+    return ', '.join(f'{prefix}{name} {width}w' for name, width in manifest['variants']
+                     if name.endswith(extension))
+
+
+def rewrite_images(page, images, prefix='assets/'):
+    """Return ``page`` with ``<img src="assets/X.png">`` tags made responsive.
+
+    ``images`` maps file names to ``(directory, manifest)`` as returned by
+    ``optimise_assets()``. An explicit ``width`` attribute caps ``sizes``.
+    """
+    def rewrite(match):
+        tag = match.group(0)
+        attrs = dict(_ATTR.findall(tag))
+        src = html.unescape(attrs.get('src', ''))
+        if not src.startswith(prefix) or os.path.basename(src) not in images:
+            return tag
+        _, manifest = images[os.path.basename(src)]
+        width = attrs.get('width', '')
+        sizes = f'(max-width: {width}px) 100vw, {width}px' if width.isdigit() else DEFAULT_SIZES
+        largest = next(name for name, w in manifest['variants']
+                       if w == manifest['width'] and name.endswith('.png'))
+        tag = tag.replace(f'src="{attrs["src"]}"',
+                          f'src="{prefix}{largest}" srcset="{_srcset(prefix, manifest, ".png")}" '
+                          f'sizes="{sizes}"', 1)
+        # display: contents keeps <picture> out of the layout, so existing
+        # CSS (e.g. flex rules on the <img>) still applies.
+        return (f'<picture style="display: contents">'
+                f'<source type="image/webp" srcset="{_srcset(prefix, manifest, ".webp")}" sizes="{sizes}">'
+                f'{tag}</picture>')
+
+    return _IMG.sub(rewrite, page)
+
+
+# ── Print variants for the docx ──
+def make_print_variant(source, cache_dir=None, settings=None):
+    """Return the print variant of the image at ``source`` as PNG bytes.
+
+    With ``cache_dir`` the result is cached there, keyed by a hash of the
+    source bytes and ``settings`` (see ``settings_key()``).
+    """
+    with open(source, 'rb') as f:
+        data = f.read()
+    path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(data + (settings or print_settings_key()).encode()).hexdigest()
+        path = os.path.join(cache_dir, key[:2], key + '.png')
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+    _require_pillow()
+    variant = _palette_png(_resize(_open(data), PRINT_WIDTH))
+    if path is not None:
+        from cka_cache import write_atomic
+
+        write_atomic(path, variant)
+    return variant
+
+
+def print_settings_key():
+    return settings_key(('print', PRINT_WIDTH, PALETTE_COLOURS))
+
+
+def print_variants(names, cache_dir=None, workers=None):
+    """Return ``{name: PNG bytes}`` of the print variants of ``assets/<name>``.
+
+    Variants are kept in memory for the life of the process. Missing ones
+    are made in a process pool of ``workers`` (one per CPU by default) and
+    cached in ``cache_dir`` when it is given.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from cka_model import ASSETS_DIR, asset_digest
+    from cka_pool import InlineExecutor
+
+    keys = {name: (name, asset_digest(name)) for name in names}
+    with _print_lock:
+        variants = {name: _print_variants[key] for name, key in keys.items() if key in _print_variants}
+    missing = [name for name in keys if name not in variants]
+    if missing:
+        if workers is None:
+            workers = min(len(missing), os.cpu_count() or 1)
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else InlineExecutor()
+        settings = print_settings_key()
+        with pool:
+            jobs = [pool.submit(make_print_variant, os.path.join(ASSETS_DIR, name), cache_dir, settings)
+                    for name in missing]
+            made = {name: job.result() for name, job in zip(missing, jobs)}
+        remember_print_variants(made)
+        variants.update(made)
+    return variants
+
+
+def print_variant(name):
+    """Return the print variant of ``assets/<name>``, making it if needed."""
+    return print_variants([name], workers=1)[name]
+
+
+def remember_print_variants(variants):
+    """Keep ``{name: PNG bytes}`` (e.g. made by another process) in memory."""
+    from cka_model import asset_digest
+
+    with _print_lock:
+        for name, data in variants.items():
+            _print_variants[(name, asset_digest(name))] = data
@@ -0,0 +1,168 @@
+"""Batch builds: one personalised cheat sheet per student in a CSV roster.
+
+The roster has a ``name`` column, an optional ``weak_topics`` column of
+section numbers as listed in the table of contents (``16,21`` or
+``16-18``) and an optional ``output`` file name. Each student's sheet
+carries their name on the title page, marks their weak topics in the table
+of contents and opens each weak section with a focus note; with
+``weak_first`` those sections also move to the front.
+
+Every section is rendered once, up front, to an XML fragment (reusing the
+on-disk fragment cache when there is one). The fragments are handed to a
+process pool whose workers only assemble and write documents, so the cost
+of a sheet is a template copy, a title page, a TOC and the zip.
+"""
+
+import csv
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cka_sections
+from cka_cache import write_if_changed
+from cka_model import ExamNote, TableOfContents
+from cka_pool import InlineExecutor
+from generate_cka_doc import BaseTemplate, DocumentBuilder, title_page
+
+WEAK_MARK = '★ '
+
+_template = None
+_fragments = None
+_options = None
+
+
+class Student:
+    __slots__ = ('name', 'weak', 'output')
+
+    def __init__(self, name, weak=(), output=None):
+        self.name = name
+        self.weak = tuple(weak)
+        self.output = output
+
+
+def read_roster(path):
+    """Return the ``Student`` rows of the CSV file at ``path``.
+
+    Raises ``ValueError`` for a missing ``name`` column, an empty name, an
+    unknown section number or two students writing to the same file.
+    """
+    students = []
+    outputs = set()
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        if 'name' not in (reader.fieldnames or ()):
+            raise ValueError(f'{path}: missing a "name" column')
+        for line, row in enumerate(reader, start=2):
+            name = (row.get('name') or '').strip()
+            if not name:
+                raise ValueError(f'{path}:{line}: empty name')
+            weak = (row.get('weak_topics') or '').strip()
+            try:
+                weak = cka_sections.parse_selection(weak) if weak else []
+            except ValueError as e:
+                raise ValueError(f'{path}:{line}: weak_topics: {e}') from None
+            output = (row.get('output') or '').strip() or student_filename(name)
+            if output in outputs:
+                raise ValueError(f'{path}:{line}: {output} is already written for another student')
+            outputs.add(output)
+            students.append(Student(name, weak, output))
+    return students
+
+
+def student_filename(name):
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_') or 'student'
+    return f'CKA_CheatSheet_{slug}.docx'
+
+
+def render_fragments(template, cache_dir=None, diagram_cache_dir=None):
+    """Render every section once.
+
+    Diagram print variants are cached under ``diagram_cache_dir``, which
+    defaults to ``cache_dir``. Returns ``{number: fragment}`` and the
+    diagrams' print variants, which workers need to splice the fragments.
+    """
+    from cka_cache import FragmentCache
+
+    builder = DocumentBuilder(template=template)
+    cache = FragmentCache(cache_dir) if cache_dir else None
+    nodes = {number: cka_sections.load(number).replace(page_break=False) for number in cka_sections.REGISTRY}
+    diagrams = builder.prepare_diagrams(nodes.values(), diagram_cache_dir or cache_dir)
+    fragments = {}
+    for number, node in nodes.items():
+        if cache is None:
+            fragments[number] = builder.render_fragment(node)
+        else:
+            fragments[number] = cache.fragment(builder, node)
+    return fragments, diagrams
+
+
+def _init_worker(template_data, fragments, options, diagrams):
+    global _template, _fragments, _options
+    from cka_assets import remember_print_variants
+
+    remember_print_variants(diagrams)
+    _template = BaseTemplate(template_data)
+    _fragments = fragments
+    _options = options
+
+
+def assemble_student(job):
+    """Write one student's sheet; returns ``(path, changed)``."""
+    student, path = job
+    weak_first, compress_level = _options
+    weak = set(student.weak)
+    numbers = list(cka_sections.REGISTRY)
+    if weak_first:
+        numbers = list(student.weak) + [n for n in numbers if n not in weak]
+
+    builder = DocumentBuilder(template=_template, compress_level=compress_level)
+    builder.render(title_page.replace(summary=f'Prepared for {student.name}'))
+    items = cka_sections.toc_items(numbers)
+    builder.render(TableOfContents(WEAK_MARK + item if n in weak else item
+                                   for n, item in zip(numbers, items)))
+    body = builder.doc.element.body
+    for i, number in enumerate(numbers):
+        if i:
+            builder.add_section_break()
+        start = len(body) - 1  # the fragment's first block is the section heading
+        builder.append_fragment(_fragments[number])
+        if number in weak:
+            end = len(body) - 1
+            builder.render(ExamNote(f'Focus topic for {student.name}: flagged as a weak area.'))
+            heading = body[start]
+            for block in reversed(body[end:-1]):
+                heading.addnext(block)
+    return path, write_if_changed(path, builder.save)
+
+
+def build_batch(roster, directory, template=None, cache_dir=None, workers=None, weak_first=False,
+                compress_level=None, diagram_cache_dir=None):
+    """Write a sheet for every student in the CSV file ``roster``.
+
+    Returns ``(results, seconds)``: ``(path, changed)`` per student, in
+    roster order, and the wall time of the whole batch.
+    """
+    start = time.perf_counter()
+    students = read_roster(roster)
+    if template is None:
+        template = BaseTemplate.default()
+    fragments, diagrams = render_fragments(template, cache_dir, diagram_cache_dir)
+    options = (weak_first, compress_level)
+    jobs = [(student, os.path.join(directory, student.output)) for student in students]
+    os.makedirs(directory, exist_ok=True)
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(template.data, fragments, options, diagrams))
+        chunksize = max(1, len(jobs) // (workers * 4))
+    else:
+        global _template, _fragments, _options
+        _template, _fragments, _options = template, fragments, options
+        pool = InlineExecutor()
+        chunksize = 1
+    with pool:
+        results = list(pool.map(assemble_student, jobs, chunksize=chunksize))
+    return results, time.perf_counter() - start
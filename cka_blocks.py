@@ -0,0 +1,211 @@
+"""Pre-render the section structure ``script.js`` used to build at startup.
+
+On load the script wrapped ``#intro`` and every ``h2#section-NN`` (with
+the siblings up to the next ``h2``) in ``.content-block`` divs, gave ids to
+``h3`` headings without one, wrapped each section link in the navigation
+in a ``.nav-item`` with a submenu of those headings, and added a
+``.section-action-bar`` with a reading-time estimate to every block.
+``prewrap_page()`` writes that markup into the page instead, so the
+script only attaches delegated listeners and applies saved progress.
+The script still builds whatever a page does not already contain.
+
+``split_blocks()`` then moves each section's content into a fragment of
+its own. The page keeps every block's heading and action bar, which is
+all the navigation, search and progress tracking need, and the script
+fetches a block's content when it is first opened.
+"""
+
+import hashlib
+import html
+import re
+from html.parser import HTMLParser
+
+WORDS_PER_MINUTE = 200
+
+_VOID = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source',
+                   'track', 'wbr'))
+_NEWLINE = re.compile(r'\n')
+
+
+class _Element:
+    __slots__ = ('tag', 'attrs', 'start', 'open_end', 'end', 'parent', 'children', 'text')
+
+    def __init__(self, tag, attrs, start, open_end, parent):
+        self.tag = tag
+        self.attrs = attrs
+        self.start = start
+        self.open_end = open_end
+        self.end = open_end
+        self.parent = parent
+        self.children = []
+        self.text = []
+
+
+class _Tree(HTMLParser):
+    """Element tree of a page with the source offsets of every element."""
+
+    def __init__(self, page):
+        super().__init__(convert_charrefs=True)
+        self._lines = [0] + [match.end() for match in _NEWLINE.finditer(page)]
+        self._page = page
+        self.root = _Element(None, {}, 0, 0, None)
+        self.elements = []
+        self._open = [self.root]
+        self.feed(page)
+        self.close()
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self._lines[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        element = _Element(tag, dict(attrs), start, start + len(self.get_starttag_text()), self._open[-1])
+        self._open[-1].children.append(element)
+        self.elements.append(element)
+        if tag not in _VOID:
+            self._open.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID:
+            self._open.pop()
+
+    def handle_endtag(self, tag):
+        if not any(element.tag == tag for element in self._open[1:]):
+            return
+        end = self._page.index('>', self._offset()) + 1
+        while True:
+            element = self._open.pop()
+            element.end = end
+            if element.tag == tag:
+                break
+
+    def handle_data(self, data):
+        for element in self._open[1:]:
+            element.text.append(data)
+
+    def text(self, element):
+        return ''.join(element.text)
+
+
+def _walk(element):
+    yield element
+    for child in element.children:
+        yield from _walk(child)
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def _action_bar(sid, minutes):
+    return (f'<div class="section-action-bar" id="sab-{sid}" data-sid="{sid}">'
+            '<span class="sab-label">Section</span>'
+            '<button type="button" class="sab-btn sab-complete" title="Mark as complete (C)">✅ Complete</button>'
+            '<button type="button" class="sab-btn sab-bookmark" title="Bookmark this section (B)">🔖 Bookmark</button>'
+            '<button type="button" class="sab-btn sab-notes" title="Open notes (N)">📝 Notes</button>'
+            f'<span class="reading-time">~{minutes} min read</span></div>')
+
+
+def _sections(tree):
+    """Yield ``(h2, [h2 and its following siblings])`` for every ``h2#section-*`` block."""
+    for h2 in tree.elements:
+        if h2.tag != 'h2' or not h2.attrs.get('id', '').startswith('section-'):
+            continue
+        siblings = h2.parent.children
+        block = [h2]
+        for sibling in siblings[siblings.index(h2) + 1:]:
+            if sibling.tag == 'h2':
+                break
+            block.append(sibling)
+        yield h2, block
+
+
+def prewrap_page(page):
+    """Return ``page`` with its blocks, heading ids, submenus and action bars written out.
+
+    A page that already has ``.content-block`` divs is returned unchanged.
+    """
+    if re.search(r'class="content-block\b', page):
+        return page
+    tree = _Tree(page)
+    edits = []  # (offset, order, text)
+
+    intro = next((element for element in tree.elements if element.attrs.get('id') == 'intro'), None)
+    if intro is not None:
+        edits += [(intro.start, 1, '<div id="block-intro" class="content-block is-open">'),
+                  (intro.end, 0, '</div>')]
+
+    submenus = {}
+    for h2, block in _sections(tree):
+        sid = h2.attrs['id']
+        headings = []
+        for h3 in (e for element in block for e in _walk(element) if e.tag == 'h3'):
+            text = tree.text(h3)
+            anchor = h3.attrs.get('id')
+            if not anchor:
+                anchor = f'{sid}-{_slug(text)}'
+                edits.append((h3.open_end - 1, 0, f' id="{html.escape(anchor)}"'))
+            headings.append((anchor, text))
+        submenus[sid] = headings
+
+        # Word count as the script measured it: the text of the elements it
+        # moved into the block.
+        words = len(''.join(tree.text(element) for element in block).split())
+        minutes = max(1, round(words / WORDS_PER_MINUTE))
+        edits += [(h2.start, 1, f'<div id="block-{sid}" class="content-block">'),
+                  (h2.end, 0, _action_bar(sid, minutes)),
+                  (block[-1].end, 0, '</div>')]
+
+    nav = next((element for element in tree.elements if element.attrs.get('id') == 'nav'), None)
+    for link in (nav.children if nav is not None else ()):
+        sid = link.attrs.get('href', '')[1:]
+        if link.tag != 'a' or sid not in submenus:
+            continue
+        menu = ''
+        if submenus[sid]:
+            menu = '<div class="nav-submenu">' + ''.join(
+                f'<a href="#{html.escape(anchor)}" class="nav-sub-link">{html.escape(text, quote=False)}</a>'
+                for anchor, text in submenus[sid]) + '</div>'
+        edits += [(link.start, 1, '<div class="nav-item">'), (link.end, 0, menu + '</div>')]
+
+    # At the same offset closing tags go before opening ones, so adjacent
+    # blocks do not nest.
+    out = []
+    position = 0
+    for offset, _, text in sorted(edits, key=lambda edit: edit[:2]):
+        out += [page[position:offset], text]
+        position = offset
+    out.append(page[position:])
+    return ''.join(out)
+
+
+def split_blocks(page, prefix='sections/'):
+    """Move the content of every section block out of ``page``.
+
+    Returns ``(shell, {file name: fragment})``. Each block keeps its
+    ``h2`` and action bar and gets a ``data-src`` of ``prefix`` plus its
+    file name, with a content hash as the query string. Blocks that were
+    not pre-rendered by ``prewrap_page()`` are left whole.
+    """
+    tree = _Tree(page)
+    fragments = {}
+    out = []
+    position = 0
+    for block in tree.elements:
+        sid = block.attrs.get('id', '')[len('block-'):]
+        if block.tag != 'div' or not sid.startswith('section-') or len(block.children) < 3:
+            continue
+        h2, bar = block.children[:2]
+        if h2.tag != 'h2' or bar.attrs.get('class') != 'section-action-bar':
+            continue
+        close = page.rindex('</div>', 0, block.end)
+        name = f'{sid}.html'
+        fragments[name] = page[bar.end:close]
+        version = hashlib.sha256(fragments[name].encode('utf-8')).hexdigest()[:12]
+        out += [page[position:block.open_end - 1], f' data-src="{prefix}{name}?v={version}">',
+                page[block.open_end:bar.end]]
+        position = close
+    out.append(page[position:])
+    return ''.join(out), fragments
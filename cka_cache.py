@@ -0,0 +1,164 @@
+"""Caches that make repeated builds of the cheat sheet cheap.
+
+``FragmentCache`` stores every top-level section as a rendered WordprocessingML
+fragment, keyed by a hash of the section's content plus the builder's style
+configuration (``DocumentBuilder.config_key()``). A rebuild only re-renders
+sections whose key changed and splices the rest back in unchanged.
+``MemoryFragmentCache`` keeps the fragments in memory as well, for
+long-lived processes such as the generation server (``cka_server``).
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+import threading
+
+from cka_model import fingerprint
+
+
+def write_atomic(path, data):
+    """Write ``data`` to ``path`` so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def write_if_changed(path, write):
+    """Write ``path`` through ``write(stream)`` unless its content is unchanged.
+
+    ``write`` fills a temporary file next to ``path``, which replaces
+    ``path`` only if their SHA-256 digests differ. An unchanged output keeps
+    its mtime, so sync and publish steps downstream see nothing to do.
+    Returns whether ``path`` was replaced.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    replaced = False
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        try:
+            current = os.stat(path)
+        except FileNotFoundError:
+            mode = 0o644
+        else:
+            if current.st_size == os.path.getsize(tmp) and _file_digest(path) == _file_digest(tmp):
+                return False
+            mode = stat.S_IMODE(current.st_mode)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+        replaced = True
+        return True
+    finally:
+        if not replaced:
+            os.unlink(tmp)
+
+
+class FragmentCache:
+    """Per-section cache of rendered document fragments."""
+
+    def __init__(self, directory):
+        self.root = directory
+        self.directory = os.path.join(directory, 'fragments')
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, builder, node):
+        key = fingerprint(node, builder.config_key())
+        return os.path.join(self.directory, key[:2], key + '.xml')
+
+    def load(self, builder, node):
+        """Return the cached fragment for ``node``, or ``None``."""
+        try:
+            with open(self.path(builder, node), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def lookup(self, builder, node):
+        """Return ``(fragment, hit)`` for ``node``, rendering and storing it on a miss.
+
+        A miss renders into ``builder``'s document; a hit leaves it untouched.
+        """
+        data = self.load(builder, node)
+        if data is not None:
+            self._count(hit=True)
+            return data, True
+        data = builder.render_fragment(node)
+        self.store(builder, node, data)
+        self._count(hit=False)
+        return data, False
+
+    def fragment(self, builder, node):
+        """Return the fragment for ``node``, rendering and storing it on a miss."""
+        return self.lookup(builder, node)[0]
+
+    def _count(self, hit):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def store(self, builder, node, data):
+        write_atomic(self.path(builder, node), data)
+
+    def render(self, builder, node):
+        """Render ``node`` into ``builder``, reusing a cached fragment if possible."""
+        data, hit = self.lookup(builder, node)
+        if hit:
+            builder.append_fragment(data)
+
+
+class MemoryFragmentCache(FragmentCache):
+    """``FragmentCache`` held in memory, for long-lived processes.
+
+    Fragments are looked up in memory first and, when ``directory`` is
+    given, in the on-disk cache next; new fragments go to both. Safe to
+    share between threads.
+    """
+
+    def __init__(self, directory=None):
+        self.root = directory
+        self.directory = None if directory is None else os.path.join(directory, 'fragments')
+        self.hits = 0
+        self.misses = 0
+        self._fragments = {}
+        self._lock = threading.Lock()
+
+    def load(self, builder, node):
+        key = fingerprint(node, builder.config_key())
+        with self._lock:
+            data = self._fragments.get(key)
+        if data is None and self.directory is not None:
+            data = super().load(builder, node)
+            if data is not None:
+                with self._lock:
+                    self._fragments[key] = data
+        return data
+
+    def _count(self, hit):
+        with self._lock:
+            super()._count(hit)
+
+    def store(self, builder, node, data):
+        with self._lock:
+            self._fragments[fingerprint(node, builder.config_key())] = data
+        if self.directory is not None:
+            super().store(builder, node, data)
@@ -0,0 +1,142 @@
+"""Build-time syntax highlighting and copy buttons for code blocks.
+
+``code_block()`` returns the ``<pre>`` markup ``script.js`` used to build
+in the browser: a copy button first (its icon refers to ``ICON_SPRITE``,
+which the page must include once), then the code with ``cs-*`` spans
+for strings, comments, YAML keys, keywords, flags and ``# === ... ===``
+section lines. The page's click handler for ``.copy-btn`` is delegated, so
+pre-rendered blocks need no per-block script. ``script.js`` still
+highlights any ``<pre>`` without the ``data-highlighted`` attribute.
+
+The highlighter tokenises each line in one pass, so spans never nest and
+placeholders such as ``<pod>`` stay text. Results are cached by a hash of
+the snippet (and ``VERSION``); ``load_cache()``/``save_cache()`` keep that
+cache on disk between builds.
+"""
+
+import hashlib
+import html
+import json
+import re
+import threading
+
+VERSION = 1  # bump when the markup changes
+
+KEYWORDS = ('apiVersion', 'kind', 'metadata', 'spec', 'status', 'selector', 'containers', 'volumes',
+            'template', 'matchLabels', 'strategy', 'replicas', 'serviceAccountName', 'nodeSelector',
+            'tolerations', 'resources', 'requests', 'limits', 'livenessProbe', 'readinessProbe',
+            'securityContext', 'capabilities', 'env', 'envFrom', 'volumeMounts', 'image', 'name',
+            'kubectl', 'k')
+
+# The icon is defined once per page (``ICON_SPRITE``) and referenced from
+# every button.
+ICON_SPRITE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" style="display: none"><symbol id="icon-copy" viewBox="0 0 16 16">'
+    '<path d="M0 6.75C0 5.784.784 5 1.75 5h1.5a.75.75 0 0 1 0 1.5h-1.5a.25.25 0 0 0-.25.25v7.5c0 .138.112.25.25.25h7.5a.25.25 0 0 0 .25-.25v-1.5a.75.75 0 0 1 1.5 0v1.5A1.75 1.75 0 0 1 9.25 16h-7.5A1.75 1.75 0 0 1 0 14.25Z"></path>'
+    '<path d="M5 1.75C5 .784 5.784 0 6.75 0h7.5C15.216 0 16 .784 16 1.75v7.5A1.75 1.75 0 0 1 14.25 11h-7.5A1.75 1.75 0 0 1 5 9.25Zm1.75-.25a.25.25 0 0 0-.25.25v7.5c0 .138.112.25.25.25h7.5a.25.25 0 0 0 .25-.25v-7.5a.25.25 0 0 0-.25-.25Z"></path>'
+    '</symbol></svg>'
+)
+COPY_ICON = ('<svg aria-hidden="true" height="16" viewBox="0 0 16 16" width="16" fill="currentColor">'
+             '<use href="#icon-copy"></use></svg>')
+COPY_BUTTON = ('<button type="button" class="copy-btn" aria-label="Copy code to clipboard" title="Copy">'
+               + COPY_ICON + '</button>')
+
+_SECTION = re.compile(r'# ===.*===')
+_KEY = re.compile(r'(\s*)([\w\-./]+):', re.ASCII)
+_TOKEN = re.compile(r'(?P<str>"[^"\n]*")'
+                    r'|(?P<comment>(?<!\S)#.*)'
+                    r'|(?<=\s)(?P<flag>--[\w\-]+)'
+                    r'|\b(?P<kw>' + '|'.join(KEYWORDS) + r')\b', re.ASCII)
+_CLASSES = {'str': 'cs-str', 'comment': 'cs-comment', 'flag': 'cs-flag', 'kw': 'cs-kw'}
+_PRE = re.compile(r'<pre>(\s*)<code([^>]*)>(.*?)</code>(\s*)</pre>', re.DOTALL)
+_TAG = re.compile(r'</?[A-Za-z][^>]*>')
+_BODY = re.compile(r'<body\b[^>]*>')
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _escape(text):
+    return html.escape(text, quote=False)
+
+
+def _span(cls, text):
+    return f'<span class="{cls}">{_escape(text)}</span>'
+
+
+def _line(line):
+    match = _SECTION.match(line)
+    if match:
+        return _span('cs-section', match.group()) + _escape(line[match.end():])
+    out = []
+    pos = 0
+    match = _KEY.match(line)
+    if match:
+        indent, key = match.groups()
+        out += [indent, _span('cs-kw' if key in KEYWORDS else 'cs-key', key), ':']
+        pos = match.end()
+    for token in _TOKEN.finditer(line, pos):
+        out += [_escape(line[pos:token.start()]), _span(_CLASSES[token.lastgroup], token.group())]
+        pos = token.end()
+    out.append(_escape(line[pos:]))
+    return ''.join(out)
+
+
+def snippet_key(text):
+    return hashlib.sha256(f'{VERSION}\0{text}'.encode('utf-8')).hexdigest()[:24]
+
+
+def highlight(text):
+    """Return ``text`` as escaped HTML with ``cs-*`` spans."""
+    key = snippet_key(text)
+    with _cache_lock:
+        markup = _cache.get(key)
+    if markup is None:
+        markup = '\n'.join(_line(line) for line in text.split('\n'))
+        with _cache_lock:
+            _cache[key] = markup
+    return markup
+
+
+def code_block(text, lang=None):
+    """Return a highlighted ``<pre>`` with its copy button."""
+    cls = f' class="language-{html.escape(lang)}"' if lang else ''
+    return f'<pre data-highlighted>{COPY_BUTTON}<code{cls}>{highlight(text)}</code></pre>'
+
+
+def highlight_page(page):
+    """Return ``page`` with every plain ``<pre><code>`` block pre-rendered.
+
+    The icon sprite is added at the start of ``<body>`` if a block was.
+    """
+    def rewrite(match):
+        before, attrs, inner, after = match.groups()
+        text = html.unescape(_TAG.sub('', inner))
+        return (f'<pre data-highlighted>{before}{COPY_BUTTON}<code{attrs}>{highlight(text)}</code>'
+                f'{after}</pre>')
+
+    page, count = _PRE.subn(rewrite, page)
+    if count:
+        page = _BODY.sub(lambda match: match.group() + ICON_SPRITE, page, count=1)
+    return page
+
+
+def load_cache(path):
+    """Add the snippets cached in the JSON file at ``path`` (if any)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return
+    with _cache_lock:
+        for key, markup in data.items():
+            _cache.setdefault(key, markup)
+
+
+def save_cache(path):
+    """Write the snippet cache to ``path``; returns whether it changed."""
+    from cka_cache import write_if_changed
+
+    with _cache_lock:
+        data = json.dumps(_cache, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return write_if_changed(path, lambda f: f.write(data))
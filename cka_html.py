@@ -0,0 +1,163 @@
+"""Render the CKA cheat-sheet content tree as a static HTML page.
+
+``HtmlRenderer`` mirrors ``DocumentBuilder``: ``render()`` dispatches on
+``node.kind`` and ``save()`` writes the result. The page follows the layout
+of the site's ``index.html`` (``nav#nav``, ``main``, one
+``h2#section-NN`` per section) and links ``style.css`` and ``script.js``,
+so the site's navigation, search and code-copy behaviour work unchanged.
+Code blocks are highlighted here, with their copy buttons (see
+``cka_highlight``), and the section blocks and navigation submenus are
+written out (see ``cka_blocks``), so the script only attaches listeners.
+"""
+
+import html
+import re
+
+_SECTION_NUMBER = re.compile(r'(\d+)\.\s')
+
+
+def section_id(title):
+    """Return the anchor for a section titled ``'N. ...'``: ``section-NN``."""
+    match = _SECTION_NUMBER.match(title)
+    if match:
+        return f'section-{int(match.group(1)):02d}'
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+
+
+def _text(text):
+    return html.escape(text, quote=False)
+
+
+class HtmlRenderer:
+    """Builds one HTML page from content nodes (see ``cka_model``)."""
+
+    def __init__(self, stylesheet='style.css', script='script.js'):
+        self.stylesheet = stylesheet
+        self.script = script
+        self.title = 'CKA Exam Cheat Sheet'
+        self.nav = []
+        self.body = []
+        self._in_list = False
+
+    # ── Content tree rendering ──
+    def render(self, node):
+        """Render a content node into the page."""
+        if self._in_list and node.kind != 'bullet':
+            self.body.append('</ul>')
+            self._in_list = False
+        getattr(self, '_render_' + node.kind)(node)
+
+    def _render_section(self, node):
+        self.body.append(f'\n<h2 id="{section_id(node.title)}">{_text(node.title)}</h2>')
+        for child in node.children:
+            self.render(child)
+        if self._in_list:
+            self.body.append('</ul>')
+            self._in_list = False
+
+    def _render_heading(self, node):
+        # Sections are h2 on the site, so sub-headings start one level down.
+        level = min(node.level + 1, 6)
+        self.body.append(f'<h{level}>{_text(node.text)}</h{level}>')
+
+    def _render_paragraph(self, node):
+        self.body.append(f'<p>{_text(node.text)}</p>')
+
+    def _render_code(self, node):
+        from cka_highlight import code_block
+
+        self.body.append(code_block(node.text, node.lang))
+
+    def _note(self, label, text):
+        self.body.append(f'<div class="cka-definition"><div class="cka-def-term">{label}</div>'
+                         f'<div class="cka-def-body">{_text(text)}</div></div>')
+
+    def _render_tip(self, node):
+        self._note('Tip', node.text)
+
+    def _render_exam_note(self, node):
+        self._note('Exam', node.text)
+
+    def _render_bullet(self, node):
+        if not self._in_list:
+            self.body.append('<ul>')
+            self._in_list = True
+        self.body.append(f'<li>{_text(node.text)}</li>')
+
+    def _render_scenario(self, node):
+        from cka_highlight import code_block
+
+        self.body.append(
+            '<div class="mock-question">\n'
+            f'<h4>{_text(node.title)}</h4>\n'
+            f'<p class="mock-task"><strong>Task:</strong> {_text(node.task)}</p>\n'
+            '<button type="button" class="solution-toggle" aria-expanded="false">Show solution</button>\n'
+            f'<div class="mock-solution">{code_block(node.solution, "shell")}</div>\n'
+            '</div>')
+
+    def _render_diagram(self, node):
+        caption = f'\n<figcaption>{_text(node.caption)}</figcaption>' if node.caption else ''
+        self.body.append(f'<figure class="diagram">\n'
+                         f'<img src="assets/{html.escape(node.image)}" alt="{html.escape(node.caption)}" '
+                         f'loading="lazy" style="max-width:100%;height:auto;display:block;">{caption}\n'
+                         '</figure>')
+
+    def _render_toc(self, node):
+        for item in node.items:
+            self.nav.append(f'<a href="#{section_id(item)}">{_text(item)}</a>')
+
+    def _render_title_page(self, node):
+        self.title = f'{node.title} {node.subtitle}'
+        self.body.append(
+            '<header id="intro">\n'
+            f'<h1 class="page-title">{_text(node.title)} &mdash; {_text(node.subtitle)}</h1>\n'
+            f'<p class="subtitle">{_text(node.certification)}: {_text(node.tagline)}</p>\n'
+            f'<p><em>{_text(node.summary)}</em></p>\n'
+            f'<p><strong>{_text(node.exam)}</strong><br>{_text(node.domains)}</p>\n'
+            '</header>')
+
+    # ── Output ──
+    def page(self):
+        """Return the complete HTML document."""
+        if self._in_list:
+            self.body.append('</ul>')
+            self._in_list = False
+        from cka_blocks import prewrap_page
+        from cka_highlight import ICON_SPRITE
+
+        nav = '\n'.join(self.nav)
+        body = '\n'.join(self.body)
+        return prewrap_page(f'''<!DOCTYPE html>
+<html lang="en">
+
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{_text(self.title)}</title>
+<link rel="stylesheet" href="{self.stylesheet}">
+</head>
+
+<body>
+{ICON_SPRITE}
+<div class="layout">
+<nav id="nav" aria-label="Section navigation">
+<div class="nav-header"><span class="nav-section">CKA Cheat Sheet</span></div>
+{nav}
+</nav>
+<main>
+{body}
+</main>
+</div>
+<script src="{self.script}"></script>
+</body>
+
+</html>
+''')
+
+    def save(self, path_or_stream):
+        data = self.page().encode('utf-8')
+        if hasattr(path_or_stream, 'write'):
+            path_or_stream.write(data)
+        else:
+            with open(path_or_stream, 'wb') as f:
+                f.write(data)
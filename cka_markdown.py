@@ -0,0 +1,102 @@
+"""Render the CKA cheat-sheet content tree as GitHub-flavoured Markdown.
+
+``MarkdownRenderer`` mirrors ``DocumentBuilder``: ``render()`` dispatches
+on ``node.kind`` and ``save()`` writes the result.
+"""
+
+import re
+
+from cka_html import section_id
+
+
+def _inline(text):
+    # Placeholders such as <namespace> would otherwise be read as HTML tags.
+    return text.replace('<', '\\<')
+
+
+def _fence(text):
+    # A fence must be longer than any run of backticks inside the block.
+    longest = max((len(run) for run in re.findall(r'`+', text)), default=0)
+    return '`' * max(3, longest + 1)
+
+
+class MarkdownRenderer:
+    """Builds one Markdown document from content nodes (see ``cka_model``)."""
+
+    def __init__(self):
+        self.blocks = []
+        self._in_list = False
+
+    # ── Content tree rendering ──
+    def render(self, node):
+        """Render a content node into the document."""
+        if self._in_list and node.kind != 'bullet':
+            self._in_list = False
+        getattr(self, '_render_' + node.kind)(node)
+
+    def _render_section(self, node):
+        # Section titles and table-of-contents entries differ in wording, so
+        # link them through the same numbered anchors the HTML page uses.
+        self.blocks.append(f'<a id="{section_id(node.title)}"></a>\n\n## {_inline(node.title)}')
+        for child in node.children:
+            self.render(child)
+        self._in_list = False
+
+    def _render_heading(self, node):
+        self.blocks.append('#' * min(node.level + 1, 6) + ' ' + _inline(node.text))
+
+    def _render_paragraph(self, node):
+        self.blocks.append(_inline(node.text))
+
+    def _render_code(self, node):
+        fence = _fence(node.text)
+        self.blocks.append(f'{fence}{node.lang}\n{node.text}\n{fence}')
+
+    def _render_tip(self, node):
+        self.blocks.append(f'> **TIP:** {_inline(node.text)}')
+
+    def _render_exam_note(self, node):
+        self.blocks.append(f'> **EXAM:** {_inline(node.text)}')
+
+    def _render_bullet(self, node):
+        # Consecutive bullets form one list rather than one list per item.
+        if self._in_list:
+            self.blocks[-1] += f'\n- {_inline(node.text)}'
+        else:
+            self.blocks.append(f'- {_inline(node.text)}')
+            self._in_list = True
+
+    def _render_scenario(self, node):
+        fence = _fence(node.solution)
+        self.blocks.append(f'### {_inline(node.title)}')
+        self.blocks.append(f'**Task:** {_inline(node.task)}')
+        self.blocks.append(f'**Solution:**\n\n{fence}shell\n{node.solution}\n{fence}')
+
+    def _render_diagram(self, node):
+        alt = node.caption.replace('[', '\\[').replace(']', '\\]')
+        block = f'![{alt}](assets/{node.image})'
+        if node.caption:
+            block += f'\n\n*{_inline(node.caption)}*'
+        self.blocks.append(block)
+
+    def _render_toc(self, node):
+        self.blocks.append('## Table of Contents')
+        self.blocks.append('\n'.join(f'- [{_inline(item)}](#{section_id(item)})' for item in node.items))
+
+    def _render_title_page(self, node):
+        self.blocks.append(f'# {node.title} — {node.subtitle}')
+        self.blocks.append(f'**{node.certification}**: {node.tagline}\n\n*{node.summary}*')
+        self.blocks.append(f'> **{node.exam}**  \n> {node.domains}')
+
+    # ── Output ──
+    def text(self):
+        """Return the complete Markdown document."""
+        return '\n\n'.join(self.blocks) + '\n'
+
+    def save(self, path_or_stream):
+        data = self.text().encode('utf-8')
+        if hasattr(path_or_stream, 'write'):
+            path_or_stream.write(data)
+        else:
+            with open(path_or_stream, 'wb') as f:
+                f.write(data)
@@ -0,0 +1,229 @@
+"""Declarative content model for the CKA cheat sheet.
+
+The sheet is a tree of small, immutable-by-convention nodes. Renderers (the
+docx ``DocumentBuilder`` and friends) walk the tree and dispatch on
+``node.kind``; nothing here knows about any output format.
+
+Every node uses ``__slots__`` and stores children as tuples, so thousands of
+sheet variants can be held in memory cheaply. ``node.key()`` returns a plain
+nested tuple describing the node, which is what equality and content
+hashing are based on.
+"""
+
+import hashlib
+import os
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+
+
+class Node:
+    """Base class for content nodes."""
+
+    __slots__ = ()
+    kind = 'node'
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Collect slot names along the MRO so subclasses that add no slots
+        # of their own (e.g. Yaml) still describe all of their fields.
+        cls._fields = tuple(name for klass in reversed(cls.__mro__)
+                            for name in klass.__dict__.get('__slots__', ()))
+
+    def key(self):
+        """Return a nested tuple that fully describes this node."""
+        return (self.kind,) + tuple(_key(getattr(self, name)) for name in self._fields)
+
+    def replace(self, **changes):
+        """Return a copy of this node with the given fields changed."""
+        clone = object.__new__(type(self))
+        for name in self._fields:
+            setattr(clone, name, changes.pop(name, getattr(self, name)))
+        if changes:
+            raise TypeError(f'{type(self).__name__} has no field(s): {", ".join(changes)}')
+        return clone
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        args = ', '.join(repr(getattr(self, name)) for name in self._fields)
+        return f'{type(self).__name__}({args})'
+
+
+def _key(value):
+    if isinstance(value, Node):
+        return value.key()
+    if isinstance(value, tuple):
+        return tuple(_key(item) for item in value)
+    return value
+
+
+class Section(Node):
+    """A top-level numbered section: an H1 title followed by its content."""
+
+    __slots__ = ('title', 'children', 'page_break')
+    kind = 'section'
+
+    def __init__(self, title, children, page_break=True):
+        self.title = title
+        self.children = tuple(children)
+        self.page_break = page_break
+
+
+class Heading(Node):
+    __slots__ = ('text', 'level')
+    kind = 'heading'
+
+    def __init__(self, text, level=2):
+        self.text = text
+        self.level = level
+
+
+class Paragraph(Node):
+    __slots__ = ('text',)
+    kind = 'paragraph'
+
+    def __init__(self, text):
+        self.text = text
+
+
+class Code(Node):
+    """A code block; ``lang`` is a hint for renderers that highlight."""
+
+    __slots__ = ('text', 'lang')
+    kind = 'code'
+
+    def __init__(self, text, lang='shell'):
+        self.text = text
+        self.lang = lang
+
+
+class Yaml(Code):
+    __slots__ = ()
+
+    def __init__(self, text):
+        super().__init__(text, 'yaml')
+
+    def __repr__(self):
+        return f'Yaml({self.text!r})'
+
+
+class Tip(Node):
+    __slots__ = ('text',)
+    kind = 'tip'
+
+    def __init__(self, text):
+        self.text = text
+
+
+class ExamNote(Node):
+    __slots__ = ('text',)
+    kind = 'exam_note'
+
+    def __init__(self, text):
+        self.text = text
+
+
+class Bullet(Node):
+    __slots__ = ('text',)
+    kind = 'bullet'
+
+    def __init__(self, text):
+        self.text = text
+
+
+class Scenario(Node):
+    """A practice question: title, task statement and solution commands.
+
+    Unpacks, indexes and has the length of the ``(title, task, solution)``
+    tuples it replaces.
+    """
+
+    __slots__ = ('title', 'task', 'solution')
+    kind = 'scenario'
+
+    def __init__(self, title, task, solution):
+        self.title = title
+        self.task = task
+        self.solution = solution
+
+    def _astuple(self):
+        return self.title, self.task, self.solution
+
+    def __iter__(self):
+        return iter(self._astuple())
+
+    def __getitem__(self, index):
+        return self._astuple()[index]
+
+    def __len__(self):
+        return 3
+
+
+class Diagram(Node):
+    """A figure from ``assets/``: ``image`` is its file name there."""
+
+    __slots__ = ('image', 'caption')
+    kind = 'diagram'
+
+    def __init__(self, image, caption=''):
+        self.image = image
+        self.caption = caption
+
+    def key(self):
+        # Include the image's bytes, so content-keyed caches notice a diagram
+        # that was redrawn under the same file name.
+        return super().key() + (asset_digest(self.image),)
+
+
+class TitlePage(Node):
+    __slots__ = ('title', 'subtitle', 'certification', 'tagline', 'summary', 'exam', 'domains')
+    kind = 'title_page'
+
+    def __init__(self, title, subtitle, certification, tagline, summary, exam, domains):
+        self.title = title
+        self.subtitle = subtitle
+        self.certification = certification
+        self.tagline = tagline
+        self.summary = summary
+        self.exam = exam
+        self.domains = domains
+
+
+class TableOfContents(Node):
+    __slots__ = ('items',)
+    kind = 'toc'
+
+    def __init__(self, items):
+        self.items = tuple(items)
+
+
+_asset_digests = {}
+
+
+def asset_digest(name):
+    """Return the SHA-256 of ``assets/<name>``, re-reading it only after it changes."""
+    path = os.path.join(ASSETS_DIR, name)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _asset_digests.get(name)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'rb') as f:
+            cached = _asset_digests[name] = (stamp, hashlib.sha256(f.read()).hexdigest())
+    return cached[1]
+
+
+def walk(node):
+    """Yield ``node`` and all of its descendants, depth first."""
+    yield node
+    for child in getattr(node, 'children', ()):
+        yield from walk(child)
+
+
+def fingerprint(node, *extra):
+    """Return a stable hex digest of ``node``'s content (plus ``extra``)."""
+    return hashlib.sha256(repr((node.key(),) + extra).encode('utf-8')).hexdigest()
@@ -0,0 +1,314 @@
+"""Write python-docx packages as zip files, compressing in parallel.
+
+``write_package()`` replaces python-docx's one-part-at-a-time zip writer:
+
+- media parts that are already compressed (PNG, JPEG, ...) are stored as
+  they are instead of being deflated a second time, unless a quick sample
+  shows they still shrink (e.g. the blank template thumbnail, or diagrams
+  whose margins compress). Those are deflated in one piece, which keeps
+  them exactly as small as a single-stream deflate would;
+- everything else is deflated in 128 KiB chunks across a thread pool (zlib
+  releases the GIL). As in pigz, each chunk is primed with the 32 KiB
+  before it, so one large ``document.xml`` spreads over every core and the
+  output stays the same size as a single-stream deflate. The chunks are
+  the same with a single worker, so the output does not depend on the
+  number of CPUs;
+- the compression level is configurable.
+"""
+
+import contextlib
+import os
+import struct
+import time
+import zlib
+
+DEFAULT_LEVEL = 6
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+CHUNK_SIZE = 128 * 1024
+_WINDOW = 32 * 1024
+_SAMPLE = 16 * 1024
+
+# Extensions of parts whose data is already compressed.
+STORED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.wdp', '.jxr', '.mp3', '.mp4'})
+
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+_DESCRIPTOR_FLAG = 0x8
+_UTF8_FLAG = 0x800
+
+
+def package_parts(package, exclude=()):
+    """Yield ``(member name, data)`` for everything in a python-docx package.
+
+    Items come in the order python-docx's ``PackageWriter`` writes them.
+    Parts in ``exclude`` are not serialised and come with ``None`` as data;
+    their relationships are included as usual.
+    """
+    from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    from docx.opc.pkgwriter import _ContentTypesItem
+
+    parts = list(package.iter_parts())
+    for part in parts:
+        part.before_marshal()
+    yield CONTENT_TYPES_URI.membername, _ContentTypesItem.from_parts(parts).blob
+    yield PACKAGE_URI.rels_uri.membername, package.rels.xml
+    for part in parts:
+        yield part.partname.membername, None if part in exclude else part.blob
+        if len(part.rels):
+            yield part.partname.rels_uri.membername, part.rels.xml
+
+
+def should_store(name, data, level=DEFAULT_LEVEL):
+    """Return whether member ``name`` is better kept without compression.
+
+    True for media formats that are already compressed, unless deflating a
+    sample from the start, middle or end of ``data`` at ``level`` makes it
+    any smaller: images often compress only in their flat margins. Deflated
+    members are kept only if they are smaller than ``data`` (see
+    ``ZipWriter.write()``), so the output is never bigger for trying.
+    """
+    if not _is_media(name):
+        return False
+    for start in (0, max(0, len(data) - _SAMPLE) // 2, max(0, len(data) - _SAMPLE)):
+        sample = data[start:start + _SAMPLE]
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        if len(compressor.compress(sample) + compressor.flush()) < len(sample):
+            return False
+    return True
+
+
+def _is_media(name):
+    return os.path.splitext(name)[1].lower() in STORED_EXTENSIONS
+
+
+def _chunks(name, data):
+    """Return the ``(start, end)`` ranges member ``name`` is deflated in."""
+    if _is_media(name):
+        # Sync flushes would cost a few bytes per chunk on data that hardly
+        # compresses, so media are deflated in one piece.
+        return [(0, len(data))]
+    return [(start, start + CHUNK_SIZE) for start in range(0, len(data), CHUNK_SIZE)]
+
+
+def _deflate(data, start, end, level):
+    """Deflate ``data[start:end]`` as part of a raw deflate stream."""
+    return _deflate_chunk(data[max(0, start - _WINDOW):start], data[start:end], level, end >= len(data))
+
+
+def _deflate_chunk(window, chunk, level, last):
+    """Deflate ``chunk``, primed with the ``window`` of data before it."""
+    if window:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=window)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    out = compressor.compress(chunk)
+    # A sync flush ends the chunk on a byte boundary without ending the
+    # stream, so the chunks can simply be concatenated.
+    return out + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def deflate(name, data, level):
+    """Deflate member ``name`` on the calling thread, in the chunks ``write_package()`` uses."""
+    return b''.join(_deflate(data, start, end, level) for start, end in _chunks(name, data))
+
+
+def source_date():
+    """Return the timestamp stamped on every zip member and document.
+
+    Builds are reproducible: this is ``SOURCE_DATE_EPOCH`` (UTC) when set,
+    as in other reproducible-build tooling, and otherwise the zip epoch,
+    1980-01-01 00:00:00.
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return max(time.gmtime(int(epoch))[:6], FIXED_DATE_TIME)
+    return FIXED_DATE_TIME
+
+
+def _dos_time(date_time):
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11 | minute << 5 | second // 2), ((year - 1980) << 9 | month << 5 | day)
+
+
+class ZipWriter:
+    """Writes zip members one after another to a binary stream.
+
+    Members get the same headers and permissions as ``ZipFile.writestr``,
+    but every one carries the same ``date_time`` and payloads may arrive
+    already deflated. On a stream that cannot seek (e.g. a socket), members
+    written through ``open()`` are followed by a data descriptor instead of
+    having their local header patched.
+    """
+
+    def __init__(self, stream, date_time=None):
+        self._out = stream
+        self._seekable = getattr(stream, 'seekable', lambda: False)()
+        self._offset = stream.tell() if self._seekable else 0
+        self._central = []
+        self._time, self._date = _dos_time(date_time or source_date())
+
+    def add(self, name, data, level=DEFAULT_LEVEL):
+        """Add member ``name``, deflating ``data`` unless storing it is better."""
+        deflated = None
+        if level and data and not should_store(name, data, level):
+            deflated = deflate(name, data, level)
+        self.write(name, data, deflated)
+
+    def write(self, name, data, deflated=None):
+        """Add member ``name``; ``deflated`` is ``data`` as raw deflate, if compressed.
+
+        ``data`` is stored as is when deflating did not make it smaller.
+        """
+        if deflated is None or len(deflated) >= len(data):
+            self._add(name, _ZIP_STORED, zlib.crc32(data), len(data), data)
+        else:
+            self._add(name, _ZIP_DEFLATED, zlib.crc32(data), len(data), deflated)
+
+    @contextlib.contextmanager
+    def open(self, name, level=DEFAULT_LEVEL):
+        """Yield a file-like member that is deflated as it is written.
+
+        The local header is written with placeholder sizes and patched once
+        the member is complete (or, without seeking, followed by a data
+        descriptor), so its data never has to be held in memory. The data is
+        deflated in the same chunks as by ``add()``, so both give the same
+        bytes. Level 0 stores the data on a seekable stream, as ``add()``
+        does.
+        """
+        stored = level == 0 and self._seekable
+        method = _ZIP_STORED if stored else _ZIP_DEFLATED
+        member = _DeflatingMember(self._out, None if stored else level)
+        start = self._offset
+        flags = 0 if self._seekable else _DESCRIPTOR_FLAG
+        header = self._write_header(name, method, 0, 0, 0, flags)
+        yield member
+        member.flush()
+        size = member.compressed
+        if self._seekable:
+            self._out.seek(start)
+            self._write_header(name, method, member.crc, size, member.size)
+            self._out.seek(0, os.SEEK_END)
+            end = start + header + size
+        else:
+            self._out.write(struct.pack('<IIII', 0x08074B50, member.crc, size, member.size))
+            end = start + header + size + 16
+        self._central_entry(name, method, member.crc, size, member.size, start, flags)
+        self._offset = end
+
+    def _add(self, name, method, crc, size, payload):
+        start = self._offset
+        header = self._write_header(name, method, crc, len(payload), size)
+        self._out.write(payload)
+        self._central_entry(name, method, crc, len(payload), size, start)
+        self._offset = start + header + len(payload)
+
+    def _write_header(self, name, method, crc, compressed, size, flags=0):
+        encoded = name.encode('utf-8')
+        if self._offset + compressed > 0xFFFFFFFF or size > 0xFFFFFFFF:
+            raise ValueError('package too large for a zip without ZIP64 extensions')
+        header = struct.pack('<IHHHHHIIIHH', 0x04034B50, 20, _flags(encoded) | flags, method, self._time,
+                             self._date, crc, compressed, size, len(encoded), 0) + encoded
+        self._out.write(header)
+        return len(header)
+
+    def _central_entry(self, name, method, crc, compressed, size, offset, flags=0):
+        encoded = name.encode('utf-8')
+        self._central.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014B50, 0x0314, 20, _flags(encoded) | flags,
+                                         method, self._time, self._date, crc, compressed, size,
+                                         len(encoded), 0, 0, 0, 0, 0o600 << 16, offset) + encoded)
+
+    def close(self):
+        """Write the central directory; the stream itself is left open."""
+        directory = b''.join(self._central)
+        self._out.write(directory)
+        self._out.write(struct.pack('<IHHHHIIH', 0x06054B50, 0, 0, len(self._central),
+                                    len(self._central), len(directory), self._offset, 0))
+
+
+class _DeflatingMember:
+    # Holds back up to one chunk, since the last chunk is finished
+    # differently and which one is last is only known at flush().
+    def __init__(self, out, level):
+        self.level = level  # None stores the data as it is
+        self.crc = 0
+        self.size = 0
+        self.compressed = 0
+        self._out = out
+        self._window = b''
+        self._pending = bytearray()
+
+    def write(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        if self.level is None:
+            self._emit(data)
+            return
+        self._pending += data
+        while len(self._pending) > CHUNK_SIZE:
+            chunk = bytes(self._pending[:CHUNK_SIZE])
+            del self._pending[:CHUNK_SIZE]
+            self._emit(_deflate_chunk(self._window, chunk, self.level, False))
+            self._window = (self._window + chunk)[-_WINDOW:]
+
+    def flush(self):
+        if self.level is not None:
+            self._emit(_deflate_chunk(self._window, bytes(self._pending), self.level, True))
+            self._pending.clear()
+
+    def _emit(self, data):
+        self.compressed += len(data)
+        self._out.write(data)
+
+
+def _flags(encoded_name):
+    return 0 if encoded_name.isascii() else _UTF8_FLAG
+
+
+def write_package(path_or_stream, items, level=None, workers=None, date_time=None):
+    """Write ``(member name, data)`` ``items`` as a zip to a path or stream.
+
+    ``level`` is the zlib compression level (``DEFAULT_LEVEL`` if ``None``,
+    0 stores everything). ``workers`` caps the compression threads and
+    defaults to the number of CPUs; with one worker each part is deflated
+    in one piece on the calling thread. ``date_time`` is the timestamp given
+    to every member (``source_date()`` by default).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if level is None:
+        level = DEFAULT_LEVEL
+    if workers is None:
+        workers = os.cpu_count() or 1
+    items = [(name, bytes(data)) for name, data in items]
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    # Queue every chunk of every compressible part up front, then write the
+    # parts in order as their chunks complete.
+    jobs = []
+    for name, data in items:
+        if level == 0 or not data or should_store(name, data, level):
+            jobs.append(None)
+        elif pool is None:
+            jobs.append(())  # deflated when written
+        else:
+            jobs.append([pool.submit(_deflate, data, start, end, level) for start, end in _chunks(name, data)])
+
+    if hasattr(path_or_stream, 'write'):
+        out, close = path_or_stream, False
+    else:
+        out, close = open(path_or_stream, 'wb'), True
+    try:
+        writer = ZipWriter(out, date_time)
+        for (name, data), chunks in zip(items, jobs):
+            if chunks is None:
+                writer.write(name, data)
+            elif chunks:
+                writer.write(name, data, b''.join(chunk.result() for chunk in chunks))
+            else:
+                writer.add(name, data, level)
+        writer.close()
+    finally:
+        if close:
+            out.close()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
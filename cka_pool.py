@@ -0,0 +1,32 @@
+"""Executor helpers shared by the builds that fan work out to processes.
+
+Kept free of heavy imports so image, publishing and document builds can
+all use it without loading each other's dependencies.
+"""
+
+from concurrent.futures import Future
+
+
+class InlineExecutor:
+    """Executor stand-in that runs tasks in the calling process.
+
+    Used when only one worker is available, where a process pool would add
+    start-up and pickling cost without any parallelism.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, iterable, chunksize=1):
+        return map(fn, iterable)
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
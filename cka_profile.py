@@ -0,0 +1,179 @@
+"""Opt-in timing spans for the docx builder (``--profile``).
+
+``Profiler.instrument()`` wraps one ``DocumentBuilder``'s helpers and
+rendering entry points on that instance only, so builds that are not
+profiled pay nothing. Every top-level node (title page, TOC, each numbered
+section) becomes a ``section`` span and every helper call a ``helper`` span
+nested inside it. Each span records the body elements and serialised XML
+bytes it added.
+
+``write_trace()`` exports Chrome trace-event JSON (open it in Perfetto or
+chrome://tracing) and ``summary()`` returns a sorted text report. Time the
+profiler spends counting elements and bytes is taken off the clock, so
+span durations reflect the builder alone.
+"""
+
+import json
+import os
+import time
+
+# Builder methods that get a span of their own.
+HELPERS = (
+    'add_heading', 'add_paragraph', 'add_code', 'add_yaml', 'add_tip',
+    'add_exam_note', 'add_bullet', 'add_section_break', 'add_diagram', 'append_fragment',
+)
+
+
+class Span:
+    __slots__ = ('name', 'category', 'start', 'end', 'elements', 'bytes', 'child_time')
+
+    def __init__(self, name, category, start):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.end = None
+        self.elements = 0
+        self.bytes = 0
+        self.child_time = 0.0
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    @property
+    def self_time(self):
+        return self.duration - self.child_time
+
+
+class Profiler:
+    """Collects spans from the builders it instruments."""
+
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+        self._overhead = 0.0
+        self._ns_overhead = None
+
+    def _clock(self):
+        return time.perf_counter() - self._overhead
+
+    # ── Instrumentation ──
+    def instrument(self, builder, cache=None):
+        """Wrap ``builder`` (and ``cache.render``) so their calls are timed."""
+        for name in HELPERS:
+            setattr(builder, name, self._wrap(builder, name, 'helper', getattr(builder, name)))
+        render = builder.render
+
+        def render_node(node):
+            if self._in_section():
+                return render(node)
+            return self._call(builder, _node_name(node), 'section', render, node)
+
+        builder.render = render_node
+        save = builder.save
+
+        def save_document(path_or_stream):
+            span = Span('save', 'phase', self._clock())
+            save(path_or_stream)
+            span.end = self._clock()
+            if hasattr(path_or_stream, 'tell'):
+                span.bytes = path_or_stream.tell()
+            else:
+                span.bytes = os.path.getsize(path_or_stream)
+            self.spans.append(span)
+
+        builder.save = save_document
+        if cache is not None:
+            cache_render = cache.render
+
+            def render_cached(target, node):
+                if target is not builder or self._in_section():
+                    return cache_render(target, node)
+                return self._call(builder, _node_name(node), 'section', cache_render, target, node)
+
+            cache.render = render_cached
+        return builder
+
+    def _in_section(self):
+        return any(span.category == 'section' for span in self._stack)
+
+    def _wrap(self, builder, name, category, method):
+        def wrapper(*args, **kwargs):
+            return self._call(builder, name, category, method, *args, **kwargs)
+        return wrapper
+
+    def _call(self, builder, name, category, fn, *args, **kwargs):
+        body = builder.doc.element.body
+        first = len(body) - 1  # new blocks land just before the final sectPr
+        span = Span(name, category, self._clock())
+        self._stack.append(span)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            span.end = self._clock()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1].child_time += span.duration
+            measured = time.perf_counter()
+            self._measure(span, body, first)
+            self._overhead += time.perf_counter() - measured
+            self.spans.append(span)
+
+    def _measure(self, span, body, first):
+        from lxml import etree
+
+        blocks = body[first:-1]
+        if not blocks:
+            return
+        if self._ns_overhead is None:
+            # Serialising a block on its own repeats every namespace
+            # declaration inherited from the document; that is not content.
+            probe = etree.SubElement(body, 'probe')
+            self._ns_overhead = len(etree.tostring(probe)) - len(b'<probe/>')
+            body.remove(probe)
+        for block in blocks:
+            span.elements += sum(1 for _ in block.iter())
+            span.bytes += len(etree.tostring(block, encoding='utf-8')) - self._ns_overhead
+
+    # ── Reports ──
+    def write_trace(self, path):
+        """Write the spans as Chrome trace-event JSON."""
+        origin = min((span.start for span in self.spans), default=0.0)
+        events = [{
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            'ts': round((span.start - origin) * 1e6, 3),
+            'dur': round(span.duration * 1e6, 3),
+            'pid': os.getpid(),
+            'tid': 1,
+            'args': {'elements': span.elements, 'bytes': span.bytes},
+        } for span in sorted(self.spans, key=lambda span: (span.start, -span.end))]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def summary(self):
+        """Return sections (slowest first) and helpers (by self time) as text."""
+        lines = ['Sections and phases (slowest first)',
+                 f'{"ms":>9} {"self ms":>9} {"elements":>9} {"bytes":>9}  name']
+        sections = [span for span in self.spans if span.category != 'helper']
+        for span in sorted(sections, key=lambda span: span.duration, reverse=True):
+            lines.append(f'{span.duration * 1000:9.2f} {span.self_time * 1000:9.2f} '
+                         f'{span.elements:9,} {span.bytes:9,}  {span.name}')
+
+        totals = {}
+        for span in self.spans:
+            if span.category == 'helper':
+                calls, total, own, elements, size = totals.get(span.name, (0, 0.0, 0.0, 0, 0))
+                totals[span.name] = (calls + 1, total + span.duration, own + span.self_time,
+                                     elements + span.elements, size + span.bytes)
+        lines += ['', 'Helpers (by self time)',
+                  f'{"calls":>7} {"total ms":>9} {"self ms":>9} {"mean us":>8} {"elements":>9} {"bytes":>9}  name']
+        for name, (calls, total, own, elements, size) in sorted(totals.items(), key=lambda item: -item[1][2]):
+            lines.append(f'{calls:7,} {total * 1000:9.2f} {own * 1000:9.2f} {total / calls * 1e6:8.1f} '
+                         f'{elements:9,} {size:9,}  {name}')
+        return '\n'.join(lines) + '\n'
+
+
+def _node_name(node):
+    return node.title if node.kind == 'section' else node.kind
@@ -0,0 +1,184 @@
+"""Last stage of the site build: fingerprinted names and precompressed files.
+
+``fingerprint()`` gives every file the pages reference, directly or
+through another file, a copy named after its content
+(``style.<hash>.css``), and rewrites the references to use it. Those
+files can be cached as immutable, and a new build never serves a stale
+one. References are found in HTML, CSS and JSON. HTML paths resolve
+against the site root, since section fragments are inserted into the
+root page. Other files' paths resolve against their own directory. The
+``?v=`` cache-busting queries become redundant and are dropped. Pages
+keep their names. Plain copies stay next to the fingerprinted ones, and
+old fingerprinted files are never deleted, so pages still cached by
+clients keep working.
+
+``precompress()`` writes ``.gz`` and, when the optional ``brotli``
+package is installed, ``.br`` copies of every text file at maximum
+compression, in a process pool. A file is only compressed again when its
+content hash changed since the last build.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+
+HASH_CHARS = 10
+TEXT_TYPES = ('.html', '.css', '.js', '.json', '.xml', '.txt', '.svg')
+# Files other files can point at, as opposed to pages.
+_REFERENCE = re.compile(r'(?<![\w./-])([\w./-]+\.(?:css|json|js|html|png|webp|jpe?g|svg)(?![\w-]))(\?v=[0-9a-f]+)?')
+_FINGERPRINTED = re.compile(r'\.[0-9a-f]{%d}\.\w+$' % HASH_CHARS)
+
+
+def _base(path):
+    return '' if path.endswith('.html') else posixpath.dirname(path)
+
+
+def _references(text, base, candidates):
+    """Yield ``(match, target)`` for the references in ``text`` to ``candidates``."""
+    for match in _REFERENCE.finditer(text):
+        target = posixpath.normpath(posixpath.join(base, match.group(1)))
+        if target in candidates:
+            yield match, target
+
+
+def _rewrite(text, base, candidates, names):
+    def replace(match):
+        target = posixpath.normpath(posixpath.join(base, match.group(1)))
+        if target not in candidates:
+            return match.group()
+        return posixpath.join(posixpath.dirname(match.group(1)), posixpath.basename(names[target]))
+
+    return _REFERENCE.sub(replace, text)
+
+
+def fingerprinted_name(path, data):
+    stem, extension = posixpath.splitext(path)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:HASH_CHARS]}{extension}'
+
+
+def fingerprint(dist, pages):
+    """Fingerprint what ``pages`` reference and return the pages rewritten.
+
+    ``pages`` maps page names (relative to ``dist``, not written yet) to
+    their text. Returns ``(pages, names, written)``: the rewritten pages,
+    ``{path: fingerprinted path}`` and how many fingerprinted files were
+    new.
+    """
+    from cka_cache import write_atomic
+
+    candidates = set()
+    for root, _, files in os.walk(dist):
+        for name in files:
+            path = posixpath.relpath(os.path.join(root, name).replace(os.sep, '/'), dist.replace(os.sep, '/'))
+            if path not in pages and not _FINGERPRINTED.search(path) and not path.endswith(('.gz', '.br')):
+                candidates.add(path)
+
+    names = {}
+    written = 0
+
+    def visit(path, stack):
+        nonlocal written
+        if path in names:
+            return
+        if path in stack:
+            raise ValueError(f'reference cycle through {path}')
+        with open(os.path.join(dist, path), 'rb') as f:
+            data = f.read()
+        rewritten = data
+        if path.endswith(('.html', '.css', '.json')):
+            text = data.decode('utf-8')
+            for _, target in _references(text, _base(path), candidates):
+                visit(target, stack | {path})
+            rewritten = _rewrite(text, _base(path), candidates, names).encode('utf-8')
+        names[path] = fingerprinted_name(path, rewritten)
+        target = os.path.join(dist, names[path])
+        if os.path.exists(target):
+            return
+        written += 1
+        if rewritten == data:
+            # Nothing to rewrite: share the file instead of copying it.
+            try:
+                os.link(os.path.join(dist, path), target)
+                return
+            except OSError:
+                pass
+        write_atomic(target, rewritten)
+
+    for text in pages.values():
+        for _, target in _references(text, '', candidates):
+            visit(target, frozenset())
+    rewritten = {page: _rewrite(text, '', candidates, names) for page, text in pages.items()}
+    return rewritten, names, written
+
+
+def compress_file(path):
+    """Write ``path.gz`` (and ``path.br`` with brotli); returns ``(path, digest, brotli)``."""
+    from cka_cache import write_if_changed
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    write_if_changed(path + '.gz', lambda f: f.write(gzip.compress(data, 9, mtime=0)))
+    try:
+        import brotli
+    except ImportError:
+        return path, hashlib.sha256(data).hexdigest(), False
+    write_if_changed(path + '.br', lambda f: f.write(brotli.compress(data, quality=11)))
+    return path, hashlib.sha256(data).hexdigest(), True
+
+
+def _digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def precompress(dist, cache_dir, workers=None):
+    """Compress every text file under ``dist`` that changed since the last run.
+
+    The content hashes of compressed files are recorded in ``cache_dir``.
+    Returns ``(compressed, skipped, brotli)``.
+    """
+    import importlib.util
+    from concurrent.futures import ProcessPoolExecutor
+
+    from cka_cache import write_atomic
+    from cka_pool import InlineExecutor
+
+    record_path = os.path.join(cache_dir, 'precompressed.json')
+    try:
+        with open(record_path, encoding='utf-8') as f:
+            record = json.load(f).get(os.path.abspath(dist), {})
+    except (FileNotFoundError, ValueError):
+        record = {}
+    brotli = importlib.util.find_spec('brotli') is not None
+
+    todo = []
+    current = {}
+    for root, _, files in os.walk(dist):
+        for name in files:
+            if not name.endswith(TEXT_TYPES):
+                continue
+            path = os.path.join(root, name)
+            key = os.path.relpath(path, dist)
+            current[key] = [_digest(path), brotli]
+            outputs = [path + '.gz'] + ([path + '.br'] if brotli else [])
+            if record.get(key) != current[key] or not all(map(os.path.exists, outputs)):
+                todo.append(path)
+
+    if workers is None:
+        workers = min(len(todo), os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else InlineExecutor()
+    with pool:
+        for path, digest, with_brotli in pool.map(compress_file, todo, chunksize=4):
+            current[os.path.relpath(path, dist)] = [digest, with_brotli]
+
+    try:
+        with open(record_path, encoding='utf-8') as f:
+            records = json.load(f)
+    except (FileNotFoundError, ValueError):
+        records = {}
+    records[os.path.abspath(dist)] = current
+    write_atomic(record_path, json.dumps(records, sort_keys=True).encode('utf-8'))
+    return len(todo), len(current) - len(todo), brotli
@@ -0,0 +1,207 @@
+"""Prebuilt search index for the site's section search.
+
+``build_index()`` reads a page laid out like ``index.html`` (one
+``h2#section-NN`` per section, its content in the following siblings) and
+collects the entries ``script.js`` used to gather from the DOM: every
+``h3``, every ``p``/``li`` longer than 20 characters and the start of every
+``pre code``. Their text is normalised into tokens (lower case, accents
+stripped, split on anything but ``a-z0-9``), and each token gets a posting
+list of the entries that contain it.
+
+The index is written as a manifest (sections, entries and shard names)
+plus one shard per leading character of the tokens. A shard is a radix
+trie: nested objects keyed by token fragments, with the posting list of a
+complete token under ``"$"``. The page fetches the manifest when search is
+first opened and a shard only when a query needs it, then resolves each
+query token as a prefix and intersects the postings. ``search()`` does
+the same in Python.
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from html.parser import HTMLParser
+
+MIN_TEXT = 20
+CODE_CHARS = 200
+SNIPPET_CHARS = 120
+MAX_RESULTS = 20
+
+HEADING, TEXT, CODE = 'h', 'p', 'c'
+
+_TOKEN_SPLIT = re.compile(r'[^a-z0-9]+')
+_SPACE = re.compile(r'\s+')
+
+
+def tokens(text):
+    """Return the search tokens of ``text``, in order."""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    return [token for token in _TOKEN_SPLIT.split(text) if token]
+
+
+class _Collector(HTMLParser):
+    """Collects ``[id, title]`` sections and ``(section, kind, text, anchor)`` entries."""
+
+    _VOID = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                       'source', 'track', 'wbr'))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections = []
+        self.entries = []
+        self._stack = []       # open tags
+        self._depth = None     # stack depth of the current section's parent
+        self._captures = []    # [tag, depth, kind, anchor, text parts] of open elements
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._VOID:
+            return
+        attrs = dict(attrs)
+        depth = len(self._stack)
+        self._stack.append(tag)
+        anchor = attrs.get('id') or ''
+        if tag == 'h2':
+            if anchor.startswith('section-'):
+                self._depth = depth
+                self.sections.append([anchor, ''])
+                self._captures.append([tag, depth, None, anchor, []])
+            elif self._depth == depth:
+                self._depth = None
+            return
+        if self._depth is None:
+            return
+        if tag == 'h3':
+            self._captures.append([tag, depth, HEADING, anchor, []])
+        elif tag in ('p', 'li'):
+            self._captures.append([tag, depth, TEXT, '', []])
+        elif tag == 'code' and 'pre' in self._stack[:-1]:
+            self._captures.append([tag, depth, CODE, '', []])
+
+    def handle_endtag(self, tag):
+        if tag not in self._stack:
+            return
+        # Close anything left open inside ``tag`` as well.
+        while self._stack:
+            depth = len(self._stack) - 1
+            closed = self._stack.pop()
+            while self._captures and self._captures[-1][1] == depth:
+                self._finish(self._captures.pop())
+            if self._depth is not None and depth < self._depth:
+                self._depth = None
+            if closed == tag:
+                break
+
+    def handle_data(self, data):
+        for capture in self._captures:
+            capture[4].append(data)
+
+    def _finish(self, capture):
+        _, _, kind, anchor, parts = capture
+        text = _SPACE.sub(' ', ''.join(parts)).strip()
+        if kind is None:
+            self.sections[-1][1] = text
+        elif kind == HEADING:
+            self.entries.append((len(self.sections) - 1, HEADING, text, anchor))
+        elif kind == TEXT and len(text) > MIN_TEXT:
+            self.entries.append((len(self.sections) - 1, TEXT, text, ''))
+        elif kind == CODE:
+            self.entries.append((len(self.sections) - 1, CODE, ''.join(parts).strip()[:CODE_CHARS], ''))
+
+
+def _radix(postings):
+    """Return the radix trie of ``{token suffix: posting list}``."""
+    node = {}
+    groups = {}
+    for suffix, ids in postings.items():
+        if suffix:
+            groups.setdefault(suffix[0], {})[suffix] = ids
+        else:
+            node['$'] = ids
+    for group in groups.values():
+        keys = list(group)
+        prefix = keys[0]
+        for key in keys[1:]:
+            while not key.startswith(prefix):
+                prefix = prefix[:-1]
+        node[prefix] = _radix({key[len(prefix):]: ids for key, ids in group.items()})
+    return node
+
+
+def build_index(page):
+    """Return ``(manifest, shards)`` for the HTML ``page``.
+
+    ``manifest`` is ``{'sections': [[id, title], ...], 'entries': [...],
+    'shards': {character: file name}}``; an entry is ``[kind, section,
+    title, snippet, anchor]`` where an empty title stands for the section's.
+    ``shards`` maps file names to their tries.
+    """
+    collector = _Collector()
+    collector.feed(page)
+    collector.close()
+
+    entries = []
+    postings = {}
+    for number, (section, kind, text, anchor) in enumerate(collector.entries):
+        if kind == HEADING:
+            title, snippet = text, ''
+        else:
+            title, snippet = '', text[:SNIPPET_CHARS + 1]
+        entries.append([kind, section, title, snippet, anchor])
+        for token in set(tokens(title + ' ' + text)):
+            postings.setdefault(token, []).append(number)
+
+    by_first = {}
+    for token in sorted(postings):
+        by_first.setdefault(token[0], {})[token] = postings[token]
+    shards = {}
+    names = {}
+    for first, group in by_first.items():
+        shard = _radix(group)
+        digest = hashlib.sha256(dump(shard)).hexdigest()[:12]
+        names[first] = f'{first}.json?v={digest}'
+        shards[f'{first}.json'] = shard
+    manifest = {'sections': collector.sections, 'entries': entries, 'shards': names}
+    return manifest, shards
+
+
+def dump(data):
+    """Serialise index data as compact JSON bytes."""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _prefix_postings(node, prefix, out):
+    if not prefix:
+        for key, child in node.items():
+            if key == '$':
+                out.update(child)
+            else:
+                _prefix_postings(child, '', out)
+        return
+    for key, child in node.items():
+        if key == '$':
+            continue
+        if prefix.startswith(key):
+            _prefix_postings(child, prefix[len(key):], out)
+        elif key.startswith(prefix):
+            _prefix_postings(child, '', out)
+
+
+def search(manifest, shards, query, limit=MAX_RESULTS):
+    """Return the entry numbers matching every token of ``query`` as a prefix.
+
+    Headings come first, then entries in page order. This mirrors the
+    lookup in ``script.js``.
+    """
+    hits = None
+    for token in set(tokens(query)):
+        shard = shards.get(f'{token[0]}.json')
+        found = set()
+        if shard is not None:
+            _prefix_postings(shard, token, found)
+        hits = found if hits is None else hits & found
+        if not hits:
+            return []
+    entries = manifest['entries']
+    return sorted(hits or (), key=lambda n: (entries[n][0] != HEADING, n))[:limit]
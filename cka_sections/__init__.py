@@ -0,0 +1,104 @@
+"""CKA cheat-sheet content, one module per numbered section.
+
+Each ``sNN_<slug>`` module defines ``SECTION``, a ``cka_model.Section``.
+Modules are imported on demand by ``load()``, so a build of a few sections
+never imports or executes the others; ``REGISTRY`` holds everything needed
+to plan a build (numbers, module names, table-of-contents titles) without
+touching the section modules themselves.
+"""
+
+import importlib
+
+# number: (module, table-of-contents title)
+REGISTRY = {
+    1: ('s01_setup', 'Exam Environment Setup & Shell Aliases'),
+    2: ('s02_imperative', 'Imperative Commands — Speed Reference'),
+    3: ('s03_kubectl_ref', 'kubectl Quick Reference'),
+    4: ('s04_core', 'Core Concepts — Cluster Architecture'),
+    5: ('s05_pod_yaml', 'Pod YAML Skeleton'),
+    6: ('s06_deploy_svc', 'Deployment + Service YAML'),
+    7: ('s07_scheduling', 'Scheduling — Taints, Tolerations, Affinity, nodeSelector'),
+    8: ('s08_resources', 'Resource Limits, LimitRange, ResourceQuota'),
+    9: ('s09_ds_job', 'DaemonSet, Job, CronJob'),
+    10: ('s10_static_pods', 'Static Pods'),
+    11: ('s11_cm_secret', 'ConfigMaps & Secrets'),
+    12: ('s12_multi_container', 'Multi-Container Pods & Init Containers'),
+    13: ('s13_probes', 'Probes — Liveness & Readiness'),
+    14: ('s14_rollouts', 'Rolling Updates & Rollbacks'),
+    15: ('s15_hpa', 'HPA — Autoscaling'),
+    16: ('s16_rbac', 'RBAC — Roles, Bindings, ServiceAccounts'),
+    17: ('s17_tls_csr', 'TLS & Certificates — CSR Workflow'),
+    18: ('s18_kubeconfig', 'kubeconfig'),
+    19: ('s19_security_ctx', 'Security Contexts'),
+    20: ('s20_netpol', 'NetworkPolicy'),
+    21: ('s21_storage', 'Storage — PV, PVC, StorageClass'),
+    22: ('s22_networking', 'Services & Networking'),
+    23: ('s23_dns', 'DNS & CoreDNS'),
+    24: ('s24_ingress', 'Ingress'),
+    25: ('s25_etcd', 'ETCD Backup & Restore'),
+    26: ('s26_upgrade', 'Cluster Upgrade (kubeadm)'),
+    27: ('s27_node_maint', 'Node Maintenance — Cordon, Drain, Uncordon'),
+    28: ('s28_pdb', 'PodDisruptionBudget'),
+    29: ('s29_troubleshoot', 'Troubleshooting Checklist'),
+    30: ('s30_jsonpath', 'JSONPath & Output Formatting'),
+    31: ('s31_helm', 'Helm'),
+    32: ('s32_kustomize', 'Kustomize'),
+    33: ('s33_kubeadm', 'kubeadm Installation'),
+    34: ('s34_crd', 'CRDs & Operators'),
+    35: ('s35_practice', 'Practice Scenarios & Mock Questions'),
+    36: ('s36_exam_tips', 'Exam Tips & Common Mistakes'),
+}
+
+# key: (title, sections) for the CKA curriculum domains used by split builds.
+# Sections not listed (1-3, 30, 36) are general reference material and only
+# appear in the combined sheet.
+DOMAINS = {
+    'cluster_architecture': ('Cluster Architecture', (4, 16, 17, 18, 25, 26, 27, 31, 32, 33, 34)),
+    'workloads': ('Workloads & Scheduling', (5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 19, 28)),
+    'networking': ('Services & Networking', (20, 22, 23, 24)),
+    'storage': ('Storage', (21,)),
+    'troubleshooting': ('Troubleshooting', (29, 35)),
+}
+
+
+def module(number):
+    """Import (once) and return the module holding section ``number``."""
+    return importlib.import_module(f'{__name__}.{REGISTRY[number][0]}')
+
+
+def load(number):
+    """Return the ``Section`` node for section ``number``."""
+    return module(number).SECTION
+
+
+def toc_items(numbers=None):
+    """Return the table-of-contents lines for ``numbers`` (all by default)."""
+    if numbers is None:
+        numbers = REGISTRY
+    return [f'{number}. {REGISTRY[number][1]}' for number in numbers]
+
+
+def parse_selection(text):
+    """Parse a selection such as ``'16,17,20'`` or ``'1-5,29'``.
+
+    Returns the section numbers in the order given, without duplicates.
+    Raises ``ValueError`` for malformed input or unknown sections.
+    """
+    numbers = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition('-')
+        try:
+            span = range(int(first), int(last) + 1) if sep else (int(first),)
+        except ValueError:
+            raise ValueError(f'not a section number or range: {part!r}') from None
+        for number in span:
+            if number not in REGISTRY:
+                raise ValueError(f'unknown section: {number}')
+            if number not in numbers:
+                numbers.append(number)
+    if not numbers:
+        raise ValueError('no sections selected')
+    return numbers
@@ -0,0 +1,36 @@
+"""1. Exam Environment Setup & Shell Aliases"""
+
+from cka_model import Code, ExamNote, Heading, Paragraph, Section
+
+SECTION = Section('1. Exam Environment Setup & Shell Aliases', [
+    Paragraph('Run these commands FIRST when the exam starts:'),
+
+    Heading('Shell Aliases (~/.bashrc)', 3),
+    Code("""# Essential aliases — set these at the START of the exam
+alias k=kubectl
+alias kn='kubectl config set-context --current --namespace'
+alias kgp='kubectl get pods'
+alias kgs='kubectl get svc'
+alias kgn='kubectl get nodes'
+alias kga='kubectl get all'
+alias kaf='kubectl apply -f'
+alias kdp='kubectl describe pod'
+alias kl='kubectl logs'
+alias ke='kubectl exec -it'
+
+# Enable kubectl autocompletion
+source <(kubectl completion bash)
+complete -o default -F __start_kubectl k
+
+# Set default editor
+export KUBE_EDITOR=vi"""),
+
+    Heading('Vim Settings (~/.vimrc)', 3),
+    Code("""set tabstop=2
+set shiftwidth=2
+set expandtab
+set number
+set autoindent"""),
+
+    ExamNote('Switch context at the start of EVERY question: kubectl config use-context <context-name>'),
+])
@@ -0,0 +1,86 @@
+"""2. Imperative Commands — Speed Reference"""
+
+from cka_model import Code, Heading, Paragraph, Section, Tip
+
+SECTION = Section('2. Imperative Commands — Speed Reference', [
+    Paragraph('Use imperative commands with --dry-run=client -o yaml to generate YAML fast, then edit as needed.'),
+
+    Heading('Pod', 3),
+    Code("""k run <name> --image=<img>
+k run <name> --image=<img> --restart=Never
+k run <name> --image=<img> --dry-run=client -o yaml > pod.yaml
+k run <name> --image=<img> --port=80
+k run <name> --image=<img> --labels="app=web,env=prod"
+k run <name> --image=<img> --command -- sleep 3600
+k run <name> --image=<img> -- <arg1> <arg2>"""),
+
+    Heading('Deployment', 3),
+    Code("""k create deployment <name> --image=<img> [--replicas=N]
+k create deployment <name> --image=<img> --dry-run=client -o yaml > deploy.yaml
+k scale deployment <name> --replicas=N
+k set image deployment/<name> <container>=<img>
+k rollout status deployment/<name>
+k rollout history deployment/<name>
+k rollout undo deployment/<name>
+k rollout undo deployment/<name> --to-revision=2"""),
+
+    Heading('Service', 3),
+    Code("""k expose deployment <name> --port=<port> [--name=<svc-name>]
+k expose deployment <name> --port=80 --type=NodePort
+k expose pod <name> --port=80
+k create service nodeport nginx --tcp=80:80 --node-port=30080 --dry-run=client -o yaml
+k expose deployment <name> --port=80 --type=ClusterIP --dry-run=client -o yaml"""),
+
+    Heading('Namespace', 3),
+    Code("""k create namespace <name>
+k create ns <name>"""),
+
+    Heading('ConfigMap & Secret', 3),
+    Code("""k create configmap <name> --from-literal=KEY=val [--from-literal=KEY2=val2]
+k create configmap <name> --from-file=path/to/file
+k create configmap <name> --from-file=key=path
+k create secret generic <name> --from-literal=KEY=val
+k create secret generic <name> --from-file=key=path
+k create secret tls <name> --cert=tls.crt --key=tls.key
+k create secret docker-registry regcred \\
+  --docker-server=<url> --docker-username=<user> \\
+  --docker-password=<pass> --docker-email=<email>"""),
+
+    Heading('ServiceAccount', 3),
+    Code("""k create serviceaccount <name>
+k create sa <name>
+k create token <sa-name>    # short-lived token (K8s 1.24+)"""),
+
+    Heading('Job & CronJob', 3),
+    Code("""k create job <name> --image=busybox -- echo hello
+k create job <name> --image=busybox --dry-run=client -o yaml -- echo hello
+k create cronjob <name> --image=busybox --schedule="0 * * * *" -- echo hi
+k create cronjob <name> --image=busybox --schedule="*/5 * * * *" --dry-run=client -o yaml -- echo hi"""),
+
+    Heading('RBAC', 3),
+    Code("""k create role <name> --verb=get,list,create,delete --resource=pods -n <ns>
+k create rolebinding <name> --role=<role> --user=<user> -n <ns>
+k create rolebinding <name> --role=<role> --serviceaccount=<ns>:<sa> -n <ns>
+k create clusterrole <name> --verb=get,list --resource=nodes
+k create clusterrolebinding <name> --clusterrole=<name> --user=<user>
+k create clusterrolebinding <name> --clusterrole=<name> --serviceaccount=<ns>:<sa>"""),
+
+    Heading('Ingress', 3),
+    Code("""k create ingress <name> --rule="host/path=svc:80" --dry-run=client -o yaml"""),
+
+    Heading('Generate → Edit → Apply Pattern', 3),
+    Code("""k run mypod --image=nginx --dry-run=client -o yaml > mypod.yaml
+vi mypod.yaml   # add labels, resources, volumes, etc.
+k apply -f mypod.yaml
+
+# Edit running resource
+k edit deployment nginx
+
+# Force replace (immutable fields)
+k replace --force -f pod.yaml
+
+# Delete stuck pod
+k delete pod x --force --grace-period=0"""),
+
+    Tip('Always add -n <namespace> or --namespace=<ns> for namespace-scoped resources.'),
+])
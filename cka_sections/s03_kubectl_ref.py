@@ -0,0 +1,59 @@
+"""3. kubectl Quick Reference"""
+
+from cka_model import Code, Heading, Section
+
+SECTION = Section('3. kubectl Quick Reference', [
+    Heading('Inspect & Debug', 3),
+    Code("""k get pods -A -o wide
+k get all -n <ns>
+k describe pod <name>
+k logs <pod> [-c <container>] [--previous] [-f]
+k exec -it <pod> -- sh
+k exec -it <pod> -c <container> -- sh
+k get events --sort-by='.lastTimestamp'
+k get events -A --sort-by='.lastTimestamp'
+k top nodes
+k top pods --sort-by=memory
+k top pods --sort-by=cpu"""),
+
+    Heading('Docs in Terminal (Exam Allowed)', 3),
+    Code("""k explain pod
+k explain pod.spec.containers
+k explain pod.spec.containers.resources
+k explain deployment.spec --recursive
+k api-resources          # list all resource types
+k api-resources --namespaced=true
+k api-resources --namespaced=false
+k api-versions           # list all API versions"""),
+
+    Heading('Edit / Patch / Delete', 3),
+    Code("""k edit deploy <name>
+k patch svc s1 -p '{"spec":{"type":"NodePort"}}'
+k replace --force -f pod.yaml
+k delete pod x --force --grace-period=0"""),
+
+    Heading('Label / Annotate', 3),
+    Code("""k label pod <name> env=prod
+k label pod <name> env=staging --overwrite
+k label pod <name> env-                      # remove label
+k label node <name> disk=ssd
+k annotate pod <name> key=value
+k get pods --selector app=web
+k get pods --selector app=web,env=prod       # AND logic
+k get pods --show-labels
+k get pods -L app,env                        # show as columns
+k get pods --selector env=production --no-headers | wc -l"""),
+
+    Heading('Context & Namespace', 3),
+    Code("""k config use-context <ctx>
+k config current-context
+k config get-contexts
+k config set-context --current --namespace=dev
+k config view"""),
+
+    Heading('Node Maintenance', 3),
+    Code("""k cordon <node>
+k drain <node> --ignore-daemonsets --delete-emptydir-data
+k drain <node> --ignore-daemonsets --delete-emptydir-data --force
+k uncordon <node>"""),
+])
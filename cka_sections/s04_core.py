@@ -0,0 +1,26 @@
+"""4. Core Concepts — Cluster Architecture"""
+
+from cka_model import Code, Diagram, Heading, Paragraph, Section
+
+SECTION = Section('4. Core Concepts — Cluster Architecture', [
+    Diagram('k8s-enterprise-white.png', 'Kubernetes cluster architecture: control plane and worker nodes'),
+    Diagram('k8s-request-workflow.png', 'What happens on kubectl apply: API server, etcd, scheduler, kubelet'),
+    Heading('Control Plane Components', 2),
+    Paragraph('kube-apiserver: Front-end REST API. Only component that talks to etcd. Authenticates, authorizes, validates requests.'),
+    Paragraph('etcd: Distributed key-value store. Uses RAFT consensus. Single source of truth. Backup with etcdctl snapshot.'),
+    Paragraph('kube-scheduler: Watches unscheduled pods. Filtering (predicates) → Scoring (priorities) → Binding.'),
+    Paragraph('kube-controller-manager: Runs controllers (Node, Replication, Endpoints). Reconciliation loop: current state → desired state.'),
+    Paragraph('cloud-controller-manager: Cloud-specific logic (nodes, LBs, routes).'),
+
+    Heading('Worker Node Components', 2),
+    Paragraph('kubelet: Agent on each node. Registers node, ensures containers run. Reads PodSpecs from API server or static files.'),
+    Paragraph('kube-proxy: Network proxy. Programs iptables/IPVS for Service routing.'),
+    Paragraph('Container Runtime: containerd or CRI-O (Docker removed in K8s 1.24+). Uses CRI standard.'),
+
+    Heading('crictl Commands (CRI debugging)', 3),
+    Code("""crictl ps -a                        # list all containers
+crictl images                       # list images
+crictl pods                         # list pods
+crictl logs <container-id>          # view logs
+crictl inspect <container-id>       # inspect container"""),
+])
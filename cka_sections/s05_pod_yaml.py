@@ -0,0 +1,81 @@
+"""5. Pod YAML Skeleton (Complete)"""
+
+from cka_model import Diagram, Section, Yaml
+
+SECTION = Section('5. Pod YAML Skeleton (Complete)', [
+    Diagram('k8s-pod-lifecycle.png', 'Pod lifecycle states: Pending, Running, Succeeded, Failed, Unknown'),
+    Yaml("""apiVersion: v1
+kind: Pod
+metadata:
+  name: mypod
+  namespace: default
+  labels:
+    app: myapp
+spec:
+  serviceAccountName: my-sa
+  nodeSelector:
+    disk: ssd
+  tolerations:
+  - key: "node-role"
+    operator: "Exists"
+    effect: "NoSchedule"
+  initContainers:
+  - name: init
+    image: busybox
+    command: ['sh','-c','sleep 5']
+  containers:
+  - name: app
+    image: nginx:1.21
+    ports:
+    - containerPort: 80
+    command: ["sleep"]          # overrides ENTRYPOINT
+    args: ["3600"]              # overrides CMD
+    env:
+    - name: KEY
+      value: val
+    - name: FROM_CM
+      valueFrom:
+        configMapKeyRef:
+          name: my-cm
+          key: APP_KEY
+    - name: FROM_SECRET
+      valueFrom:
+        secretKeyRef:
+          name: my-secret
+          key: DB_PASS
+    envFrom:
+    - configMapRef:
+        name: my-cm
+    - secretRef:
+        name: my-secret
+    resources:
+      requests: { cpu: 100m, memory: 128Mi }
+      limits:   { cpu: 500m, memory: 256Mi }
+    livenessProbe:
+      httpGet: { path: /healthz, port: 80 }
+      initialDelaySeconds: 10
+      periodSeconds: 20
+    readinessProbe:
+      httpGet: { path: /ready, port: 80 }
+      initialDelaySeconds: 5
+      periodSeconds: 10
+    volumeMounts:
+    - name: data
+      mountPath: /data
+    - name: config-vol
+      mountPath: /etc/config
+    securityContext:
+      runAsUser: 1000
+      runAsNonRoot: true
+      readOnlyRootFilesystem: true
+      capabilities:
+        add: ["NET_ADMIN"]
+        drop: ["ALL"]
+  volumes:
+  - name: data
+    persistentVolumeClaim:
+      claimName: my-pvc
+  - name: config-vol
+    configMap:
+      name: my-cm"""),
+])
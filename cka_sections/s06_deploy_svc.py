@@ -0,0 +1,59 @@
+"""6. Deployment + Service YAML"""
+
+from cka_model import Diagram, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('6. Deployment + Service YAML', [
+    Diagram('k8s-deployment-replicaset-pod.png', 'Workloads hierarchy: Deployment → ReplicaSet → Pod'),
+    Diagram('k8s-service-types.png', 'Service types: ClusterIP, NodePort, LoadBalancer'),
+    Heading('Deployment', 2),
+    Yaml("""apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: webapp
+spec:
+  replicas: 3
+  strategy:
+    type: RollingUpdate
+    rollingUpdate: { maxSurge: 1, maxUnavailable: 0 }
+  selector:
+    matchLabels: { app: webapp }
+  template:
+    metadata:
+      labels: { app: webapp }
+    spec:
+      containers:
+      - name: webapp
+        image: nginx:1.21
+        ports: [{ containerPort: 80 }]
+        resources:
+          requests: { cpu: 100m, memory: 128Mi }
+          limits:   { cpu: 500m, memory: 256Mi }"""),
+
+    Heading('Service (NodePort)', 2),
+    Yaml("""apiVersion: v1
+kind: Service
+metadata:
+  name: webapp-svc
+spec:
+  type: NodePort
+  selector: { app: webapp }
+  ports:
+  - port: 80
+    targetPort: 80
+    nodePort: 30080"""),
+
+    Heading('Service (ClusterIP)', 2),
+    Yaml("""apiVersion: v1
+kind: Service
+metadata:
+  name: back-end
+spec:
+  type: ClusterIP
+  ports:
+  - targetPort: 80
+    port: 80
+  selector:
+    app: myapp"""),
+
+    Paragraph('Service Types: ClusterIP (internal, default) | NodePort (node port 30000-32767) | LoadBalancer (cloud LB)'),
+])
@@ -0,0 +1,75 @@
+"""7. Scheduling — Taints, Tolerations, Affinity, nodeSelector"""
+
+from cka_model import Code, Diagram, ExamNote, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('7. Scheduling — Taints, Tolerations, Affinity, nodeSelector', [
+    Diagram('k8s-scheduling-flow.png', 'Pod scheduling flow: Pod created → Scheduler → Binding → Kubelet'),
+    Diagram('k8s-taints-vs-affinity.png', 'Taints repel pods; node affinity attracts pods'),
+    Heading('Taints & Tolerations', 2),
+    Paragraph('Taints on NODES repel pods. Tolerations on PODS allow them onto tainted nodes.'),
+    Paragraph('Effects: NoSchedule | PreferNoSchedule | NoExecute (evicts existing pods)'),
+
+    Code("""# Apply a taint
+k taint nodes node01 app=blue:NoSchedule
+
+# Remove a taint (trailing minus)
+k taint nodes node01 app=blue:NoSchedule-
+
+# Remove control-plane taint (single-node clusters)
+k taint nodes controlplane node-role.kubernetes.io/control-plane:NoSchedule-
+
+# Check taints
+k describe node node01 | grep -i taint"""),
+
+    Heading('Toleration in Pod YAML', 3),
+    Yaml("""tolerations:
+- key: "app"
+  operator: "Equal"       # or "Exists" (matches any value)
+  value: "blue"
+  effect: "NoSchedule"
+# NoExecute toleration with grace period:
+- key: "node.kubernetes.io/not-ready"
+  operator: "Exists"
+  effect: "NoExecute"
+  tolerationSeconds: 300"""),
+
+    Heading('nodeSelector (Simplest)', 2),
+    Code("""# Label a node
+k label nodes node01 size=Large
+k label nodes node01 size-     # remove label"""),
+    Yaml("""spec:
+  nodeSelector:
+    size: Large"""),
+
+    Heading('Node Affinity (Advanced)', 2),
+    Yaml("""spec:
+  affinity:
+    nodeAffinity:
+      requiredDuringSchedulingIgnoredDuringExecution:   # HARD rule
+        nodeSelectorTerms:
+        - matchExpressions:
+          - key: size
+            operator: In          # In, NotIn, Exists, DoesNotExist, Gt, Lt
+            values: [Large, Medium]
+      preferredDuringSchedulingIgnoredDuringExecution:  # SOFT rule
+      - weight: 50
+        preference:
+          matchExpressions:
+          - key: disktype
+            operator: In
+            values: [ssd]"""),
+
+    Heading('Manual Scheduling (nodeName)', 2),
+    Yaml("""spec:
+  nodeName: node02        # bypasses scheduler entirely"""),
+    ExamNote('nodeName can only be set at creation time. To move a pod: export YAML → edit → delete → recreate.'),
+
+    Heading('Dedicated Nodes Pattern (Taint + Affinity)', 2),
+    Code("""# Step 1: Taint the node
+k taint nodes node01 dedicated=team-a:NoSchedule
+
+# Step 2: Label the node
+k label nodes node01 dedicated=team-a
+
+# Step 3: Pod spec with BOTH toleration AND node affinity"""),
+])
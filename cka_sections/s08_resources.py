@@ -0,0 +1,54 @@
+"""8. Resource Limits, LimitRange, ResourceQuota"""
+
+from cka_model import Code, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('8. Resource Limits, LimitRange, ResourceQuota', [
+    Heading('Resource Requests & Limits', 2),
+    Paragraph('Requests = guaranteed allocation (scheduler uses). Limits = max at runtime.'),
+    Paragraph('CPU > limit → throttled (never killed). Memory > limit → OOMKilled (exit 137).'),
+    Paragraph('CPU: 1 = 1 vCPU, 500m = 0.5 CPU. Memory: Mi (mebibytes), Gi (gibibytes).'),
+    Yaml("""resources:
+  requests:
+    memory: "64Mi"
+    cpu: "250m"
+  limits:
+    memory: "128Mi"
+    cpu: "500m" """),
+
+    Paragraph('QoS Classes: Guaranteed (requests==limits) > Burstable (requests<limits) > BestEffort (no requests/limits)'),
+
+    Code("""k get pod x -o jsonpath='{.status.qosClass}'
+k top nodes
+k top pods --sort-by=memory
+k describe node node01 | grep -A 10 "Allocated resources" """),
+
+    Heading('LimitRange (per-container defaults)', 2),
+    Yaml("""apiVersion: v1
+kind: LimitRange
+metadata:
+  name: mem-cpu-limits
+  namespace: dev
+spec:
+  limits:
+  - type: Container
+    default:          { cpu: "500m", memory: "128Mi" }
+    defaultRequest:   { cpu: "250m", memory: "64Mi" }
+    max:              { cpu: "2", memory: "1Gi" }
+    min:              { cpu: "100m", memory: "16Mi" }"""),
+
+    Heading('ResourceQuota (namespace-total)', 2),
+    Yaml("""apiVersion: v1
+kind: ResourceQuota
+metadata:
+  name: compute-quota
+  namespace: dev
+spec:
+  hard:
+    pods: "10"
+    requests.cpu: "4"
+    requests.memory: 4Gi
+    limits.cpu: "8"
+    limits.memory: 8Gi
+    services: "5"
+    persistentvolumeclaims: "4" """),
+])
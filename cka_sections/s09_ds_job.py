@@ -0,0 +1,67 @@
+"""9. DaemonSet, Job, CronJob"""
+
+from cka_model import Code, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('9. DaemonSet, Job, CronJob', [
+    Heading('DaemonSet', 2),
+    Paragraph('One pod per node (all or subset via nodeSelector). Use for: log collectors, node monitoring, CNI/CSI plugins.'),
+    Yaml("""apiVersion: apps/v1
+kind: DaemonSet
+metadata:
+  name: monitoring-daemon
+  namespace: kube-system
+spec:
+  selector:
+    matchLabels: { app: monitoring-daemon }
+  template:
+    metadata:
+      labels: { app: monitoring-daemon }
+    spec:
+      tolerations:
+      - key: node-role.kubernetes.io/control-plane
+        operator: Exists
+        effect: NoSchedule
+      containers:
+      - name: agent
+        image: prom/node-exporter
+        resources:
+          limits: { memory: "200Mi", cpu: "100m" }"""),
+
+    Code("""k get ds -A
+k describe ds monitoring-daemon -n kube-system
+k rollout undo ds monitoring-daemon -n kube-system"""),
+
+    Heading('Job', 2),
+    Yaml("""apiVersion: batch/v1
+kind: Job
+metadata: { name: pi-job }
+spec:
+  completions: 3
+  parallelism: 2
+  backoffLimit: 4
+  template:
+    spec:
+      containers:
+      - name: pi
+        image: perl
+        command: ["perl","-Mbignum=bpi","-wle","print bpi(2000)"]
+      restartPolicy: Never"""),
+
+    Heading('CronJob', 2),
+    Yaml("""apiVersion: batch/v1
+kind: CronJob
+metadata: { name: backup }
+spec:
+  schedule: "0 2 * * *"
+  successfulJobsHistoryLimit: 3
+  failedJobsHistoryLimit: 1
+  jobTemplate:
+    spec:
+      template:
+        spec:
+          containers:
+          - name: backup
+            image: busybox
+            command: ["/bin/sh","-c","date"]
+          restartPolicy: OnFailure"""),
+])
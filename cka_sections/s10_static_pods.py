@@ -0,0 +1,35 @@
+"""10. Static Pods"""
+
+from cka_model import Code, Paragraph, Section
+
+SECTION = Section('10. Static Pods', [
+    Paragraph('Managed by kubelet directly from /etc/kubernetes/manifests/. Not through API server. Control-plane components are static pods via kubeadm.'),
+    Paragraph('To delete: remove the manifest file. kubectl delete will NOT work permanently.'),
+    Paragraph('Naming: node name appended (e.g., kube-apiserver-controlplane).'),
+
+    Code("""# Find static pod path
+ps aux | grep kubelet | grep config
+cat /var/lib/kubelet/config.yaml | grep staticPodPath
+# Default: /etc/kubernetes/manifests/
+
+# Create a static pod
+cat <<EOF > /etc/kubernetes/manifests/static-nginx.yaml
+apiVersion: v1
+kind: Pod
+metadata:
+  name: static-nginx
+spec:
+  containers:
+  - name: nginx
+    image: nginx:1.25
+    ports:
+    - containerPort: 80
+EOF
+
+# Delete a static pod
+rm /etc/kubernetes/manifests/static-nginx.yaml
+
+# Verify it's static (ownerReferences.kind == Node)
+k get pod kube-apiserver-controlplane -n kube-system \\
+  -o jsonpath='{.metadata.ownerReferences[*].kind}'"""),
+])
@@ -0,0 +1,69 @@
+"""11. ConfigMaps & Secrets"""
+
+from cka_model import Code, Heading, Section, Yaml
+
+SECTION = Section('11. ConfigMaps & Secrets', [
+    Heading('ConfigMap', 2),
+    Code("""k create configmap app-config --from-literal=APP_COLOR=blue --from-literal=APP_MODE=prod
+k create configmap app-config --from-file=app.properties
+k get cm
+k describe cm app-config"""),
+
+    Yaml("""apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: app-config
+data:
+  APP_COLOR: blue
+  APP_MODE: prod"""),
+
+    Heading('Inject into Pod', 3),
+    Yaml("""# All keys as env vars
+envFrom:
+- configMapRef:
+    name: app-config
+
+# Single key
+env:
+- name: APP_COLOR
+  valueFrom:
+    configMapKeyRef:
+      name: app-config
+      key: APP_COLOR
+
+# As volume (files)
+volumes:
+- name: config-vol
+  configMap:
+    name: app-config"""),
+
+    Heading('Secret', 2),
+    Code("""k create secret generic app-secret --from-literal=DB_Host=mysql --from-literal=DB_Password=pass123
+k create secret tls webapp-tls --cert=tls.crt --key=tls.key
+k create secret docker-registry regcred \\
+  --docker-server=private-registry.io \\
+  --docker-username=user --docker-password=pass --docker-email=user@org.com
+k get secret app-secret -o yaml
+echo -n "bX1zcWw=" | base64 --decode     # decode secret value
+echo -n "myvalue" | base64               # encode for YAML"""),
+
+    Yaml("""apiVersion: v1
+kind: Secret
+metadata:
+  name: app-secret
+data:
+  DB_Host: bX1zcWw=          # base64 encoded
+  DB_Password: cGFzd3Jk
+
+# Inject same as ConfigMap:
+# envFrom: - secretRef: name: app-secret
+# OR env: - valueFrom: secretKeyRef: name/key"""),
+
+    Heading('Pull from Private Registry', 3),
+    Yaml("""spec:
+  containers:
+  - name: app
+    image: private-registry.io/apps/internal-app
+  imagePullSecrets:
+  - name: regcred"""),
+])
@@ -0,0 +1,48 @@
+"""12. Multi-Container Pods & Init Containers"""
+
+from cka_model import Diagram, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('12. Multi-Container Pods & Init Containers', [
+    Diagram('k8s-multi-container-patterns.png', 'Multi-container patterns: Sidecar, Ambassador, Adapter'),
+    Diagram('k8s-init-containers.png', 'Init containers run one after another before the main containers'),
+    Heading('Patterns', 2),
+    Paragraph('Sidecar: auxiliary (log shipper, proxy). Ambassador: proxy to external. Adapter: transforms output.'),
+
+    Heading('Sidecar Example', 3),
+    Yaml("""apiVersion: v1
+kind: Pod
+metadata:
+  name: app-with-sidecar
+spec:
+  containers:
+  - name: app
+    image: busybox
+    command: ['sh', '-c', 'while true; do echo "$(date) INFO running" >> /var/log/app.log; sleep 5; done']
+    volumeMounts:
+    - name: log-volume
+      mountPath: /var/log
+  - name: sidecar
+    image: busybox
+    command: ['sh', '-c', 'tail -f /var/log/app.log']
+    volumeMounts:
+    - name: log-volume
+      mountPath: /var/log
+  volumes:
+  - name: log-volume
+    emptyDir: {}"""),
+
+    Heading('Init Containers', 2),
+    Paragraph('Run to completion BEFORE main containers. Sequential. Failure → pod restarts.'),
+    Yaml("""spec:
+  initContainers:
+  - name: init-myservice
+    image: busybox:1.28
+    command: ['sh', '-c', 'until nslookup myservice; do echo waiting; sleep 2; done']
+  - name: init-mydb
+    image: busybox:1.28
+    command: ['sh', '-c', 'until nslookup mydb; do echo waiting; sleep 2; done']
+  containers:
+  - name: myapp
+    image: busybox:1.28
+    command: ['sh', '-c', 'echo running && sleep 3600']"""),
+])
@@ -0,0 +1,37 @@
+"""13. Probes — Liveness & Readiness"""
+
+from cka_model import Diagram, Paragraph, Section, Yaml
+
+SECTION = Section('13. Probes — Liveness & Readiness', [
+    Diagram('k8s-liveness-readiness.png', 'Liveness vs readiness probes'),
+    Paragraph('livenessProbe: fails → container restarted. readinessProbe: fails → removed from Service endpoints.'),
+    Paragraph('Types: httpGet, exec, tcpSocket'),
+
+    Yaml("""containers:
+- name: app
+  image: myapp:1.0
+  livenessProbe:
+    httpGet:
+      path: /healthz
+      port: 8080
+    initialDelaySeconds: 15
+    periodSeconds: 20
+  readinessProbe:
+    httpGet:
+      path: /ready
+      port: 8080
+    initialDelaySeconds: 5
+    periodSeconds: 10
+
+# Exec probe:
+  livenessProbe:
+    exec:
+      command: ["cat", "/tmp/healthy"]
+    initialDelaySeconds: 5
+
+# TCP probe:
+  readinessProbe:
+    tcpSocket:
+      port: 3306
+    initialDelaySeconds: 10"""),
+])
@@ -0,0 +1,23 @@
+"""14. Rolling Updates & Rollbacks"""
+
+from cka_model import Code, Diagram, Paragraph, Section, Yaml
+
+SECTION = Section('14. Rolling Updates & Rollbacks', [
+    Diagram('k8s-rolling-update.png', 'Rolling update: the new ReplicaSet gradually replaces the old one'),
+    Paragraph('Strategies: RollingUpdate (default, gradual) | Recreate (kill all, then create new)'),
+
+    Code("""k rollout status deployment/myapp
+k rollout history deployment/myapp
+k set image deployment/myapp nginx=nginx:1.25
+k rollout undo deployment/myapp
+k rollout undo deployment/myapp --to-revision=2
+k rollout pause deployment/myapp
+k rollout resume deployment/myapp"""),
+
+    Yaml("""spec:
+  strategy:
+    type: RollingUpdate
+    rollingUpdate:
+      maxSurge: 1           # max extra pods during rollout
+      maxUnavailable: 0     # all existing pods stay until new ones ready"""),
+])
@@ -0,0 +1,31 @@
+"""15. HPA — Horizontal Pod Autoscaler"""
+
+from cka_model import Code, Diagram, Paragraph, Section, Yaml
+
+SECTION = Section('15. HPA — Horizontal Pod Autoscaler', [
+    Diagram('k8s-hpa-flow.png', 'HPA flow: Metrics Server → HPA → Deployment scaling'),
+    Paragraph('Scales Deployment replicas based on CPU/memory. Requires Metrics Server. Pods MUST have resources.requests.'),
+
+    Code("""k autoscale deployment myapp --min=2 --max=10 --cpu-percent=80
+k get hpa
+k describe hpa myapp"""),
+
+    Yaml("""apiVersion: autoscaling/v2
+kind: HorizontalPodAutoscaler
+metadata:
+  name: myapp-hpa
+spec:
+  scaleTargetRef:
+    apiVersion: apps/v1
+    kind: Deployment
+    name: myapp
+  minReplicas: 2
+  maxReplicas: 10
+  metrics:
+  - type: Resource
+    resource:
+      name: cpu
+      target:
+        type: Utilization
+        averageUtilization: 80"""),
+])
@@ -0,0 +1,77 @@
+"""16. RBAC — Roles, Bindings, ServiceAccounts"""
+
+from cka_model import Code, Diagram, Heading, Section, Yaml
+
+SECTION = Section('16. RBAC — Roles, Bindings, ServiceAccounts', [
+    Diagram('k8s-rbac-flow.png', 'RBAC: Role/ClusterRole → RoleBinding/ClusterRoleBinding → User, Group, ServiceAccount'),
+    Heading('Imperative (Fastest in Exam)', 2),
+    Code("""k create role dev-role --verb=get,list,create,delete --resource=pods -n dev
+k create rolebinding dev-bind --role=dev-role --user=jane -n dev
+
+k create clusterrole node-viewer --verb=get,list --resource=nodes
+k create clusterrolebinding node-bind --clusterrole=node-viewer --user=jane
+
+# Check permissions
+k auth can-i create pods --as=jane -n dev
+k auth can-i '*' '*' --as=system:serviceaccount:default:my-sa
+k auth can-i list pods -n dev --as system:serviceaccount:dev:app-sa"""),
+
+    Heading('Role YAML', 2),
+    Yaml("""apiVersion: rbac.authorization.k8s.io/v1
+kind: Role
+metadata:
+  name: developer
+  namespace: dev
+rules:
+- apiGroups: [""]
+  resources: ["pods"]
+  verbs: ["get", "list", "create", "delete"]
+- apiGroups: [""]
+  resources: ["configmaps"]
+  verbs: ["create"]"""),
+
+    Heading('RoleBinding YAML', 2),
+    Yaml("""apiVersion: rbac.authorization.k8s.io/v1
+kind: RoleBinding
+metadata:
+  name: dev-binding
+  namespace: dev
+subjects:
+- kind: User
+  name: jane
+  apiGroup: rbac.authorization.k8s.io
+roleRef:
+  kind: Role
+  name: developer
+  apiGroup: rbac.authorization.k8s.io"""),
+
+    Heading('ClusterRole + ClusterRoleBinding', 2),
+    Yaml("""apiVersion: rbac.authorization.k8s.io/v1
+kind: ClusterRole
+metadata:
+  name: cluster-admin-role
+rules:
+- apiGroups: [""]
+  resources: ["nodes"]
+  verbs: ["get", "list", "delete", "create"]
+---
+apiVersion: rbac.authorization.k8s.io/v1
+kind: ClusterRoleBinding
+metadata:
+  name: cluster-admin-binding
+subjects:
+- kind: User
+  name: cluster-admin
+  apiGroup: rbac.authorization.k8s.io
+roleRef:
+  kind: ClusterRole
+  name: cluster-admin-role
+  apiGroup: rbac.authorization.k8s.io"""),
+
+    Heading('ServiceAccount', 2),
+    Code("""k create sa dashboard-sa
+k create token dashboard-sa    # short-lived token (1.24+)"""),
+    Yaml("""spec:
+  serviceAccountName: dashboard-sa
+  automountServiceAccountToken: false   # opt-out"""),
+])
@@ -0,0 +1,48 @@
+"""17. TLS & Certificates — CSR Workflow"""
+
+from cka_model import Bullet, Code, Diagram, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('17. TLS & Certificates — CSR Workflow', [
+    Diagram('k8s-security-tls-chain.png', 'Kubernetes TLS certificate chain: CA, API server and client components'),
+    Heading('Key Certificate Files (kubeadm)', 2),
+    Paragraph('All under /etc/kubernetes/pki/:'),
+    Bullet('ca.crt / ca.key — Cluster CA (root of trust)'),
+    Bullet('apiserver.crt / apiserver.key — API server TLS'),
+    Bullet('apiserver-kubelet-client.crt — API server → kubelet client cert'),
+    Bullet('apiserver-etcd-client.crt — API server → etcd client cert'),
+    Bullet('etcd/ca.crt, etcd/server.crt — etcd own CA and server cert'),
+
+    Heading('Certificate Inspection', 2),
+    Code("""openssl x509 -in /etc/kubernetes/pki/apiserver.crt -text -noout
+# Check: Not Before / Not After (expiry), Subject, Issuer, SAN
+openssl x509 -in /etc/kubernetes/pki/apiserver.crt -text -noout | grep -A2 Validity"""),
+
+    Heading('Create User Certificate (CSR Workflow)', 2),
+    Code("""# 1. Generate key and CSR
+openssl genrsa -out jane.key 2048
+openssl req -new -key jane.key -subj "/CN=jane/O=dev" -out jane.csr
+
+# 2. Base64 encode the CSR
+cat jane.csr | base64 | tr -d '\\n'"""),
+
+    Yaml("""# 3. CSR Object
+apiVersion: certificates.k8s.io/v1
+kind: CertificateSigningRequest
+metadata: { name: jane }
+spec:
+  request: <base64-encoded-csr>
+  signerName: kubernetes.io/kube-apiserver-client
+  usages: [client auth]"""),
+
+    Code("""# 4. Approve and extract
+k certificate approve jane
+k get csr jane -o jsonpath='{.status.certificate}' | base64 -d > jane.crt
+
+# 5. Configure kubeconfig
+k config set-credentials jane --client-certificate=jane.crt --client-key=jane.key
+k config set-context jane-ctx --cluster=kubernetes --user=jane
+k config use-context jane-ctx
+
+# Deny a CSR
+k certificate deny bad-user"""),
+])
@@ -0,0 +1,17 @@
+"""18. kubeconfig"""
+
+from cka_model import Code, Diagram, Paragraph, Section
+
+SECTION = Section('18. kubeconfig', [
+    Diagram('k8s-security-kubeconfig.png', 'kubeconfig: clusters, users and contexts'),
+    Paragraph('Default: ~/.kube/config. Contains: clusters (API server + CA), users (certs/tokens), contexts (cluster + user + ns).'),
+
+    Code("""k config view
+k config view --kubeconfig=my-config
+k config get-contexts
+k config current-context
+k config use-context <context>
+k config set-context --current --namespace=dev
+k config set-credentials user --client-certificate=user.crt --client-key=user.key
+k config set-context user-ctx --cluster=kubernetes --user=user"""),
+])
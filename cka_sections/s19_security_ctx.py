@@ -0,0 +1,26 @@
+"""19. Security Contexts"""
+
+from cka_model import Code, Paragraph, Section, Yaml
+
+SECTION = Section('19. Security Contexts', [
+    Paragraph('Pod-level or container-level. Container overrides pod. Capabilities only at container level.'),
+
+    Yaml("""spec:
+  securityContext:           # Pod-level
+    runAsUser: 1000
+    runAsGroup: 3000
+    fsGroup: 2000
+  containers:
+  - name: ubuntu
+    image: ubuntu
+    securityContext:          # Container-level (overrides pod)
+      runAsUser: 1000
+      runAsNonRoot: true
+      readOnlyRootFilesystem: true
+      capabilities:
+        add: ["NET_ADMIN", "SYS_TIME"]
+        drop: ["ALL"]"""),
+
+    Code("""k exec my-pod -- whoami
+k exec my-pod -- id"""),
+])
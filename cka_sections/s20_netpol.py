@@ -0,0 +1,64 @@
+"""20. NetworkPolicy"""
+
+from cka_model import Code, Diagram, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('20. NetworkPolicy', [
+    Diagram('k8s-security-network-policy.png', 'NetworkPolicy: deny all, then allow the required traffic'),
+    Paragraph('Controls ingress/egress to pods. Requires CNI with policy support (Calico, Cilium). Default: allow all. Once policy selects pod → deny all not explicitly allowed.'),
+
+    Heading('Default Deny All', 2),
+    Yaml("""apiVersion: networking.k8s.io/v1
+kind: NetworkPolicy
+metadata:
+  name: default-deny-all
+  namespace: prod
+spec:
+  podSelector: {}
+  policyTypes:
+  - Ingress
+  - Egress"""),
+
+    Heading('Allow Specific Ingress', 2),
+    Yaml("""apiVersion: networking.k8s.io/v1
+kind: NetworkPolicy
+metadata:
+  name: allow-api-to-db
+  namespace: prod
+spec:
+  podSelector:
+    matchLabels: { app: db }
+  policyTypes: [Ingress, Egress]
+  ingress:
+  - from:
+    - podSelector:
+        matchLabels: { app: api }
+    - namespaceSelector:
+        matchLabels: { env: prod }
+    ports: [{ protocol: TCP, port: 3306 }]
+  egress:
+  - to:
+    - podSelector:
+        matchLabels: { app: cache }
+    ports: [{ protocol: TCP, port: 6379 }]"""),
+
+    Heading('Cross-namespace & IP Block', 3),
+    Yaml("""# Cross-namespace access
+ingress:
+- from:
+  - namespaceSelector:
+      matchLabels:
+        name: monitoring
+
+# External CIDR access
+ingress:
+- from:
+  - ipBlock:
+      cidr: 203.0.113.0/24
+      except:
+      - 203.0.113.128/25"""),
+
+    Code("""# Test from debug pod
+k run test --rm -it --image=busybox:1.28 --restart=Never -- sh
+nc -zv db 3306
+wget -qO- http://web.default.svc.cluster.local:80"""),
+])
@@ -0,0 +1,60 @@
+"""21. Storage — PV, PVC, StorageClass"""
+
+from cka_model import Code, Diagram, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('21. Storage — PV, PVC, StorageClass', [
+    Diagram('k8s-storage-pv-pvc-pod.png', 'Storage flow: PV → PVC → Pod'),
+    Diagram('k8s-storage-dynamic-provisioning.png', 'Dynamic provisioning: PVC → StorageClass provisioner → PV → Pod'),
+    Heading('PersistentVolume (PV)', 2),
+    Yaml("""apiVersion: v1
+kind: PersistentVolume
+metadata:
+  name: pv1
+spec:
+  capacity: { storage: 1Gi }
+  accessModes: [ReadWriteOnce]        # RWO, ROX, RWX
+  persistentVolumeReclaimPolicy: Retain   # Retain, Delete, Recycle
+  hostPath: { path: /mnt/data }"""),
+
+    Heading('PersistentVolumeClaim (PVC)', 2),
+    Yaml("""apiVersion: v1
+kind: PersistentVolumeClaim
+metadata:
+  name: pvc1
+spec:
+  accessModes: [ReadWriteOnce]
+  resources:
+    requests: { storage: 500Mi }
+  storageClassName: ""     # empty = static binding only"""),
+
+    Heading('Using PVC in Pod', 2),
+    Yaml("""spec:
+  containers:
+  - name: app
+    image: nginx
+    volumeMounts:
+    - name: data
+      mountPath: /data
+  volumes:
+  - name: data
+    persistentVolumeClaim:
+      claimName: pvc1"""),
+
+    Heading('StorageClass (Dynamic Provisioning)', 2),
+    Yaml("""apiVersion: storage.k8s.io/v1
+kind: StorageClass
+metadata: { name: fast }
+provisioner: kubernetes.io/gce-pd
+parameters: { type: pd-ssd }
+reclaimPolicy: Delete
+allowVolumeExpansion: true"""),
+
+    Code("""k get pv
+k get pvc
+k get sc
+k describe pv pv1
+k describe pvc pvc1"""),
+
+    Paragraph('AccessModes: RWO (ReadWriteOnce) | ROX (ReadOnlyMany) | RWX (ReadWriteMany)'),
+    Paragraph('Volume Types: emptyDir (temp), hostPath (node), persistentVolumeClaim (persist), configMap, secret'),
+])
@@ -0,0 +1,32 @@
+"""22. Services & Networking"""
+
+from cka_model import Code, Diagram, Heading, Paragraph, Section
+
+SECTION = Section('22. Services & Networking', [
+    Diagram('k8s-pod-networking-cni.png', 'Pod networking: the CNI assigns IPs and pods talk across nodes'),
+    Diagram('k8s-service-to-pods.png', 'Service flow: ClusterIP → kube-proxy → Endpoints → Pods'),
+    Paragraph('Every Pod gets unique IP. Pods talk without NAT. Service = stable VIP + load balancing.'),
+
+    Heading('Service Types', 2),
+    Paragraph('ClusterIP (default): internal VIP. NodePort: node IP + port (30000-32767). LoadBalancer: cloud LB.'),
+
+    Heading('Linux Networking Commands (CKA)', 2),
+    Code("""ip link                              # list interfaces
+ip addr                              # show IPs
+ip route show                        # routing table
+ip route add 192.168.2.0/24 via 192.168.1.1
+ip route add default via 192.168.1.1
+cat /proc/sys/net/ipv4/ip_forward    # 0=disabled, 1=enabled
+echo 1 > /proc/sys/net/ipv4/ip_forward"""),
+
+    Heading('CNI (Container Network Interface)', 2),
+    Code("""ls /etc/cni/net.d/                   # CNI config
+ls /opt/cni/bin/                     # CNI binaries
+k get node -o jsonpath='{.spec.podCIDR}'"""),
+
+    Heading('Service Debugging', 2),
+    Code("""k get svc,endpoints <svc-name>
+# Empty endpoints → wrong selector
+iptables-save | grep <service-name>
+k logs -n kube-system -l k8s-app=kube-proxy"""),
+])
@@ -0,0 +1,18 @@
+"""23. DNS & CoreDNS"""
+
+from cka_model import Code, Diagram, Paragraph, Section
+
+SECTION = Section('23. DNS & CoreDNS', [
+    Diagram('k8s-dns-coredns.png', 'DNS resolution: Pod → CoreDNS → Service IP'),
+    Paragraph('CoreDNS: cluster internal DNS. Runs as pods in kube-system. Config in coredns ConfigMap (Corefile).'),
+    Paragraph('FQDN: Service → my-svc.my-ns.svc.cluster.local | Pod → 1-2-3-4.my-ns.pod.cluster.local'),
+
+    Code("""# Test DNS
+k run -it --rm debug --image=busybox:1.28 -- nslookup kubernetes
+k run -it --rm debug --image=busybox:1.28 -- nslookup <svc>.<ns>.svc.cluster.local
+
+# Check CoreDNS
+k get pods -n kube-system -l k8s-app=kube-dns
+k get configmap coredns -n kube-system -o yaml
+k logs <coredns-pod> -n kube-system"""),
+])
@@ -0,0 +1,66 @@
+"""24. Ingress"""
+
+from cka_model import Code, Diagram, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('24. Ingress', [
+    Diagram('k8s-ingress-flow.png', 'Ingress flow: External → Ingress Controller → Service → Pods'),
+    Paragraph('Requires Ingress Controller (e.g., nginx-ingress). Manages external HTTP/HTTPS access.'),
+
+    Heading('Path-based Routing', 2),
+    Yaml("""apiVersion: networking.k8s.io/v1
+kind: Ingress
+metadata:
+  name: app-ingress
+  annotations:
+    nginx.ingress.kubernetes.io/rewrite-target: /
+spec:
+  rules:
+  - http:
+      paths:
+      - path: /wear
+        pathType: Prefix
+        backend:
+          service: { name: wear-service, port: { number: 80 } }
+      - path: /watch
+        pathType: Prefix
+        backend:
+          service: { name: watch-service, port: { number: 80 } }"""),
+
+    Heading('Host-based Routing', 2),
+    Yaml("""spec:
+  rules:
+  - host: wear.example.com
+    http:
+      paths:
+      - path: /
+        pathType: Prefix
+        backend:
+          service: { name: wear-svc, port: { number: 80 } }
+  - host: watch.example.com
+    http:
+      paths:
+      - path: /
+        pathType: Prefix
+        backend:
+          service: { name: watch-svc, port: { number: 80 } }"""),
+
+    Heading('Ingress with TLS', 2),
+    Code("""k create secret tls webapp-tls --cert=tls.crt --key=tls.key -n apps"""),
+    Yaml("""spec:
+  tls:
+  - hosts:
+    - webapp.example.com
+    secretName: webapp-tls
+  rules:
+  - host: webapp.example.com
+    http:
+      paths:
+      - path: /
+        pathType: Prefix
+        backend:
+          service: { name: webapp-svc, port: { number: 80 } }"""),
+
+    Code("""k create ingress my-ingress --rule="host/path=svc:80" --dry-run=client -o yaml
+k get ingress
+k describe ingress app-ingress"""),
+])
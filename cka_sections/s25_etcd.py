@@ -0,0 +1,30 @@
+"""25. ETCD Backup & Restore"""
+
+from cka_model import Code, Diagram, ExamNote, Heading, Section
+
+SECTION = Section('25. ETCD Backup & Restore', [
+    Diagram('k8s-etcd-raft.png', 'etcd RAFT consensus: the leader replicates writes to followers'),
+    ExamNote('This appears in almost every CKA exam. Memorize the command with cert paths.'),
+
+    Heading('Backup', 2),
+    Code("""ETCDCTL_API=3 etcdctl snapshot save /tmp/etcd.db \\
+  --endpoints=https://127.0.0.1:2379 \\
+  --cacert=/etc/kubernetes/pki/etcd/ca.crt \\
+  --cert=/etc/kubernetes/pki/etcd/server.crt \\
+  --key=/etc/kubernetes/pki/etcd/server.key
+
+# Verify
+ETCDCTL_API=3 etcdctl snapshot status /tmp/etcd.db"""),
+
+    Heading('Restore', 2),
+    Code("""# Restore to new data directory
+etcdutl snapshot restore /tmp/etcd.db --data-dir=/var/lib/etcd-restored
+
+# Update etcd static pod manifest
+vi /etc/kubernetes/manifests/etcd.yaml
+# Change: hostPath.path → /var/lib/etcd-restored
+
+# Restart kubelet
+systemctl daemon-reload
+systemctl restart kubelet"""),
+])
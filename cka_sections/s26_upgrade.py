@@ -0,0 +1,43 @@
+"""26. Cluster Upgrade (kubeadm)"""
+
+from cka_model import Code, Heading, Paragraph, Section
+
+SECTION = Section('26. Cluster Upgrade (kubeadm)', [
+    Paragraph('Rule: Upgrade one minor version at a time. Control plane first, then workers.'),
+
+    Heading('Control Plane', 2),
+    Code("""# 1. Upgrade kubeadm
+apt-mark unhold kubeadm
+apt-get update && apt-get install -y kubeadm=1.XX.0-*
+apt-mark hold kubeadm
+
+# 2. Plan and apply
+kubeadm upgrade plan
+kubeadm upgrade apply v1.XX.0
+
+# 3. Drain control plane node
+kubectl drain <cp-node> --ignore-daemonsets --delete-emptydir-data
+
+# 4. Upgrade kubelet and kubectl
+apt-mark unhold kubelet kubectl
+apt-get install -y kubelet=1.XX.0-* kubectl=1.XX.0-*
+apt-mark hold kubelet kubectl
+systemctl daemon-reload && systemctl restart kubelet
+
+# 5. Uncordon
+kubectl uncordon <cp-node>"""),
+
+    Heading('Worker Nodes', 2),
+    Code("""# From control plane:
+kubectl drain <worker> --ignore-daemonsets --delete-emptydir-data
+
+# On worker node:
+apt-mark unhold kubeadm kubelet
+apt-get install -y kubeadm=1.XX.0-* kubelet=1.XX.0-*
+kubeadm upgrade node
+systemctl daemon-reload && systemctl restart kubelet
+apt-mark hold kubeadm kubelet
+
+# From control plane:
+kubectl uncordon <worker>"""),
+])
@@ -0,0 +1,17 @@
+"""27. Node Maintenance — Cordon, Drain, Uncordon"""
+
+from cka_model import Code, Diagram, Paragraph, Section
+
+SECTION = Section('27. Node Maintenance — Cordon, Drain, Uncordon', [
+    Diagram('k8s-cordon-drain-uncordon.png', 'Node maintenance: cordon, drain, uncordon'),
+    Paragraph('cordon = no new pods | drain = cordon + evict | uncordon = allow scheduling again'),
+    Paragraph('If node is down > 5 min, pods may be terminated by controller.'),
+
+    Code("""kubectl cordon <node>                          # mark unschedulable
+kubectl drain <node> --ignore-daemonsets --delete-emptydir-data
+kubectl drain <node> --ignore-daemonsets --delete-emptydir-data --force
+kubectl uncordon <node>                        # re-enable scheduling
+
+# Typical workflow:
+# 1. drain → 2. perform maintenance → 3. uncordon → 4. verify with kubectl get nodes"""),
+])
@@ -0,0 +1,19 @@
+"""28. PodDisruptionBudget (PDB)"""
+
+from cka_model import Code, Paragraph, Section, Yaml
+
+SECTION = Section('28. PodDisruptionBudget (PDB)', [
+    Paragraph('Limits voluntary disruptions. drain respects PDBs.'),
+
+    Yaml("""apiVersion: policy/v1
+kind: PodDisruptionBudget
+metadata:
+  name: myapp-pdb
+spec:
+  minAvailable: 2       # OR maxUnavailable: 1
+  selector:
+    matchLabels: { app: myapp }"""),
+
+    Code("""k get pdb
+k describe pdb myapp-pdb"""),
+])
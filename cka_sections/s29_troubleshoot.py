@@ -0,0 +1,82 @@
+"""29. Troubleshooting Checklist (30% of Exam)"""
+
+from cka_model import Code, Diagram, Heading, Section
+
+SECTION = Section('29. Troubleshooting Checklist (30% of Exam)', [
+    Diagram('k8s-troubleshooting-flowchart.png', 'Troubleshooting decision flowchart'),
+    Heading('Application Failure', 2),
+    Code("""# 1. Check pod status
+k get pods -o wide
+k describe pod <name>
+
+# 2. Check logs (current + previous crashed instance)
+k logs <pod> -c <container> --previous
+
+# 3. Check Service & Endpoints
+k get svc,endpoints <svc-name>
+# Empty endpoints → wrong selector. Compare:
+k describe svc <name>      # see Selector
+k get pods --show-labels    # see pod labels
+
+# 4. Exec into pod
+k exec -it <pod> -- sh"""),
+
+    Heading('Control Plane Failure', 2),
+    Code("""# Static pods in kube-system
+k get pods -n kube-system
+k logs kube-apiserver-master -n kube-system
+k logs kube-scheduler-master -n kube-system
+k logs kube-controller-manager-master -n kube-system
+
+# Check etcd
+ETCDCTL_API=3 etcdctl endpoint health \\
+  --endpoints=https://127.0.0.1:2379 \\
+  --cacert=/etc/kubernetes/pki/etcd/ca.crt \\
+  --cert=/etc/kubernetes/pki/etcd/server.crt \\
+  --key=/etc/kubernetes/pki/etcd/server.key"""),
+
+    Heading('Worker Node Failure', 2),
+    Code("""k get nodes
+k describe node <node>        # check Conditions, LastHeartbeatTime
+
+# On the node:
+systemctl status kubelet
+journalctl -u kubelet -f
+systemctl status containerd
+
+# Common fixes:
+systemctl start kubelet
+systemctl daemon-reload && systemctl restart kubelet
+
+# Check kubelet config
+cat /var/lib/kubelet/config.yaml
+cat /etc/kubernetes/kubelet.conf
+
+# Check certs
+openssl x509 -in /var/lib/kubelet/<node>.crt -text -noout"""),
+
+    Heading('Network Troubleshooting', 2),
+    Code("""# 1. Check CNI pods
+k get pods -n kube-system   # Calico/Flannel/Weave running?
+
+# 2. Check CoreDNS
+k get pods -n kube-system -l k8s-app=kube-dns
+
+# 3. Test DNS
+k run dns-test --image=busybox:1.28 --rm -it --restart=Never -- nslookup kubernetes
+
+# 4. Check kube-proxy
+k get ds kube-proxy -n kube-system
+iptables -L -t nat | grep <svc>
+
+# 5. Check IP forwarding
+cat /proc/sys/net/ipv4/ip_forward
+
+# 6. Debug from inside cluster
+k run netshoot --image=nicolaka/netshoot -it --rm --restart=Never -- bash
+
+# 7. Required ports: 6443 (API), 2379-2380 (etcd), 10250-10252 (kubelet,etc), 30000-32767 (NodePort)
+
+# 8. Certificate validity
+openssl x509 -in /etc/kubernetes/pki/apiserver.crt -text -noout | grep -A2 Validity"""),
+])
@@ -0,0 +1,41 @@
+"""30. JSONPath & Output Formatting"""
+
+from cka_model import Code, Section
+
+SECTION = Section('30. JSONPath & Output Formatting', [
+    Code("""# Single value
+k get pod x -o jsonpath='{.spec.nodeName}'
+
+# All pod names
+k get pods -o jsonpath='{.items[*].metadata.name}'
+
+# Range (formatted output)
+k get nodes -o jsonpath='{range .items[*]}{.metadata.name}{"\\t"}{.status.capacity.cpu}{"\\n"}{end}'
+
+# Filter
+k get nodes -o jsonpath='{.items[*].status.addresses[?(@.type=="InternalIP")].address}'
+
+# Custom columns
+k get pods -A -o custom-columns=NAME:.metadata.name,NODE:.spec.nodeName,IMAGE:.spec.containers[0].image
+
+# Sort
+k get pods --sort-by=.metadata.creationTimestamp
+k get nodes --sort-by=.status.capacity.cpu
+k get pods --sort-by='.status.containerStatuses[0].restartCount'
+
+# Output to file (exam)
+k get nodes -o json > /opt/output.json
+k get nodes -o jsonpath='{.items[*].status.nodeInfo.osImage}' > /opt/os.txt
+
+# Count
+k get pods -A --no-headers | wc -l
+
+# All images running in cluster
+k get pods -A -o jsonpath='{range .items[*]}{.spec.containers[*].image}{"\\n"}{end}' | sort | uniq
+
+# Find pod's node
+k get pod <name> -o jsonpath='{.spec.nodeName}'
+
+# Decode secret
+k get secret <name> -o jsonpath='{.data.password}' | base64 --decode"""),
+])
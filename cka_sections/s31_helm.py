@@ -0,0 +1,35 @@
+"""31. Helm"""
+
+from cka_model import Code, Paragraph, Section
+
+SECTION = Section('31. Helm', [
+    Paragraph('Package manager for Kubernetes. Charts = templated YAML. Helm 3 (no Tiller). Release = deployed chart instance.'),
+
+    Code("""# Add repo
+helm repo add bitnami https://charts.bitnami.com/bitnami
+helm repo update
+
+# Install
+helm install my-nginx bitnami/nginx
+helm install my-nginx bitnami/nginx -f values.yaml
+helm install my-nginx bitnami/nginx --set service.port=8080
+
+# List releases
+helm list
+helm list -A
+
+# Upgrade
+helm upgrade my-nginx bitnami/nginx --set replicaCount=3
+
+# Rollback
+helm rollback my-nginx 1
+
+# Uninstall
+helm uninstall my-nginx
+
+# Template (render without installing)
+helm template my-nginx bitnami/nginx -f values.yaml
+
+# Show default values
+helm show values bitnami/nginx"""),
+])
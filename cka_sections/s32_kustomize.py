@@ -0,0 +1,34 @@
+"""32. Kustomize"""
+
+from cka_model import Code, Paragraph, Section, Yaml
+
+SECTION = Section('32. Kustomize', [
+    Paragraph('Built into kubectl. Patch-based customization without templating. Uses kustomization.yaml.'),
+
+    Yaml("""# Base: kustomization.yaml
+apiVersion: kustomize.config.k8s.io/v1beta1
+kind: Kustomization
+resources:
+  - deployment.yaml
+  - service.yaml
+
+# Overlay: overlays/prod/kustomization.yaml
+apiVersion: kustomize.config.k8s.io/v1beta1
+kind: Kustomization
+resources:
+  - ../../base
+patches:
+  - target:
+      kind: Deployment
+      name: myapp
+    patch: |-
+      - op: replace
+        path: /spec/replicas
+        value: 5
+images:
+  - name: myapp
+    newTag: v2.0"""),
+
+    Code("""kubectl apply -k overlays/prod
+kubectl kustomize overlays/prod   # preview without applying"""),
+])
@@ -0,0 +1,50 @@
+"""33. kubeadm Installation"""
+
+from cka_model import Code, Diagram, Heading, Section
+
+SECTION = Section('33. kubeadm Installation', [
+    Diagram('k8s-kubeadm-flow.png', 'kubeadm init and join flow'),
+    Heading('Prerequisites (All Nodes)', 2),
+    Code("""# Disable swap
+sudo swapoff -a
+sed -i '/ swap / s/^/#/' /etc/fstab
+
+# Kernel modules
+cat <<EOF | sudo tee /etc/modules-load.d/k8s.conf
+overlay
+br_netfilter
+EOF
+sudo modprobe overlay
+sudo modprobe br_netfilter
+
+# Sysctl
+cat <<EOF | sudo tee /etc/sysctl.d/k8s.conf
+net.bridge.bridge-nf-call-iptables  = 1
+net.bridge.bridge-nf-call-ip6tables = 1
+net.ipv4.ip_forward                 = 1
+EOF
+sudo sysctl --system
+
+# Install packages
+sudo apt-get update
+sudo apt-get install -y kubelet kubeadm kubectl
+sudo apt-mark hold kubelet kubeadm kubectl"""),
+
+    Heading('Control Plane Init', 2),
+    Code("""sudo kubeadm init --pod-network-cidr=10.244.0.0/16 --apiserver-advertise-address=<master-ip>
+
+# Copy kubeconfig
+mkdir -p $HOME/.kube
+sudo cp -i /etc/kubernetes/admin.conf $HOME/.kube/config
+sudo chown $(id -u):$(id -g) $HOME/.kube/config
+
+# Install CNI (e.g. Flannel)
+kubectl apply -f https://raw.githubusercontent.com/flannel-io/flannel/master/Documentation/kube-flannel.yml"""),
+
+    Heading('Join Workers', 2),
+    Code("""# Use token from kubeadm init output:
+sudo kubeadm join <master-ip>:6443 --token <token> --discovery-token-ca-cert-hash sha256:<hash>
+
+# If token expired:
+kubeadm token create --print-join-command"""),
+])
@@ -0,0 +1,17 @@
+"""34. CRDs & Operators"""
+
+from cka_model import Code, Heading, Paragraph, Section
+
+SECTION = Section('34. CRDs & Operators', [
+    Paragraph('Custom Resource Definitions (CRDs) extend the API with custom types.'),
+    Paragraph('Operators = CRD + Controller that manages lifecycle (install, upgrade, backup).'),
+
+    Code("""k get crd
+k get <custom-resource-name>
+k describe crd <name>"""),
+
+    Heading('Extension Interfaces', 2),
+    Paragraph('CNI (Container Network Interface): pod networking plugins (Calico, Flannel, Weave)'),
+    Paragraph('CSI (Container Storage Interface): storage drivers for PVs'),
+    Paragraph('CRI (Container Runtime Interface): container runtimes (containerd, CRI-O)'),
+])
@@ -0,0 +1,134 @@
+"""35. Practice Scenarios & Mock Questions"""
+
+from cka_model import Scenario, Section
+
+scenarios = [
+    Scenario("Scenario 1: Deployment + Service",
+     "Create deployment nginx-deploy --image=nginx:1.21 --replicas=3 -n app. Expose as ClusterIP service nginx-svc on port 80.",
+     """k create deployment nginx-deploy --image=nginx:1.21 --replicas=3 -n app
+k expose deployment nginx-deploy --name=nginx-svc --port=80 -n app
+k get deploy,svc -n app"""),
+
+    Scenario("Scenario 2: RBAC — read-only pods",
+     "Create Role allowing get,list on pods in dev namespace. Bind to user jane.",
+     """k create role pod-reader --verb=get,list --resource=pods -n dev
+k create rolebinding jane-pod-reader --role=pod-reader --user=jane -n dev
+k auth can-i get pods --as=jane -n dev"""),
+
+    Scenario("Scenario 3: Static Pod",
+     "Create static pod static-busybox (busybox, sleep 3600) on control plane.",
+     """cat <<EOF > /etc/kubernetes/manifests/static-busybox.yaml
+apiVersion: v1
+kind: Pod
+metadata:
+  name: static-busybox
+spec:
+  containers:
+  - name: busybox
+    image: busybox:1.28
+    command: ["sleep", "3600"]
+EOF"""),
+
+    Scenario("Scenario 4: etcd Backup",
+     "Snapshot etcd to /tmp/etcd-snapshot.db with correct certs.",
+     """ETCDCTL_API=3 etcdctl snapshot save /tmp/etcd-snapshot.db \\
+  --endpoints=https://127.0.0.1:2379 \\
+  --cacert=/etc/kubernetes/pki/etcd/ca.crt \\
+  --cert=/etc/kubernetes/pki/etcd/server.crt \\
+  --key=/etc/kubernetes/pki/etcd/server.key"""),
+
+    Scenario("Scenario 5: PV + PVC + Pod",
+     "PV pv-log 100Mi RWX hostPath /pv/log. PVC claim-log-1 50Mi RWX. Pod logger (nginx) mount at /var/log/nginx.",
+     """# PV
+apiVersion: v1
+kind: PersistentVolume
+metadata: { name: pv-log }
+spec:
+  capacity: { storage: 100Mi }
+  accessModes: [ReadWriteMany]
+  hostPath: { path: /pv/log }
+---
+# PVC
+apiVersion: v1
+kind: PersistentVolumeClaim
+metadata: { name: claim-log-1 }
+spec:
+  accessModes: [ReadWriteMany]
+  resources: { requests: { storage: 50Mi } }
+---
+# Pod
+apiVersion: v1
+kind: Pod
+metadata: { name: logger }
+spec:
+  containers:
+  - name: nginx
+    image: nginx
+    volumeMounts: [{ name: log-vol, mountPath: /var/log/nginx }]
+  volumes:
+  - name: log-vol
+    persistentVolumeClaim: { claimName: claim-log-1 }"""),
+
+    Scenario("Scenario 6: NetworkPolicy — deny all + allow specific",
+     "Namespace secure. Select pods app=db. Allow ingress only from app=api on TCP 5432.",
+     """apiVersion: networking.k8s.io/v1
+kind: NetworkPolicy
+metadata:
+  name: db-policy
+  namespace: secure
+spec:
+  podSelector: { matchLabels: { app: db } }
+  policyTypes: [Ingress]
+  ingress:
+  - from:
+    - podSelector: { matchLabels: { app: api } }
+    ports: [{ protocol: TCP, port: 5432 }]"""),
+
+    Scenario("Scenario 7: Cluster Upgrade (v1.30 → v1.31)",
+     "Upgrade control plane to v1.31.0.",
+     """sudo apt-mark unhold kubeadm
+sudo apt-get update && sudo apt-get install -y kubeadm=1.31.0-*
+sudo apt-mark hold kubeadm
+sudo kubeadm upgrade plan
+sudo kubeadm upgrade apply v1.31.0
+kubectl drain <cp-node> --ignore-daemonsets
+sudo apt-mark unhold kubelet kubectl
+sudo apt-get install -y kubelet=1.31.0-* kubectl=1.31.0-*
+sudo apt-mark hold kubelet kubectl
+sudo systemctl daemon-reload && sudo systemctl restart kubelet
+kubectl uncordon <cp-node>"""),
+
+    Scenario("Scenario 8: Ingress with TLS",
+     "Create TLS secret webapp-tls. Ingress webapp-ingress TLS on webapp.example.com → webapp-svc:80.",
+     """k create secret tls webapp-tls --cert=tls.crt --key=tls.key -n apps
+# Ingress:
+spec:
+  tls:
+  - hosts: [webapp.example.com]
+    secretName: webapp-tls
+  rules:
+  - host: webapp.example.com
+    http:
+      paths:
+      - path: /
+        pathType: Prefix
+        backend:
+          service: { name: webapp-svc, port: { number: 80 } }"""),
+
+    Scenario("Scenario 9: Multi-container Pod Logs",
+     "Stream previous logs from sidecar container in myapp-pod.",
+     """kubectl logs myapp-pod -c sidecar --previous -f"""),
+
+    Scenario("Scenario 10: JSONPath Queries",
+     "List nodes sorted by CPU. Custom columns for pods. Get InternalIP of all nodes.",
+     """# Nodes sorted by CPU
+k get nodes --sort-by=.status.capacity.cpu
+
+# Custom columns
+k get pods -A -o=custom-columns='NAME:.metadata.name,IMAGE:.spec.containers[*].image'
+
+# InternalIP
+k get nodes -o jsonpath='{.items[*].status.addresses[?(@.type=="InternalIP")].address}'"""),
+]
+
+SECTION = Section('35. Practice Scenarios & Mock Questions', scenarios)
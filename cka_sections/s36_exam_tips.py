@@ -0,0 +1,99 @@
+"""36. Exam Tips & Common Mistakes"""
+
+from cka_model import Bullet, Code, Heading, Paragraph, Section, Yaml
+
+SECTION = Section('36. Exam Tips & Common Mistakes', [
+    Heading('Time Management', 2),
+    Paragraph('2 hours, ~17 questions. Average ~7 min/question. Flag hard ones, return later. High-weight first (troubleshooting = 30%).'),
+
+    Heading('Essential Bookmarks for Exam', 2),
+    Bullet('kubernetes.io/docs/reference/kubectl/cheatsheet/'),
+    Bullet('kubernetes.io/docs/concepts/ (Workloads, Services, Storage, Config)'),
+    Bullet('kubernetes.io/docs/tasks/ (Administer Cluster, Manage TLS, Configure Pods)'),
+    Bullet('kubernetes.io/docs/reference/ (API Reference)'),
+
+    Heading('Common Mistakes to Avoid', 2),
+    Bullet('Forgetting to switch context: k config use-context <context> — each question may use different cluster'),
+    Bullet('Wrong namespace — always check and use -n <ns>'),
+    Bullet('YAML indentation errors — use k apply -f and read the error'),
+    Bullet('Not verifying — always k get / k describe to confirm'),
+    Bullet('Spending too long on one question — flag and move on'),
+    Bullet('Forgetting --dry-run=client -o yaml — fastest way to generate templates'),
+
+    Heading('Useful One-Liners', 2),
+    Code("""# All pods with node info
+k get pods -A -o wide
+
+# Events sorted by time
+k get events -A --sort-by='.lastTimestamp'
+
+# Watch pods live
+k get pods -w
+
+# Delete stuck Terminating pod
+k delete pod <name> --force --grace-period=0
+
+# All images in cluster
+k get pods -A -o jsonpath='{range .items[*]}{.spec.containers[*].image}{"\\n"}{end}' | sort | uniq
+
+# Quick test pod
+k run tmp --image=busybox:1.28 --rm -it --restart=Never -- sh
+
+# Decode secret
+k get secret <name> -o jsonpath='{.data.password}' | base64 --decode
+
+# Find static pod path
+grep staticPodPath /var/lib/kubelet/config.yaml
+
+# Component health
+k get --raw='/readyz?verbose'"""),
+
+    Heading('Priority Classes (Pod Scheduling)', 2),
+    Yaml("""apiVersion: scheduling.k8s.io/v1
+kind: PriorityClass
+metadata: { name: high-priority }
+value: 1000000
+globalDefault: false
+preemptionPolicy: PreemptLowerPriority
+
+# Use in Pod:
+spec:
+  priorityClassName: high-priority"""),
+
+    Heading('Admission Controllers', 2),
+    Paragraph('Intercept API requests after auth. Validating: accept/reject (PodSecurity, ResourceQuota). Mutating: modify (DefaultStorageClass, ServiceAccount). Configure via --enable-admission-plugins on kube-apiserver.'),
+
+    Heading('API Groups Quick Reference', 2),
+    Code("""# Core group (no prefix):  apiVersion: v1
+# Pod, Service, ConfigMap, Secret, Namespace, PV, PVC, Endpoints
+
+# apps group:  apiVersion: apps/v1
+# Deployment, ReplicaSet, DaemonSet, StatefulSet
+
+# batch group:  apiVersion: batch/v1
+# Job, CronJob
+
+# networking group:  apiVersion: networking.k8s.io/v1
+# NetworkPolicy, Ingress
+
+# rbac group:  apiVersion: rbac.authorization.k8s.io/v1
+# Role, ClusterRole, RoleBinding, ClusterRoleBinding
+
+# storage group:  apiVersion: storage.k8s.io/v1
+# StorageClass
+
+# policy group:  apiVersion: policy/v1
+# PodDisruptionBudget
+
+# autoscaling group:  apiVersion: autoscaling/v2
+# HorizontalPodAutoscaler
+
+# certificates group:  apiVersion: certificates.k8s.io/v1
+# CertificateSigningRequest
+
+# scheduling group:  apiVersion: scheduling.k8s.io/v1
+# PriorityClass
+
+k api-resources          # full list
+k api-versions           # all API versions"""),
+], page_break=False)
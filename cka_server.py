@@ -0,0 +1,300 @@
+"""Local HTTP server that generates cheat sheets on demand.
+
+Start it with ``python generate_cka_doc.py --serve [HOST:]PORT`` and fetch
+``/cheatsheet.docx`` (or ``.html`` / ``.md``), optionally with
+``?sections=16,17,20``. The process stays warm between requests:
+
+- the styled base template is generated once and every request builds on
+  a deep copy of its parsed prototype, so no XML is re-parsed;
+- rendered section fragments live in a ``MemoryFragmentCache``, so a
+  request only renders sections no earlier request has rendered;
+- identical requests that arrive while a build is running wait for that
+  build instead of starting their own;
+- builds run in a fixed-size pool, however many connections are open.
+
+A .docx is streamed: ``cka_stream.write_streaming()`` renders it section
+by section into a chunked response (zip members with data descriptors),
+so the first bytes go out before the last section is rendered. HTML and
+Markdown are sent with a ``Content-Length`` once complete. The HTML page
+is post-processed as a whole (pre-rendered blocks and submenus), and
+both are small enough that streaming would gain nothing. HTTP/1.0
+clients, which cannot take chunked responses, get every document that
+way.
+"""
+
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import cka_sections
+from cka_cache import MemoryFragmentCache
+from generate_cka_doc import TARGETS, BaseTemplate, DocumentBuilder, build, render_target, sections_for
+
+CHUNK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'html': 'text/html; charset=utf-8',
+    'md': 'text/markdown; charset=utf-8',
+}
+
+
+class Generator:
+    """Builds documents from a warm template and fragment cache.
+
+    ``workers`` caps how many builds run at once. ``cache_dir`` backs the
+    in-memory fragments with the on-disk cache (and loads the template from
+    it); without it everything is kept in memory only. Diagram print
+    variants are cached under ``diagram_cache_dir`` (see
+    ``generate_cka_doc.build()``).
+    """
+
+    def __init__(self, workers=2, cache_dir=None, compress_level=None, diagram_cache_dir=None):
+        if cache_dir is None:
+            self.template = BaseTemplate.default()
+        else:
+            self.template = BaseTemplate.load(cache_dir)
+        self.cache = MemoryFragmentCache(cache_dir)
+        self.compress_level = compress_level
+        self.diagram_cache_dir = diagram_cache_dir
+        self.builds = 0
+        self.coalesced = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='build')
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _submit(self, key, fn, *args):
+        """Return ``(future, new)`` for ``key``, running ``fn`` unless it already is."""
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._pool.submit(fn, *args)
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future, True
+
+    def warm(self):
+        """Render every section once so later requests only splice fragments."""
+        self.document('docx')
+
+    def document(self, target, numbers=None):
+        """Return ``target`` for sections ``numbers`` (all by default) as bytes.
+
+        Concurrent calls with the same arguments share a single build.
+        """
+        key = (target, None if numbers is None else tuple(numbers))
+        return self._submit(key, self._build, target, numbers)[0].result()
+
+    def stream(self, out, numbers=None):
+        """Write the .docx for sections ``numbers`` to ``out`` while it is rendered.
+
+        ``out`` need not be seekable. If an identical build is already
+        running, its result is written once it is done instead. A failing
+        ``out`` (e.g. a closed connection) does not stop the build, since
+        other requests may be waiting for it; its error is raised once the
+        build is done.
+        """
+        key = ('docx', None if numbers is None else tuple(numbers))
+        tee = _Tee(out)
+        future, new = self._submit(key, self._stream, numbers, tee)
+        data = future.result()
+        if not new:
+            tee.write(data)
+        elif tee.error is not None:
+            raise tee.error
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _build(self, target, numbers):
+        sections = sections_for(numbers)
+        if target == 'docx':
+            builder = DocumentBuilder(template=self.template, compress_level=self.compress_level)
+            build(builder, self.cache, sections, self.diagram_cache_dir)
+        else:
+            builder = render_target(target, sections)
+        out = io.BytesIO()
+        builder.save(out)
+        with self._lock:
+            self.builds += 1
+        return out.getvalue()
+
+    def _stream(self, numbers, tee):
+        from cka_stream import write_streaming
+
+        builder = DocumentBuilder(template=self.template, compress_level=self.compress_level)
+        tee.copy = io.BytesIO()
+        write_streaming(tee, sections_for(numbers), builder, self.cache, self.diagram_cache_dir)
+        with self._lock:
+            self.builds += 1
+        return tee.copy.getvalue()
+
+    def close(self):
+        self._pool.shutdown()
+
+
+class _Tee:
+    """Non-seekable stream that writes to ``out`` and, once set, ``copy``.
+
+    The copy is the result handed to coalesced requests. Errors writing to
+    ``out`` are kept in ``error`` rather than raised.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self.copy = None
+        self.error = None
+
+    def seekable(self):
+        return False
+
+    def write(self, data):
+        if self.copy is not None:
+            self.copy.write(data)
+        if self.error is None:
+            try:
+                self.out.write(data)
+            except OSError as e:
+                self.error = e
+        if self.error is not None and self.copy is None:
+            raise self.error
+
+
+class _ChunkedResponse:
+    """Writes a 200 response with chunked transfer encoding to ``handler``.
+
+    The status line and headers go out with the first chunk, so a build
+    that fails before producing output can still be answered with an error.
+    """
+
+    def __init__(self, handler, headers):
+        self.handler = handler
+        self.headers = headers
+        self.started = False
+        self._buffer = bytearray()
+
+    def seekable(self):
+        return False
+
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self.started:
+            self.handler.send_response(200)
+            for name, value in self.headers:
+                self.handler.send_header(name, value)
+            self.handler.send_header('Transfer-Encoding', 'chunked')
+            self.handler.end_headers()
+            self.started = True
+        if self._buffer:
+            self.handler.wfile.write(b'%x\r\n%s\r\n' % (len(self._buffer), self._buffer))
+            self._buffer.clear()
+
+    def close(self):
+        """Send what is buffered and the final, empty chunk."""
+        self._flush()
+        self.handler.wfile.write(b'0\r\n\r\n')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'CKACheatSheet/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        name, _, target = url.path.lstrip('/').rpartition('.')
+        if name != 'cheatsheet' or target not in TARGETS:
+            self._error(404, 'try /cheatsheet.docx, /cheatsheet.html or /cheatsheet.md')
+            return
+        numbers = None
+        selection = parse_qs(url.query).get('sections')
+        if selection:
+            try:
+                numbers = cka_sections.parse_selection(selection[-1])
+            except ValueError as e:
+                self._error(400, f'sections: {e}')
+                return
+        headers = [('Content-Type', CONTENT_TYPES[target])]
+        if target == 'docx':
+            headers.append(('Content-Disposition', 'attachment; filename="CKA_Cheat_Sheet.docx"'))
+        if target == 'docx' and self.request_version != 'HTTP/1.0':
+            self._stream(numbers, headers)
+            return
+        try:
+            data = self.server.generator.document(target, numbers)
+        except Exception as e:
+            self.log_error('build failed: %r', e)
+            self._error(500, 'build failed')
+            return
+
+        self.send_response(200)
+        for header in headers:
+            self.send_header(*header)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        view = memoryview(data)
+        for start in range(0, len(view), CHUNK_SIZE):
+            self.wfile.write(view[start:start + CHUNK_SIZE])
+
+    def _stream(self, numbers, headers):
+        response = _ChunkedResponse(self, headers)
+        try:
+            self.server.generator.stream(response, numbers)
+            response.close()
+        except OSError as e:
+            self.log_error('client went away: %r', e)
+            self.close_connection = True
+        except Exception as e:
+            self.log_error('build failed: %r', e)
+            if response.started:
+                # Too late for an error status: a truncated chunked body
+                # tells the client the response is incomplete.
+                self.close_connection = True
+            else:
+                self._error(500, 'build failed')
+
+    def _error(self, status, message):
+        body = (message + '\n').encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(address, generator, quiet=False):
+    """Return an HTTP server for ``generator`` bound to ``(host, port)``."""
+    server = ThreadingHTTPServer(address, _Handler)
+    server.daemon_threads = True
+    server.generator = generator
+    server.quiet = quiet
+    return server
+
+
+def serve(address, workers=2, cache_dir=None, compress_level=None, quiet=False, diagram_cache_dir=None):
+    """Warm up a ``Generator`` and serve it on ``(host, port)`` until interrupted."""
+    generator = Generator(workers, cache_dir, compress_level, diagram_cache_dir)
+    generator.warm()
+    server = make_server(address, generator, quiet)
+    host, port = server.server_address[:2]
+    print(f'Serving on http://{host}:{port}/cheatsheet.docx', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        generator.close()
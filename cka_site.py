@@ -0,0 +1,144 @@
+"""Build the static site into a ``dist/`` directory.
+
+The pages, stylesheet and script are copied from the repository. The
+diagrams in ``assets/`` get responsive variants next to them (see
+``cka_assets``), and the pages' ``<img>`` tags are rewritten to use those.
+The originals are still copied, since the sitemap and other sites link to
+them. ``SEARCH_PAGE`` gets a prebuilt search index under ``search/`` (see
+``cka_search``), linked from a ``<meta name="cka-search-index">`` tag that
+``script.js`` looks for. Code blocks on ``SCRIPT_PAGES`` are
+highlighted, with their copy buttons, and their section blocks written out
+at build time (see ``cka_highlight`` and ``cka_blocks``); each section's
+content then moves to ``sections/<id>.html``, fetched when it is opened.
+Finally everything the pages reference gets a fingerprinted copy and the
+text files precompressed ones (see ``cka_publish``).
+Files whose content is unchanged are not rewritten.
+"""
+
+import os
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+PAGES = ('index.html', 'cka.html', 'cheat-sheet.html', 'lab.html')
+STATIC = ('style.css', 'script.js', 'robots.txt', 'sitemap.xml')
+SEARCH_PAGE = 'index.html'
+# Pages that load script.js.
+SCRIPT_PAGES = ('index.html',)
+SEARCH_DIR = 'search'
+SECTIONS_DIR = 'sections'
+
+
+def _write(path, data):
+    from cka_cache import write_if_changed
+
+    return write_if_changed(path, lambda f: f.write(data))
+
+
+def page_weight(images, extension):
+    """Return the bytes of the smallest ``extension`` variant of every image."""
+    total = 0
+    for directory, manifest in images.values():
+        smallest = min((width, name) for name, width in manifest['variants'] if name.endswith(extension))
+        total += os.path.getsize(os.path.join(directory, smallest[1]))
+    return total
+
+
+def write_search_index(page, dist):
+    """Write the search index of ``page`` under ``dist``; returns the linked page and counts."""
+    import hashlib
+
+    from cka_search import build_index, dump
+
+    manifest, shards = build_index(page)
+    changed = 0
+    size = 0
+    for name, shard in shards.items():
+        data = dump(shard)
+        size += len(data)
+        changed += _write(os.path.join(dist, SEARCH_DIR, name), data)
+    data = dump(manifest)
+    changed += _write(os.path.join(dist, SEARCH_DIR, 'manifest.json'), data)
+    version = hashlib.sha256(data).hexdigest()[:12]
+    meta = f'<meta name="cka-search-index" content="{SEARCH_DIR}/manifest.json?v={version}">\n'
+    page = page.replace('</head>', meta + '</head>', 1)
+    return page, changed, len(shards) + 1, {
+        'search_entries': len(manifest['entries']),
+        'search_manifest_bytes': len(data),
+        'search_shard_bytes': size,
+    }
+
+
+def build_site(dist, cache_dir=None, workers=None):
+    """Write the site to ``dist``; returns a dict of counts for reporting.
+
+    ``cache_dir`` holds the processed images (``.cka_cache`` by default).
+    ``workers`` caps the image-processing processes.
+    """
+    from cka_assets import copy_variants, optimise_assets, rewrite_images
+    from cka_blocks import prewrap_page, split_blocks
+    from cka_highlight import highlight_page, load_cache, save_cache
+    from cka_publish import fingerprint, precompress
+
+    if cache_dir is None:
+        cache_dir = os.path.join(ROOT, '.cka_cache')
+    images, cached = optimise_assets(os.path.join(ROOT, 'assets'), os.path.join(cache_dir, 'assets'),
+                                     workers)
+    changed = copy_variants(images, os.path.join(dist, 'assets'))
+    files = sum(len(manifest['variants']) for _, manifest in images.values())
+    for name in images:
+        with open(os.path.join(ROOT, 'assets', name), 'rb') as f:
+            changed += _write(os.path.join(dist, 'assets', name), f.read())
+    files += len(images)
+
+    highlight_cache = os.path.join(cache_dir, 'highlight.json')
+    load_cache(highlight_cache)
+    search = {}
+    pages = {}
+    full_bytes = shell_bytes = fragment_count = 0
+    for name in PAGES:
+        with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+            page = rewrite_images(f.read(), images)
+        if name in SCRIPT_PAGES:
+            page = prewrap_page(highlight_page(page))
+        if name == SEARCH_PAGE:
+            page, written, count, search = write_search_index(page, dist)
+            changed += written
+            files += count
+        if name in SCRIPT_PAGES:
+            full_bytes += len(page.encode('utf-8'))
+            page, fragments = split_blocks(page, SECTIONS_DIR + '/')
+            for fragment, content in fragments.items():
+                changed += _write(os.path.join(dist, SECTIONS_DIR, fragment), content.encode('utf-8'))
+            fragment_count += len(fragments)
+            shell_bytes += len(page.encode('utf-8'))
+        pages[name] = page
+    save_cache(highlight_cache)
+    for name in STATIC:
+        with open(os.path.join(ROOT, name), 'rb') as f:
+            changed += _write(os.path.join(dist, name), f.read())
+    files += len(PAGES) + len(STATIC) + fragment_count
+
+    pages, names, fingerprinted = fingerprint(dist, pages)
+    for name, page in pages.items():
+        changed += _write(os.path.join(dist, name), page.encode('utf-8'))
+    compressed, unchanged, brotli = precompress(dist, cache_dir, workers)
+
+    original = sum(os.path.getsize(os.path.join(ROOT, 'assets', name)) for name in images)
+    return {
+        'files': files,
+        'changed': changed,
+        'images': len(images),
+        'images_cached': cached,
+        'original_bytes': original,
+        'mobile_png_bytes': page_weight(images, '.png'),
+        'mobile_webp_bytes': page_weight(images, '.webp'),
+        'fragments': fragment_count,
+        'full_page_bytes': full_bytes,
+        'shell_bytes': shell_bytes,
+        'fingerprinted': len(names),
+        'fingerprinted_new': fingerprinted,
+        'compressed': compressed,
+        'compressed_unchanged': unchanged,
+        'brotli': brotli,
+        **search,
+    }
@@ -0,0 +1,112 @@
+"""Split builds: one document per CKA exam domain plus the combined sheet.
+
+Sections are grouped by domain (``cka_sections.DOMAINS``; the general
+reference sections form one more group) and each group is rendered to XML
+fragments in a process pool. The per-domain documents and the combined
+master are then assembled in the same pool from those fragments, so every
+section is rendered exactly once however many documents include it.
+
+Fragments are rendered without their trailing page break; assembly adds
+the breaks between sections, so a fragment fits anywhere in any document.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cka_sections
+from cka_cache import write_if_changed
+from cka_pool import InlineExecutor
+from generate_cka_doc import BaseTemplate, DocumentBuilder, title_page
+from cka_model import TableOfContents
+
+_template = None
+_cache_dir = None
+
+
+def _init_worker(template_data, cache_dir, diagrams):
+    global _template, _cache_dir
+    from cka_assets import remember_print_variants
+
+    _template = BaseTemplate(template_data)
+    _cache_dir = cache_dir
+    remember_print_variants(diagrams)
+
+
+def render_group(numbers):
+    """Render sections ``numbers`` and return ``{number: fragment}``."""
+    from cka_cache import FragmentCache
+
+    builder = DocumentBuilder(template=_template)
+    cache = FragmentCache(_cache_dir) if _cache_dir else None
+    fragments = {}
+    for number in numbers:
+        node = cka_sections.load(number).replace(page_break=False)
+        if cache is None:
+            fragments[number] = builder.render_fragment(node)
+        else:
+            fragments[number] = cache.fragment(builder, node)
+    return fragments
+
+
+def assemble(path, subtitle, numbers, fragments, compress_level=None):
+    """Write a document made of the title page, a TOC and ``fragments``."""
+    builder = DocumentBuilder(template=_template, compress_level=compress_level)
+    builder.render(title_page.replace(subtitle=subtitle))
+    builder.render(TableOfContents(cka_sections.toc_items(numbers)))
+    for i, fragment in enumerate(fragments):
+        if i:
+            builder.add_section_break()
+        builder.append_fragment(fragment)
+    return path, write_if_changed(path, builder.save)
+
+
+def domain_path(directory, key):
+    name = '_'.join(part.capitalize() for part in key.split('_'))
+    return os.path.join(directory, f'CKA_{name}_CheatSheet.docx')
+
+
+def build_split(master_path, directory=None, template=None, cache_dir=None, workers=None,
+                compress_level=None, diagram_cache_dir=None):
+    """Write the per-domain documents and the master.
+
+    Fragments are cached under ``cache_dir`` and diagram print variants
+    under ``diagram_cache_dir``, which defaults to ``cache_dir``. Returns
+    ``(path, changed)`` for each; unchanged files are not rewritten.
+    """
+    if directory is None:
+        directory = os.path.dirname(os.path.abspath(master_path))
+    if template is None:
+        template = BaseTemplate.default()
+    domain_sections = set()
+    for _, numbers in cka_sections.DOMAINS.values():
+        domain_sections.update(numbers)
+    groups = [numbers for _, numbers in cka_sections.DOMAINS.values()]
+    groups.append(tuple(n for n in cka_sections.REGISTRY if n not in domain_sections))
+
+    # Diagrams are resized once, here, rather than by every worker whose
+    # documents include them.
+    diagrams = DocumentBuilder.prepare_diagrams([cka_sections.load(n) for n in cka_sections.REGISTRY],
+                                                diagram_cache_dir or cache_dir)
+
+    if workers is None:
+        workers = min(len(groups), os.cpu_count() or 1)
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(template.data, cache_dir, diagrams))
+    else:
+        global _template, _cache_dir
+        _template, _cache_dir = template, cache_dir
+        pool = InlineExecutor()
+    with pool:
+        fragments = {}
+        for result in pool.map(render_group, groups):
+            fragments.update(result)
+
+        jobs = []
+        for key, (title, numbers) in cka_sections.DOMAINS.items():
+            jobs.append(pool.submit(assemble, domain_path(directory, key), f'{title} Cheat Sheet',
+                                    numbers, [fragments[n] for n in numbers], compress_level))
+        everything = list(cka_sections.REGISTRY)
+        jobs.append(pool.submit(assemble, master_path, title_page.subtitle,
+                                everything, [fragments[n] for n in everything], compress_level))
+        return [job.result() for job in jobs]
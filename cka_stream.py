@@ -0,0 +1,113 @@
+"""Write the cheat sheet as a .docx while it is being rendered.
+
+``DocumentBuilder.save()`` serialises the document only after the whole
+tree has been built in memory, so peak memory grows with document length.
+``write_streaming()`` instead renders one node at a time, writes its XML
+straight into the ``word/document.xml`` zip entry and drops it from the
+tree, so memory stays flat however many sections there are. The output is
+the same file, byte for byte, that ``save()`` would have written
+(``benchmarks/check_stream_identical.py`` checks this): members come in
+the same order, and ``word/document.xml`` is deflated in the same chunks.
+A stream that cannot seek, such as an HTTP response, also works: zip
+members are then followed by data descriptors, so the bytes differ, but
+the document is the same.
+"""
+
+import io
+
+
+def _inner_xml(container):
+    # Serialising blocks inside a wrapper that declares the document's
+    # namespaces keeps lxml from repeating every xmlns on each block.
+    from lxml import etree
+
+    data = etree.tostring(container, encoding='UTF-8')
+    return data[data.index(b'>') + 1:data.rindex(b'</')]
+
+
+def write_streaming(path_or_stream, nodes, builder=None, cache=None, diagram_cache_dir=None):
+    """Render ``nodes`` and write them to a .docx one node at a time.
+
+    ``builder`` (a fresh ``DocumentBuilder`` by default) supplies the styled
+    template and is used as scratch space; its body is emptied after every
+    node. With a ``cka_cache.FragmentCache`` unchanged sections are spliced
+    in from the cache, exactly as in ``build()``, which also describes
+    ``diagram_cache_dir``.
+    """
+    from lxml import etree
+
+    from cka_package import DEFAULT_LEVEL, ZipWriter, package_parts
+
+    if builder is None:
+        from generate_cka_doc import DocumentBuilder
+
+        builder = DocumentBuilder()
+    nodes = list(nodes)
+    builder.prepare_diagrams(nodes, diagram_cache_dir or getattr(cache, 'root', None))
+    document_part = builder.doc.part
+    document = document_part.element
+    body = document.body
+    for block in list(body)[:-1]:  # keep only the final sectPr
+        body.remove(block)
+
+    # Everything before and after the body content, as save() would write it.
+    envelope = etree.tostring(document, encoding='UTF-8', standalone=True)
+    split = envelope.index(b'<w:sectPr')
+    head, tail = envelope[:split], envelope[split:]
+
+    # The members before word/document.xml, [Content_Types].xml among them,
+    # have to be written before rendering. Rendering only adds the diagrams'
+    # images, so add those now, in the order rendering would have (which
+    # gives them the same relationship ids).
+    _add_images(builder, nodes)
+    document_name = document_part.partname.membername
+
+    level = DEFAULT_LEVEL if builder.compress_level is None else builder.compress_level
+    if hasattr(path_or_stream, 'write'):
+        out, close = path_or_stream, False
+    else:
+        out, close = open(path_or_stream, 'wb'), True
+    try:
+        writer = ZipWriter(out)
+        written = {}
+        for name, data in package_parts(document_part.package, exclude=(document_part,)):
+            if name == document_name:
+                break
+            writer.add(name, data, level)
+            written[name] = data
+        with writer.open(document_name, level) as entry:
+            entry.write(head)
+            for node in nodes:
+                if cache is None:
+                    builder.render(node)
+                else:
+                    cache.render(builder, node)
+                container = etree.Element(body.tag, nsmap=document.nsmap)
+                container.extend(list(body)[:-1])
+                if len(container):
+                    entry.write(_inner_xml(container))
+            entry.write(tail)
+
+        # The remaining parts are small; collecting them only now picks up
+        # changes made while rendering.
+        parts = package_parts(document_part.package, exclude=(document_part,))
+        for name, data in parts:
+            if name == document_name:
+                break
+            if written.get(name) != data:
+                raise RuntimeError(f'{name} changed while rendering; it was already written')
+        for name, data in parts:
+            writer.add(name, data, level)
+        writer.close()
+    finally:
+        if close:
+            out.close()
+
+
+def _add_images(builder, nodes):
+    from cka_assets import print_variant
+    from cka_model import walk
+
+    images = dict.fromkeys(n.image for node in nodes for n in walk(node) if n.kind == 'diagram')
+    for image in images:
+        builder.doc.part.get_or_add_image(io.BytesIO(print_variant(image)))
@@ -0,0 +1,229 @@
+"""Watch mode: rebuild on every save and live-reload an HTML preview.
+
+``watch()`` polls the modification times of the content sources. An edited
+section module (``cka_sections/sNN_*.py``) is reloaded on its own and the
+outputs are rebuilt; with the fragment cache only that section is rendered
+again, and outputs whose bytes did not change are not rewritten. Any other
+Python source (the builder, the renderers, the registry) cannot be reloaded
+safely, so the process restarts itself with the same arguments.
+
+The preview is served on localhost from memory: ``/`` is the HTML
+rendering of the sheet with a small script that listens on
+``/__events`` (server-sent events) and reloads the page when a rebuild
+changed it. The site's ``style.css`` and ``script.js`` are served from the
+repository, and editing them reloads the page too.
+"""
+
+import hashlib
+import importlib
+import os
+import sys
+import threading
+import time
+import traceback
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import cka_sections
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PREVIEW_PORT = 8001
+POLL_INTERVAL = 0.05
+KEEPALIVE = 15
+
+# Files that only affect the preview in the browser.
+ASSETS = ('style.css', 'script.js')
+
+_RELOAD_SCRIPT = '''<script>
+(function () {
+  var version = '%s';
+  var events = new EventSource('/__events');
+  events.onmessage = function (event) {
+    if (event.data !== version) location.reload();
+  };
+})();
+</script>
+'''
+
+
+def source_files():
+    """Return the files watched for changes."""
+    files = [os.path.join(ROOT, name) for name in os.listdir(ROOT) if name.endswith('.py')]
+    package = os.path.dirname(cka_sections.__file__)
+    files += [os.path.join(package, name) for name in os.listdir(package) if name.endswith('.py')]
+    files += [os.path.join(ROOT, name) for name in ASSETS]
+    return sorted(files)
+
+
+def snapshot(files):
+    """Return ``{path: (mtime_ns, size)}`` for the ``files`` that exist."""
+    state = {}
+    for path in files:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def section_number(path):
+    """Return the section defined in ``path``, or ``None`` if it is not a section module."""
+    if os.path.dirname(path) != os.path.dirname(cka_sections.__file__):
+        return None
+    name = os.path.splitext(os.path.basename(path))[0]
+    for number, (module, _) in cka_sections.REGISTRY.items():
+        if module == name:
+            return number
+    return None
+
+
+class Preview:
+    """The current preview page, and a way to wait for the next one."""
+
+    def __init__(self):
+        self.page = b''
+        self.version = ''
+        self._changed = threading.Condition()
+
+    def update(self, html, force=False):
+        """Publish ``html``; listeners reload if it differs (or with ``force``)."""
+        data = html.encode('utf-8')
+        version = hashlib.sha256(data).hexdigest()[:16]
+        if force:
+            version += f'.{time.monotonic_ns()}'
+        script = (_RELOAD_SCRIPT % version).encode('utf-8')
+        with self._changed:
+            if version == self.version:
+                return False
+            self.page = data.replace(b'</body>', script + b'</body>', 1)
+            self.version = version
+            self._changed.notify_all()
+        return True
+
+    def wait(self, version, timeout):
+        """Return the current version once it differs from ``version`` (or on timeout)."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+class _PreviewHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=ROOT, **kwargs)
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path in ('/', '/index.html'):
+            self._send_page()
+        elif path == '/__events':
+            self._send_events()
+        elif path.lstrip('/') in ASSETS or path.startswith('/assets/'):
+            super().do_GET()
+        else:
+            self.send_error(404)
+
+    def _send_page(self):
+        page = self.server.preview.page
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def _send_events(self):
+        preview = self.server.preview
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        version = None
+        try:
+            while True:
+                current = preview.wait(version, KEEPALIVE)
+                if current == version:
+                    self.wfile.write(b': keepalive\n\n')
+                else:
+                    self.wfile.write(f'data: {current}\n\n'.encode('ascii'))
+                    version = current
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def end_headers(self):
+        # The preview must never show a stale stylesheet or script.
+        if not self.path.startswith('/__'):
+            self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _restart():
+    print('Builder source changed; restarting...', flush=True)
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+
+def watch(output, targets, numbers=None, cache=None, template=None, stream=False, compress_level=None,
+          address=('127.0.0.1', DEFAULT_PREVIEW_PORT), diagram_cache_dir=None):
+    """Build ``targets`` now and again after every edit, serving a live preview.
+
+    Arguments are as for ``generate_cka_doc.build_targets()``; ``numbers``
+    selects sections (all by default). Without a ``cache`` fragments are
+    kept in memory. Runs until interrupted.
+    """
+    from cka_cache import MemoryFragmentCache
+    from generate_cka_doc import build_targets, render_target, sections_for
+
+    if cache is None:
+        cache = MemoryFragmentCache()
+    preview = Preview()
+    server = ThreadingHTTPServer(address, _PreviewHandler)
+    server.daemon_threads = True
+    server.preview = preview
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def rebuild(reason):
+        start = time.perf_counter()
+        sections = sections_for(numbers)
+        preview.update(render_target('html', sections).page())
+        shown = time.perf_counter()
+        results = build_targets(output, targets, sections, cache, template, stream, compress_level,
+                                diagram_cache_dir=diagram_cache_dir)
+        written = [os.path.basename(path) for path, changed in results if changed]
+        print(f'{reason}: preview in {(shown - start) * 1000:.0f} ms, outputs in '
+              f'{(time.perf_counter() - start) * 1000:.0f} ms '
+              f'({", ".join(written) or "all unchanged"})', flush=True)
+
+    files = source_files()
+    state = snapshot(files)
+    rebuild('Initial build')
+    host, port = server.server_address[:2]
+    print(f'Preview on http://{host}:{port}/ - watching {len(files)} files (Ctrl+C to stop)', flush=True)
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = snapshot(files)
+            if current == state:
+                continue
+            changed = [path for path in set(state) | set(current) if state.get(path) != current.get(path)]
+            state = current
+            if any(os.path.basename(path) in ASSETS for path in changed):
+                preview.update(render_target('html', sections_for(numbers)).page(), force=True)
+            sections = [section_number(path) for path in changed if path.endswith('.py')]
+            if None in sections:
+                _restart()
+            if not sections:
+                continue
+            try:
+                for number in sections:
+                    importlib.reload(cka_sections.module(number))
+                rebuild('Rebuilt section ' + ', '.join(map(str, sorted(sections))))
+            except Exception:
+                traceback.print_exc()
+                print('Build failed; fix the error and save again.', flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -44,8 +44,66 @@
     });
   }
 
+  // ── Section Fragments ─────────────────────────────────────────────
+  // The site build (cka_blocks.split_blocks) moves each section's content
+  // into its own file; the block keeps its heading and action bar and
+  // names the file in data-src. Content is fetched when a block is first
+  // opened, and the next block's is prefetched.
+  var fragments = {};
+
+  function fetchFragment(src) {
+    if (!fragments[src]) {
+      fragments[src] = fetch(src).then(function (r) {
+        if (!r.ok) throw new Error(r.status + ' ' + src);
+        return r.text();
+      });
+      fragments[src].catch(function () { delete fragments[src]; });
+    }
+    return fragments[src];
+  }
+
+  function prefetchBlock(block) {
+    if (block && block.dataset.src) fetchFragment(block.dataset.src).catch(function () { });
+  }
+
+  // Scripts inserted as HTML do not run; replace them with live copies.
+  function runScripts(root) {
+    root.querySelectorAll('script').forEach(function (old) {
+      var script = document.createElement('script');
+      Array.from(old.attributes).forEach(function (attr) { script.setAttribute(attr.name, attr.value); });
+      script.text = old.text;
+      old.replaceWith(script);
+    });
+  }
+
+  function loadBlock(block) {
+    if (!block || !block.dataset.src) return Promise.resolve(block);
+    if (!block.loading) {
+      block.loading = fetchFragment(block.dataset.src).then(function (html) {
+        var error = block.querySelector('.block-error');
+        if (error) error.remove();
+        var content = document.createElement('div');
+        content.innerHTML = html;
+        runScripts(content);
+        block.append.apply(block, Array.from(content.childNodes));
+        block.removeAttribute('data-src');
+        highlightCodeBlocks();
+        return block;
+      }, function (err) {
+        block.loading = null;
+        if (!block.querySelector('.block-error')) {
+          block.insertAdjacentHTML('beforeend', '<p class="block-error">This section could not be loaded. ' +
+            'Check your connection and open it again.</p>');
+        }
+        throw err;
+      });
+    }
+    return block.loading;
+  }
+
+  // Returns a promise that settles once the block's content is in place.
   function openBlock(block, skipScroll) {
-    if (!block) return;
+    if (!block) return Promise.resolve(block);
 
     // 1. Instantly hide ALL other blocks
     main.querySelectorAll('.content-block').forEach(function (b) {
@@ -65,6 +123,13 @@
     if (!skipScroll) {
       main.scrollTop = 0; // Reset scroll for cleaner jump
     }
+
+    // 4. Load the content, then fetch the next section ahead of time
+    return loadBlock(block).then(function (loaded) {
+      var next = block.nextElementSibling;
+      if (next && next.classList.contains('content-block')) prefetchBlock(next);
+      return loaded;
+    });
   }
 
   // ── Initialization & Event Listeners ──────────────────────────────
@@ -122,8 +187,11 @@
     }
 
     // 4. Generate Submenus & Attach Listeners
+    // The site build writes the .nav-item wrappers and submenus
+    // (cka_blocks.py); they are only built here for pages without them.
+    const prebuiltNav = !!nav.querySelector('.nav-item');
     const navMap = {};
-    document.querySelectorAll('h2[id^="section-"]').forEach(h2 => {
+    if (!prebuiltNav) document.querySelectorAll('h2[id^="section-"]').forEach(h2 => {
       const sectionId = h2.getAttribute('id');
       navMap[sectionId] = [];
 
@@ -140,8 +208,36 @@
       });
     });
 
+    // Submenu links, pre-rendered or built below, share one listener.
+    nav.addEventListener('click', function (e) {
+      const subLink = e.target.closest('.nav-sub-link');
+      if (!subLink) return;
+      e.preventDefault();
+      closeMobileNav();
+      e.stopPropagation(); // prevent bubbling to the document
+
+      // Highlight active sub-link
+      document.querySelectorAll('.nav-sub-link').forEach(el => el.classList.remove('active'));
+      subLink.classList.add('active');
+
+      // Ensure parent block is open, but DON'T scroll to top yet
+      const sectionLink = subLink.closest('.nav-item').querySelector('a[href^="#section-"]');
+      const block = sectionLink && document.getElementById('block-' + sectionLink.getAttribute('href').substring(1));
+
+      if (block) {
+        // true = skip scroll to top; scroll to the subsection once loaded,
+        // after a slight delay ensuring layout is stable
+        openBlock(block, true).then(() => {
+          setTimeout(() => {
+            const target = document.getElementById(subLink.getAttribute('href').substring(1));
+            smoothScrollTo(target);
+          }, 10);
+        }, () => { });
+      }
+    });
+
     // Loop through MAIN nav links to wrap + add listeners
-    nav.querySelectorAll('a[href^="#"]').forEach(link => {
+    nav.querySelectorAll('a[href^="#"]:not(.nav-sub-link)').forEach(link => {
       const href = link.getAttribute('href');
       if (href === '#') return;
       const id = href.substring(1);
@@ -162,9 +258,16 @@
         // Open Block
         var blockId = id === 'intro' ? 'block-intro' : 'block-' + id;
         var block = document.getElementById(blockId);
-        if (block) openBlock(block);
+        if (block) openBlock(block).catch(function () { });
       });
 
+      // Hovering a section link makes its content likely to be wanted.
+      if (id.startsWith('section-')) {
+        link.addEventListener('pointerenter', function () {
+          prefetchBlock(document.getElementById('block-' + id));
+        }, { once: true });
+      }
+
       // Submenu Generation (only for #section- links)
       if (id.startsWith('section-')) {
         if (link.parentNode.classList.contains('nav-item')) return; // already processed
@@ -182,30 +285,6 @@
             subLink.href = '#' + item.id;
             subLink.className = 'nav-sub-link';
             subLink.textContent = item.text;
-            subLink.addEventListener('click', (e) => {
-              e.preventDefault();
-              closeMobileNav();
-              e.stopPropagation(); // prevent bubbling to parent
-
-              // Highlight active sub-link
-              document.querySelectorAll('.nav-sub-link').forEach(el => el.classList.remove('active'));
-              subLink.classList.add('active');
-
-              // Ensure parent block is open, but DON'T scroll to top yet
-              const blockId = 'block-' + id;
-              const block = document.getElementById(blockId);
-
-              if (block) {
-                openBlock(block, true); // true = skip scroll to top
-
-                // Now scroll to the specific subsection
-                // Slight delay ensuring layout is stable
-                setTimeout(() => {
-                  const target = document.getElementById(item.id);
-                  smoothScrollTo(target);
-                }, 10);
-              }
-            });
             subMenu.appendChild(subLink);
           });
           wrapper.appendChild(subMenu);
@@ -233,8 +312,34 @@
   });
 
   // ── Syntax Highlighter for ALL Code Blocks ───────────────────────
+  // The site build pre-renders blocks (cka_highlight.py) and marks them
+  // with data-highlighted; only the rest are highlighted here.
+  const iconCopy = '<svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" data-view-component="true" fill="currentColor"><path d="M0 6.75C0 5.784.784 5 1.75 5h1.5a.75.75 0 0 1 0 1.5h-1.5a.25.25 0 0 0-.25.25v7.5c0 .138.112.25.25.25h7.5a.25.25 0 0 0 .25-.25v-1.5a.75.75 0 0 1 1.5 0v1.5A1.75 1.75 0 0 1 9.25 16h-7.5A1.75 1.75 0 0 1 0 14.25Z"></path><path d="M5 1.75C5 .784 5.784 0 6.75 0h7.5C15.216 0 16 .784 16 1.75v7.5A1.75 1.75 0 0 1 14.25 11h-7.5A1.75 1.75 0 0 1 5 9.25Zm1.75-.25a.25.25 0 0 0-.25.25v7.5c0 .138.112.25.25.25h7.5a.25.25 0 0 0 .25-.25v-7.5a.25.25 0 0 0-.25-.25Z"></path></svg>';
+  const iconCheck = '<svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" data-view-component="true" fill="currentColor"><path d="M13.78 4.22a.75.75 0 0 1 0 1.06l-7.25 7.25a.75.75 0 0 1-1.06 0L2.22 9.28a.751.751 0 0 1 .018-1.042.751.751 0 0 1 1.042-.018L6 10.94l6.72-6.72a.75.75 0 0 1 1.06 0Z"></path></svg>';
+
+  // One delegated handler serves every copy button, pre-rendered or not.
+  document.addEventListener('click', function (e) {
+    const copyBtn = e.target.closest && e.target.closest('pre .copy-btn');
+    if (!copyBtn) return;
+    const preBlock = copyBtn.closest('pre');
+    const codeEl = preBlock.querySelector('code');
+    const codeText = codeEl ? codeEl.innerText : preBlock.innerText;
+
+    navigator.clipboard.writeText(codeText).then(() => {
+      copyBtn.innerHTML = iconCheck;
+      copyBtn.classList.add('copied');
+      setTimeout(() => {
+        copyBtn.innerHTML = iconCopy;
+        copyBtn.classList.remove('copied');
+      }, 2000);
+    }).catch(err => {
+      console.error('Failed to copy!', err);
+    });
+  });
+
   function highlightCodeBlocks() {
-    document.querySelectorAll('pre').forEach(function (preBlock) {
+    document.querySelectorAll('pre:not([data-highlighted])').forEach(function (preBlock) {
+      preBlock.setAttribute('data-highlighted', '');
       // Check if already processed
       if (preBlock.querySelector('.copy-btn')) return;
 
@@ -243,34 +348,14 @@
         preBlock.style.position = 'relative';
       }
 
-      // 1. Create Copy Button
       // 1. Create Copy Button
       const copyBtn = document.createElement('button');
+      copyBtn.type = 'button';
       copyBtn.className = 'copy-btn';
-      // Clean SVG Icons
-      const iconCopy = '<svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" data-view-component="true" fill="currentColor"><path d="M0 6.75C0 5.784.784 5 1.75 5h1.5a.75.75 0 0 1 0 1.5h-1.5a.25.25 0 0 0-.25.25v7.5c0 .138.112.25.25.25h7.5a.25.25 0 0 0 .25-.25v-1.5a.75.75 0 0 1 1.5 0v1.5A1.75 1.75 0 0 1 9.25 16h-7.5A1.75 1.75 0 0 1 0 14.25Z"></path><path d="M5 1.75C5 .784 5.784 0 6.75 0h7.5C15.216 0 16 .784 16 1.75v7.5A1.75 1.75 0 0 1 14.25 11h-7.5A1.75 1.75 0 0 1 5 9.25Zm1.75-.25a.25.25 0 0 0-.25.25v7.5c0 .138.112.25.25.25h7.5a.25.25 0 0 0 .25-.25v-7.5a.25.25 0 0 0-.25-.25Z"></path></svg>';
-      const iconCheck = '<svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" data-view-component="true" fill="currentColor"><path d="M13.78 4.22a.75.75 0 0 1 0 1.06l-7.25 7.25a.75.75 0 0 1-1.06 0L2.22 9.28a.751.751 0 0 1 .018-1.042.751.751 0 0 1 1.042-.018L6 10.94l6.72-6.72a.75.75 0 0 1 1.06 0Z"></path></svg>';
-
       copyBtn.innerHTML = iconCopy;
       copyBtn.ariaLabel = 'Copy code to clipboard';
       copyBtn.title = 'Copy';
 
-      copyBtn.addEventListener('click', () => {
-        const codeEl = preBlock.querySelector('code');
-        const codeText = codeEl ? codeEl.innerText : preBlock.innerText;
-
-        navigator.clipboard.writeText(codeText).then(() => {
-          copyBtn.innerHTML = iconCheck;
-          copyBtn.classList.add('copied');
-          setTimeout(() => {
-            copyBtn.innerHTML = iconCopy;
-            copyBtn.classList.remove('copied');
-          }, 2000);
-        }).catch(err => {
-          console.error('Failed to copy!', err);
-        });
-      });
-
       // Append as FIRST child to ensure it sits on top-right correctly
       if (preBlock.firstChild) {
         preBlock.insertBefore(copyBtn, preBlock.firstChild);
@@ -302,15 +387,16 @@
     });
   }
 
+  // Delegated, so toggles in sections loaded later work too.
   function initSolutionToggles() {
-    document.querySelectorAll('.solution-toggle, .playground-toggle').forEach(function (btn) {
-      btn.addEventListener('click', function () {
-        var solution = this.nextElementSibling;
-        if (!solution) return;
-        var isOpen = solution.classList.toggle('is-open');
-        this.setAttribute('aria-expanded', isOpen);
-        this.textContent = isOpen ? 'Hide solution' : 'Show solution';
-      });
+    document.addEventListener('click', function (e) {
+      var btn = e.target.closest && e.target.closest('.solution-toggle, .playground-toggle');
+      if (!btn) return;
+      var solution = btn.nextElementSibling;
+      if (!solution) return;
+      var isOpen = solution.classList.toggle('is-open');
+      btn.setAttribute('aria-expanded', isOpen);
+      btn.textContent = isOpen ? 'Hide solution' : 'Show solution';
     });
   }
 
@@ -470,14 +556,21 @@
       if (completeBtn) completeBtn.classList.toggle('active', !!completedSections[sid]);
       if (bookmarkBtn) {
         bookmarkBtn.classList.toggle('active', !!bookmarks[sid]);
-        bookmarkBtn.innerHTML = (bookmarks[sid] ? '🔖' : '🔖') + ' ' + (bookmarks[sid] ? 'Bookmarked' : 'Bookmark');
+        const label = '🔖 ' + (bookmarks[sid] ? 'Bookmarked' : 'Bookmark');
+        if (bookmarkBtn.textContent !== label) bookmarkBtn.textContent = label;
       }
     }
 
+    // Bars are pre-rendered by the site build (cka_blocks.py); they are
+    // only injected here for pages without them.
     function injectSectionBars() {
       SECTIONS.forEach(sec => {
         const block = document.getElementById('block-' + sec.id);
-        if (!block || block.querySelector('.section-action-bar')) return;
+        if (!block) return;
+        if (block.querySelector('.section-action-bar')) {
+          updateSectionBar(sec.id);
+          return;
+        }
 
         // Estimate reading time
         const words = block.textContent.trim().split(/\s+/).length;
@@ -486,16 +579,14 @@
         const bar = document.createElement('div');
         bar.className = 'section-action-bar';
         bar.id = 'sab-' + sec.id;
+        bar.dataset.sid = sec.id;
         bar.innerHTML = `
               <span class="sab-label">Section</span>
-              <button class="sab-btn sab-complete" title="Mark as complete (C)">✅ Complete</button>
-              <button class="sab-btn sab-bookmark" title="Bookmark this section (B)">🔖 Bookmark</button>
-              <button class="sab-btn sab-notes" title="Open notes (N)">📝 Notes</button>
+              <button type="button" class="sab-btn sab-complete" title="Mark as complete (C)">✅ Complete</button>
+              <button type="button" class="sab-btn sab-bookmark" title="Bookmark this section (B)">🔖 Bookmark</button>
+              <button type="button" class="sab-btn sab-notes" title="Open notes (N)">📝 Notes</button>
               <span class="reading-time">~${minutes} min read</span>
             `;
-        bar.querySelector('.sab-complete').addEventListener('click', () => toggleComplete(sec.id));
-        bar.querySelector('.sab-bookmark').addEventListener('click', () => toggleBookmark(sec.id));
-        bar.querySelector('.sab-notes').addEventListener('click', () => openNotes(sec.id, sec.title));
 
         // Insert after the h2
         const h2 = block.querySelector('h2');
@@ -508,6 +599,19 @@
       });
     }
 
+    // Action bar buttons share one listener.
+    if (mainEl) mainEl.addEventListener('click', e => {
+      const btn = e.target.closest('.section-action-bar .sab-btn');
+      if (!btn) return;
+      const sid = btn.closest('.section-action-bar').dataset.sid;
+      if (btn.classList.contains('sab-complete')) toggleComplete(sid);
+      else if (btn.classList.contains('sab-bookmark')) toggleBookmark(sid);
+      else if (btn.classList.contains('sab-notes')) {
+        const sec = SECTIONS.find(s => s.id === sid);
+        openNotes(sid, sec ? sec.title : sid);
+      }
+    });
+
     function toggleBookmark(sid) {
       bookmarks[sid] = !bookmarks[sid];
       LS.set('bookmarks', bookmarks);
@@ -582,7 +686,9 @@
     const searchResults = document.getElementById('search-results');
     const searchBtn = document.getElementById('search-btn');
 
-    // Build search index
+    // Search index: prebuilt by the site build (cka_search.py) when the
+    // page links one, otherwise gathered from the DOM when search opens.
+    const searchIndexMeta = document.querySelector('meta[name="cka-search-index"]');
     let searchIndex = [];
     function buildSearchIndex() {
       searchIndex = [];
@@ -606,38 +712,125 @@
       });
     }
 
+    function linearSearch(q) {
+      if (!searchIndex.length) buildSearchIndex();
+      const ql = q.toLowerCase();
+      return searchIndex.filter(item =>
+        item.title.toLowerCase().includes(ql) || item.text.toLowerCase().includes(ql)
+      ).slice(0, 20);
+    }
+
+    // Prebuilt index: a manifest of sections and entries, plus one radix
+    // trie of tokens per leading character, each fetched when first needed.
+    let searchManifest = null;
+    const searchShards = {};
+    let searchSeq = 0;
+
+    function fetchJSON(url) {
+      return fetch(url).then(r => {
+        if (!r.ok) throw new Error(r.status + ' ' + url);
+        return r.json();
+      });
+    }
+
+    function loadSearchManifest() {
+      if (!searchManifest) {
+        const url = new URL(searchIndexMeta.content, location.href);
+        searchManifest = fetchJSON(url).then(m => { m.url = url; return m; });
+        searchManifest.catch(() => { searchManifest = null; });
+      }
+      return searchManifest;
+    }
+
+    function loadSearchShard(m, first) {
+      if (!searchShards[first]) {
+        searchShards[first] = fetchJSON(new URL(m.shards[first], m.url));
+        searchShards[first].catch(() => { delete searchShards[first]; });
+      }
+      return searchShards[first];
+    }
+
+    // Same normalisation as cka_search.tokens().
+    function searchTokens(s) {
+      return s.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+    }
+
+    function collectPostings(node, prefix, out) {
+      for (const key in node) {
+        if (key === '$') { if (!prefix) node[key].forEach(n => out.add(n)); }
+        else if (!prefix || key.startsWith(prefix)) collectPostings(node[key], '', out);
+        else if (prefix.startsWith(key)) collectPostings(node[key], prefix.slice(key.length), out);
+      }
+    }
+
+    // Entries containing every query token as a prefix; headings first.
+    function prebuiltSearch(q) {
+      const terms = Array.from(new Set(searchTokens(q)));
+      return loadSearchManifest().then(m => Promise.all(terms.map(t => {
+        if (!m.shards[t[0]]) return new Set();
+        return loadSearchShard(m, t[0]).then(trie => {
+          const found = new Set();
+          collectPostings(trie, t, found);
+          return found;
+        });
+      })).then(sets => {
+        if (!sets.length) return [];
+        const hits = Array.from(sets[0]).filter(n => sets.every(s => s.has(n)));
+        const isHeading = n => m.entries[n][0] === 'h' ? 0 : 1;
+        hits.sort((a, b) => isHeading(a) - isHeading(b) || a - b);
+        return hits.slice(0, 20).map(n => {
+          const [kind, section, title, text, id] = m.entries[n];
+          const [sid, sTitle] = m.sections[section];
+          const type = kind === 'h' ? 'heading' : kind === 'c' ? 'code' : 'text';
+          return { type, sid, sTitle, title: title || (type === 'code' ? sTitle + ' — code' : sTitle), text, id };
+        });
+      }));
+    }
+
     let searchSelIdx = -1;
 
-    function highlight(str, query) {
-      if (!query) return str;
-      const re = new RegExp(query.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'), 'gi');
-      return str.replace(re, m => '<mark>' + m + '</mark>');
+    function escapeHTML(str) {
+      return str.replace(/[&<>"]/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' })[c]);
+    }
+
+    function highlight(str, terms) {
+      terms = terms.filter(Boolean);
+      if (!terms.length) return escapeHTML(str);
+      const re = new RegExp('(' + terms.map(t => t.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|') + ')', 'gi');
+      return str.split(re).map((part, i) => i % 2 ? '<mark>' + escapeHTML(part) + '</mark>' : escapeHTML(part)).join('');
     }
 
     function doSearch(q) {
+      const seq = ++searchSeq;
       if (!q || q.length < 2) {
         searchResults.innerHTML = '<div id="search-empty">Type to search across all sections…</div>';
         searchSelIdx = -1;
         return;
       }
-      const ql = q.toLowerCase();
-      const hits = searchIndex.filter(item =>
-        item.title.toLowerCase().includes(ql) || item.text.toLowerCase().includes(ql)
-      ).slice(0, 20);
+      if (!searchIndexMeta) {
+        showSearchResults(q, linearSearch(q), [q]);
+        return;
+      }
+      prebuiltSearch(q).then(
+        hits => { if (seq === searchSeq) showSearchResults(q, hits, searchTokens(q)); },
+        () => { if (seq === searchSeq) showSearchResults(q, linearSearch(q), [q]); }
+      );
+    }
 
+    function showSearchResults(q, hits, terms) {
       if (hits.length === 0) {
-        searchResults.innerHTML = '<div id="search-empty">No results for "' + q + '"</div>';
+        searchResults.innerHTML = '<div id="search-empty">No results for "' + escapeHTML(q) + '"</div>';
         searchSelIdx = -1;
         return;
       }
 
       searchResults.innerHTML = hits.map((h, i) => {
         const snippetRaw = h.text.slice(0, 120) + (h.text.length > 120 ? '…' : '');
-        const titleH = highlight(h.title, q);
-        const snipH = highlight(snippetRaw, q);
+        const titleH = highlight(h.title, terms);
+        const snipH = highlight(snippetRaw, terms);
         const icon = h.type === 'code' ? '💻' : h.type === 'heading' ? '📌' : '📄';
         return `<div class="search-result-item" data-idx="${i}" data-sid="${h.sid}" data-id="${h.id || ''}">
-              <div class="res-title">${icon} ${titleH} <small style="font-weight:400;color:var(--text-muted)">— ${h.sTitle}</small></div>
+              <div class="res-title">${icon} ${titleH} <small style="font-weight:400;color:var(--text-muted)">— ${escapeHTML(h.sTitle)}</small></div>
               ${snipH ? '<div class="res-snippet">' + snipH + '</div>' : ''}
             </div>`;
       }).join('');
@@ -660,8 +853,9 @@
       const block = document.getElementById('block-' + hit.sid);
       if (block && window.openBlockGlobal) window.openBlockGlobal(block);
       if (hit.id) {
-        // Delay to allow block switch + layout reflow when landing in a different section
-        setTimeout(() => {
+        // Wait for the section's content, then delay to allow block switch
+        // + layout reflow when landing in a different section
+        loadBlock(block).then(() => setTimeout(() => {
           const target = document.getElementById(hit.id);
           if (target && mainEl) {
             const offset = 50;
@@ -671,12 +865,13 @@
             const y = Math.max(0, targetOffsetInContent - offset);
             mainEl.scrollTo({ top: y, behavior: 'smooth' });
           }
-        }, 150);
+        }, 150), () => { });
       }
     }
 
     function openSearch() {
-      buildSearchIndex();
+      if (searchIndexMeta) loadSearchManifest().catch(() => { });
+      else buildSearchIndex();
       searchOverlay.classList.add('open');
       if (searchInput) { searchInput.value = ''; searchInput.focus(); }
       searchResults.innerHTML = '<div id="search-empty">Type to search across all sections…</div>';